@@ -0,0 +1,4 @@
+"""ヘッドレス実行できる性能ベンチマーク
+
+    SDL_VIDEODRIVER=dummy python -m benchmarks -o result.json --baseline benchmarks/baseline.json
+"""
@@ -0,0 +1,78 @@
+"""ベンチマークの実行
+
+    python -m benchmarks [-o result.json] [--baseline benchmarks/baseline.json]
+                         [--threshold 0.25] [-k 名前の一部]
+
+--baseline を指定すると中央値を比較し、threshold を超えて遅くなった
+ものがあれば終了コード 1 で終わる。
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    MIN_SAMPLE_SECONDS,
+    compare,
+    format_seconds,
+    machine_metadata,
+    measure,
+)
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-o", "--output", help="結果を書き出す JSON ファイル")
+    parser.add_argument("--baseline", help=f"比較するベースライン（例: {DEFAULT_BASELINE_PATH}）")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="回帰とみなす中央値の増加率（既定: %(default)s）")
+    parser.add_argument("-k", "--filter", default="", help="名前にこの文字列を含むものだけ実行")
+    parser.add_argument("--min-time", type=float, default=MIN_SAMPLE_SECONDS,
+                        help="1 サンプルの最短計測時間（秒）")
+    args = parser.parse_args(argv)
+
+    # ウィンドウを開かずに描画系も計測する
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from benchmarks.cases import build_cases
+
+    results: dict[str, dict] = {}
+    for case in build_cases():
+        if args.filter not in case.name:
+            continue
+        stats = measure(case, args.min_time)
+        results[case.name] = stats
+        print(f"{case.name:<42}{format_seconds(stats['median']):>12}  (min {format_seconds(stats['min'])})")
+
+    report = {"metadata": machine_metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline.get("results", {}), args.threshold)
+    print()
+    print(f"Compared with {args.baseline} (threshold +{args.threshold:.0%})")
+    for row in rows:
+        mark = "REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<42}{format_seconds(row['baseline']):>12} -> "
+              f"{format_seconds(row['current']):>12}  x{row['ratio']:.2f}  {mark}")
+    regressions = [row["name"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""ベンチマーク対象の定義
+
+build_cases() が計測する Case の一覧を返す。描画系は
+SDL_VIDEODRIVER=dummy のダミー画面に描くので、ウィンドウなしで動く。
+"""
+
+from __future__ import annotations
+
+import os
+import random
+
+from benchmarks.harness import Case
+
+_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 盤面系ベンチマークの入力を固定する乱数シード
+_SEED = 20240601
+
+
+def _init_display():
+    """ダミー画面を用意し、描画先サーフェスを返す。"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+
+    from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def _partial_board(rng: random.Random):
+    """違反を含みうる、半分ほど埋まった盤面。"""
+    from src.model.board import Board
+    from src.constants import GRID_ROWS, GRID_COLS, MENU_COUNT
+
+    board = Board()
+    for r in range(GRID_ROWS):
+        for c in range(GRID_COLS):
+            if rng.random() < 0.6:
+                board.place(r, c, rng.randrange(MENU_COUNT))
+    return board
+
+
+def _scattered_board():
+    """各列に 1〜2 マスだけ置いた盤面。候補伝播で途中の行状態が最も多くなる形。"""
+    from src.model.board import Board
+
+    board = Board()
+    for r, c, menu_id in ((2, 0, 2), (2, 1, 0), (3, 3, 0), (4, 2, 3), (4, 4, 1)):
+        board.place(r, c, menu_id)
+    return board
+
+
+def _adversarial_board():
+    """書き換えが 9 マス必要で、途中の行状態が多くなる盤面（ヒント探索の最悪例として探索したもの）。"""
+    from src.model.board import Board
+    from src.constants import GRID_COLS
+
+    cells = (
+        1, 0, None, 0, None,
+        4, 4, 0, 0, 3,
+        None, 4, 0, 0, 4,
+        1, 1, None, 1, 3,
+        None, 0, 1, None, 3,
+    )
+    board = Board()
+    for i, menu_id in enumerate(cells):
+        if menu_id is not None:
+            board.place(i // GRID_COLS, i % GRID_COLS, menu_id)
+    return board
+
+
+def _uniform_board():
+    """全マスがからあげの盤面。書き換えが最も多く（20 マス）必要になる。"""
+    from src.model.board import Board
+    from src.constants import GRID_ROWS, GRID_COLS, MENU_KARAAGE
+
+    board = Board()
+    for r in range(GRID_ROWS):
+        for c in range(GRID_COLS):
+            board.place(r, c, MENU_KARAAGE)
+    return board
+
+
+def _model_cases() -> list[Case]:
+    from src.model.board import Board
+    from src.model.enumerator import random_solution
+    from src.model.propagation import _propagate_uncached
+    from src.model.rules import check_all, clear_check_all_memo
+    from src.model.scoring import calculate_score, clear_score_memo
+
+    rng = random.Random(_SEED)
+    solved = random_solution(rng)
+    partial = _partial_board(rng)
+    scattered = _scattered_board()
+    empty = Board()
+
+    # メモを毎回消して判定そのものを計測する
+    def check(board):
+        clear_check_all_memo()
+        return check_all(board)
+
+    def score(board, remaining, completed):
+        clear_check_all_memo()
+        clear_score_memo()
+        return calculate_score(board, remaining, completed)
+
+    return [
+        Case("board.copy", solved.copy),
+        Case("rules.check_all[full]", lambda: check(solved)),
+        Case("rules.check_all[partial]", lambda: check(partial)),
+        Case("rules.check_all[memo]", lambda: check_all(partial)),
+        Case("scoring.calculate_score[full]", lambda: score(solved, 90, True)),
+        Case("scoring.calculate_score[partial]", lambda: score(partial, 0, False)),
+        Case("scoring.calculate_score[memo]", lambda: calculate_score(partial, 0, False)),
+        Case("propagation.propagate[empty]", lambda: _propagate_uncached(empty)),
+        Case("propagation.propagate[partial]", lambda: _propagate_uncached(partial)),
+        Case("propagation.propagate[scattered]", lambda: _propagate_uncached(scattered)),
+    ]
+
+
+def _solver_cases() -> list[Case]:
+    from src.model import enumerator, propagation, rules, solver
+    from src.model.board import Board
+
+    def reset_pool():
+        solver._solution_pool = None
+        solver._solution_pool_loaded = False
+
+    def reset_enumerator():
+        enumerator._completions.cache_clear()
+        enumerator._transition.cache_clear()
+
+    def reset_cpsat():
+        solver._cpsat_model = None
+
+    # ヒントは既定の時間予算つき（1フレーム内での最悪遅延）と、予算なしの両方を測る
+    hint_boards = {
+        "empty": Board(),
+        "partial": _partial_board(random.Random(_SEED)),
+        "scattered": _scattered_board(),
+        "adversarial": _adversarial_board(),
+        "uniform": _uniform_board(),
+    }
+    unbounded = float("inf")
+
+    def reset_hint_caches():
+        # 起動直後の初回呼び出しと同じく、ヒントが触れる表とメモをすべて捨てる
+        propagation._column_costs.cache_clear()
+        propagation.clear_propagation_memo()
+        rules.line_tables.cache_clear()
+        rules.clear_check_all_memo()
+
+    cases = [
+        Case("solver.generate_solution[pool,cold]",
+             lambda: solver.generate_solution(method="pool"), setup=reset_pool),
+        Case("solver.generate_solution[pool,warm]",
+             lambda: solver.generate_solution(method="pool")),
+        Case("solver.generate_solution[exact,cold]",
+             lambda: solver.generate_solution(method="exact"), setup=reset_enumerator),
+        Case("solver.generate_solution[exact,warm]",
+             lambda: solver.generate_solution(method="exact")),
+    ]
+    for name, board in hint_boards.items():
+        cases.append(Case(f"solver.suggest_hint[{name}]", lambda b=board: solver.suggest_hint(b)))
+    cases += [
+        Case("solver.suggest_hint[adversarial,cold]",
+             lambda: solver.suggest_hint(hint_boards["adversarial"]), setup=reset_hint_caches),
+        Case("solver.suggest_hint[adversarial,unbounded]",
+             lambda: solver.suggest_hint(hint_boards["adversarial"], budget_ms=unbounded)),
+        Case("solver.suggest_hint[uniform,unbounded]",
+             lambda: solver.suggest_hint(hint_boards["uniform"], budget_ms=unbounded)),
+    ]
+    try:
+        import ortools  # noqa: F401
+    except ImportError:
+        return cases
+    cases += [
+        Case("solver.generate_solution[cpsat,cold]",
+             lambda: solver.generate_solution(method="cpsat"), setup=reset_cpsat, repeat=3),
+        Case("solver.generate_solution[cpsat,warm]",
+             lambda: solver.generate_solution(method="cpsat"), repeat=3),
+    ]
+    return cases
+
+
+def _load_all_assets():
+    """AssetManager を作り、config.json の全アセットとフォントを読み込む。"""
+    from src.asset_manager import AssetManager
+    from src.constants import UI_FONT_SIZES
+
+    assets = AssetManager(base_path=_BASE_PATH)
+    config = assets._config
+    for key in config.get("icons", {}):
+        assets.load_image(key)
+    for key in config.get("sounds", {}):
+        assets.load_sound(key)
+    for size in UI_FONT_SIZES:
+        assets.get_font(size)
+    return assets
+
+
+def _ui_cases() -> list[Case]:
+    surface = _init_display()
+
+    from src.asset_manager import AssetManager
+    from src.constants import UI_ICON_SIZES
+    from src.model.enumerator import random_solution
+    from src.model.scoring import calculate_score
+    from src.ui.grid import Grid, grid_hit_test
+    from src.ui.play_screen import PlayScreen
+    from src.ui.result_screen import ResultScreen
+
+    rng = random.Random(_SEED)
+    assets = AssetManager(base_path=_BASE_PATH)
+    assets.build_icon_atlas(UI_ICON_SIZES)
+    answer = random_solution(rng)
+    player = _partial_board(rng)
+
+    grid = Grid(assets)
+    # マウス移動 1 回分の判定をグリッド内外の 100 点で
+    probes = [(rng.randrange(surface.get_width()), rng.randrange(surface.get_height()))
+              for _ in range(100)]
+
+    play = PlayScreen(assets)
+    play.start()
+    for r in range(3):
+        for c in range(3):
+            value = player.get(r, c)
+            if value is not None:
+                play.board.place(r, c, value)
+
+    result = ResultScreen(assets)
+    assets.build_icon_atlas(result.icon_sizes())
+    score = calculate_score(player, 0, False)
+    result.set_result(player, answer, score)
+
+    def play_full():
+        play.invalidate()
+        play.draw(surface)
+
+    def result_full():
+        result.invalidate()
+        result.draw(surface)
+
+    return [
+        Case("assets.load_all[cold]", _load_all_assets),
+        Case("assets.build_icon_atlas", lambda: assets.build_icon_atlas(UI_ICON_SIZES)),
+        Case("ui.Grid.draw", lambda: grid.draw(surface, player)),
+        Case("ui.grid_hit_test[x100]", lambda: [grid_hit_test(pos) for pos in probes]),
+        Case("ui.PlayScreen.draw[full]", play_full),
+        Case("ui.PlayScreen.draw[idle]", lambda: play.draw(surface)),
+        Case("ui.ResultScreen.set_result", lambda: result.set_result(player, answer, score)),
+        Case("ui.ResultScreen.draw[full]", result_full),
+        Case("ui.ResultScreen.draw[idle]", lambda: result.draw(surface)),
+    ]
+
+
+def build_cases() -> list[Case]:
+    """計測するすべての Case。"""
+    return _model_cases() + _solver_cases() + _ui_cases()
@@ -0,0 +1,148 @@
+"""ベンチマークの計測・記録・比較"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Callable, Optional
+
+# 1 サンプルあたりの最短計測時間（秒）。これに達するまで呼び出し回数を増やす
+MIN_SAMPLE_SECONDS = 0.05
+# 既定のサンプル数
+DEFAULT_REPEAT = 5
+# 回帰とみなす中央値の増加率の既定値（0.25 = 25% 遅くなったら回帰）
+DEFAULT_THRESHOLD = 0.25
+
+_VERSIONED_PACKAGES = ("pygame-ce", "numpy", "ortools")
+
+
+@dataclass
+class Case:
+    """1 つのベンチマーク。
+
+    setup を指定すると、サンプルごとに setup() を呼んでから func を
+    1 回だけ計測する（キャッシュを捨てた cold 計測用）。
+    指定しなければ func を複数回呼んで 1 回あたりの時間を求める。
+    """
+
+    name: str
+    func: Callable[[], object]
+    setup: Optional[Callable[[], object]] = None
+    repeat: int = DEFAULT_REPEAT
+
+
+def measure(case: Case, min_sample_seconds: float = MIN_SAMPLE_SECONDS) -> dict:
+    """case を計測し、1 回あたりの秒数の統計を返す。"""
+    samples: list[float] = []
+    if case.setup is not None:
+        number = 1
+        for _ in range(case.repeat):
+            case.setup()
+            start = time.perf_counter()
+            case.func()
+            samples.append(time.perf_counter() - start)
+    else:
+        case.func()  # ウォームアップ
+        number = _calibrate(case.func, min_sample_seconds)
+        for _ in range(case.repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                case.func()
+            samples.append((time.perf_counter() - start) / number)
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": case.repeat,
+        "cold": case.setup is not None,
+    }
+
+
+def _calibrate(func: Callable[[], object], min_sample_seconds: float) -> int:
+    """1 サンプルが min_sample_seconds 以上になる呼び出し回数。"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_sample_seconds:
+            return number
+        number *= 2
+
+
+def machine_metadata() -> dict:
+    """結果の比較に必要な実行環境の情報。"""
+    versions = {}
+    for package in _VERSIONED_PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "packages": versions,
+        "git_commit": _git_commit(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[dict]:
+    """両方にあるベンチマークの中央値を比べる。
+
+    各要素は {"name", "baseline", "current", "ratio", "regression"}。
+    ratio = current / baseline で、1 + threshold を超えたら regression。
+    """
+    rows = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None or not base.get("median"):
+            continue
+        ratio = current["median"] / base["median"]
+        rows.append({
+            "name": name,
+            "baseline": base["median"],
+            "current": current["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + threshold,
+        })
+    return rows
+
+
+def format_seconds(seconds: float) -> str:
+    """秒数を µs / ms / s の読みやすい単位で表す。"""
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
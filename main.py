@@ -3,13 +3,15 @@
 import os
 import sys
 import pygame
-from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, UI_ICON_SIZES, UI_FONT_SIZES
 from src.game import GameManager, GameState
 from src.asset_manager import AssetManager
+from src.asset_cache import default_cache_dir
+from src.profiler import FrameProfiler, PROFILER_HOTKEY, PROFILE_OUT_ENV
 from src.ui.start_screen import StartScreen
-from src.ui.play_screen import PlayScreen
-from src.ui.result_screen import ResultScreen
-from src.model.scoring import calculate_score
+
+# ゲーム実行・結果画面と採点は、起動を速くするため初回フレーム描画後に読み込む
+# （_load_deferred_screens を参照）
 
 
 def _base_path() -> str:
@@ -19,6 +21,46 @@ def _base_path() -> str:
     return os.path.dirname(os.path.abspath(__file__))
 
 
+def _load_deferred_screens(assets: AssetManager, profiler: FrameProfiler, start_screen):
+    """ゲーム実行画面・結果画面と採点関数を読み込んで生成する。
+
+    結果画面のアイコンをアトラスに加え、各画面を計測対象にするところまで行う。
+    """
+    from src.ui.play_screen import PlayScreen
+    from src.ui.result_screen import ResultScreen
+    from src.model.rules import line_tables
+    from src.model.scoring import calculate_score
+
+    # 違反判定の表もここで作っておき、初回の採点で待たせない
+    line_tables()
+    play_screen, result_screen = PlayScreen(assets), ResultScreen(assets)
+    assets.build_icon_atlas(result_screen.icon_sizes())
+    _instrument_screens(profiler, start_screen, play_screen, result_screen)
+    return play_screen, result_screen, calculate_score
+
+
+def _instrument_screens(profiler: FrameProfiler, start_screen, play_screen, result_screen) -> None:
+    """各画面の描画サブステップを計測対象にする。"""
+    profiler.instrument(start_screen, ["_draw_all"], "start")
+    profiler.instrument(
+        play_screen,
+        [
+            "_get_static_layer",
+            "_draw_header",
+            "_draw_rules_panel",
+            "_draw_flash_highlights",
+            "_draw_footer",
+        ],
+        "play",
+    )
+    profiler.instrument(play_screen.grid, ["draw_static", "draw_cells"], "play.grid")
+    profiler.instrument(play_screen.palette, ["draw"], "play.palette")
+    profiler.instrument(play_screen.drag_drop, ["draw_dragging"], "play.drag_drop")
+    profiler.instrument(
+        result_screen, ["_build_static_layer", "_draw_header", "_draw_body", "_draw_all"], "result"
+    )
+
+
 def main():
     pygame.init()
     try:
@@ -36,82 +78,149 @@ def main():
         pygame.display.set_icon(icon)
     clock = pygame.time.Clock()
 
-    assets = AssetManager(base_path=base)
+    assets = AssetManager(base_path=base, cache_dir=default_cache_dir())
+    # 全画面で使うアイコンを全サイズ分まとめて用意し、描画中の拡大縮小をなくす
+    assets.build_icon_atlas(UI_ICON_SIZES)
     game = GameManager()
     start_screen = StartScreen(assets)
-    play_screen = PlayScreen(assets)
-    result_screen = ResultScreen(assets)
+    # 残りのアセットはスタート画面を表示している間に裏で読み込む
+    start_screen.set_preload(assets.preload(UI_FONT_SIZES))
+    play_screen = None
+    result_screen = None
+    calculate_score = None
 
     # 起動時にBGM再生開始
     assets.play_bgm("opening")
 
+    profiler = FrameProfiler.from_env()
+    last_overlay_rect = None  # 直前に描いたプロファイラ表示の領域
+
+    drawn_screen = None  # 直前に描画した画面
+    last_ticks = pygame.time.get_ticks()
     running = True
     while running:
-        dt_ms = clock.get_time()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                continue
-
-            if game.state == GameState.START:
-                if start_screen.handle_event(event):
-                    play_screen.start()
-                    game.go_to_playing()
-                    assets.play_bgm("playing")
-            elif game.state == GameState.PLAYING:
-                result = play_screen.handle_event(event)
-                if result in ("done", "timeout"):
-                    completed = result == "done"
+        events = pygame.event.get()
+        wait_ms = drawn_screen.idle_wait_ms() if drawn_screen is not None else None
+        if not events and wait_ms is not None:
+            # 描画に変化がない間は、イベントが来るか次の起床時刻まで眠る
+            event = pygame.event.wait(wait_ms)
+            if event.type != pygame.NOEVENT:
+                events = [event] + pygame.event.get()
+
+        profiler.begin_frame()
+
+        # 眠っていた時間もタイマーに反映する
+        now = pygame.time.get_ticks()
+        dt_ms = now - last_ticks
+        last_ticks = now
+
+        with profiler.section("events"):
+            for event in events:
+                if event.type == pygame.QUIT:
+                    running = False
+                    continue
+                if event.type == pygame.WINDOWEXPOSED and drawn_screen is not None:
+                    drawn_screen.invalidate()
+                if event.type == pygame.KEYDOWN and event.key == PROFILER_HOTKEY:
+                    profiler.toggle()
+                    if drawn_screen is not None:
+                        # オーバーレイを消す・出すために全体を描き直す
+                        drawn_screen.invalidate()
+                    continue
+
+                if game.state == GameState.START:
+                    if start_screen.handle_event(event):
+                        if play_screen is None:
+                            # 初回フレーム後の読み込みより先に押されたら、ここで読み込む
+                            play_screen, result_screen, calculate_score = _load_deferred_screens(
+                                assets, profiler, start_screen
+                            )
+                        play_screen.start()
+                        game.go_to_playing()
+                        assets.play_bgm("playing")
+                elif game.state == GameState.PLAYING:
+                    result = play_screen.handle_event(event)
+                    if result in ("done", "timeout"):
+                        completed = result == "done"
+                        score_result = calculate_score(
+                            play_screen.board,
+                            remaining_seconds=play_screen.timer.remaining_int,
+                            completed_by_button=completed,
+                        )
+                        result_screen.set_result(
+                            player_board=play_screen.board.copy(),
+                            answer_board=play_screen.answer,
+                            score_result=score_result,
+                            answer_future=play_screen.answer_future,
+                        )
+                        game.go_to_result()
+                        assets.play_bgm("ending")
+                    elif result == "back":
+                        game.go_to_start()
+                        assets.play_bgm("opening")
+                elif game.state == GameState.RESULT:
+                    result = result_screen.handle_event(event)
+                    if result == "back":
+                        game.go_to_start()
+                        assets.play_bgm("opening")
+
+        # --- 更新 ---
+        with profiler.section("update"):
+            if game.state == GameState.PLAYING:
+                result = play_screen.update(dt_ms)
+                if result == "timeout":
                     score_result = calculate_score(
                         play_screen.board,
-                        remaining_seconds=play_screen.timer.remaining_int,
-                        completed_by_button=completed,
+                        remaining_seconds=0,
+                        completed_by_button=False,
                     )
                     result_screen.set_result(
                         player_board=play_screen.board.copy(),
                         answer_board=play_screen.answer,
                         score_result=score_result,
+                        answer_future=play_screen.answer_future,
                     )
                     game.go_to_result()
                     assets.play_bgm("ending")
-                elif result == "back":
-                    game.go_to_start()
-                    assets.play_bgm("opening")
-            elif game.state == GameState.RESULT:
-                result = result_screen.handle_event(event)
-                if result == "back":
-                    game.go_to_start()
-                    assets.play_bgm("opening")
-
-        # --- 更新 ---
-        if game.state == GameState.PLAYING:
-            result = play_screen.update(dt_ms)
-            if result == "timeout":
-                score_result = calculate_score(
-                    play_screen.board,
-                    remaining_seconds=0,
-                    completed_by_button=False,
-                )
-                result_screen.set_result(
-                    player_board=play_screen.board.copy(),
-                    answer_board=play_screen.answer,
-                    score_result=score_result,
-                )
-                game.go_to_result()
-                assets.play_bgm("ending")
 
         # --- 描画 ---
         if game.state == GameState.START:
-            start_screen.draw(screen)
+            active_screen = start_screen
         elif game.state == GameState.PLAYING:
-            play_screen.draw(screen)
-        elif game.state == GameState.RESULT:
-            result_screen.draw(screen)
+            active_screen = play_screen
+        else:
+            active_screen = result_screen
+        if active_screen is not drawn_screen:
+            # 画面遷移時は全体を描き直す
+            active_screen.invalidate()
+            drawn_screen = active_screen
+
+        # 変化した領域だけを画面に反映する
+        with profiler.section("draw"):
+            dirty_rects = active_screen.draw(screen)
+        overlay_rect = profiler.draw_overlay(screen)
+        if overlay_rect is not None:
+            if last_overlay_rect is not None and not overlay_rect.contains(last_overlay_rect):
+                # 表が縮んだ分の跡は次フレームで描き直す
+                active_screen.invalidate()
+            dirty_rects.append(overlay_rect)
+            last_overlay_rect = overlay_rect
+        with profiler.section("display"):
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        profiler.end_frame()
+
+        if play_screen is None:
+            play_screen, result_screen, calculate_score = _load_deferred_screens(
+                assets, profiler, start_screen
+            )
 
-        pygame.display.flip()
         clock.tick(FPS)
 
+    trace_path = os.environ.get(PROFILE_OUT_ENV)
+    if trace_path and profiler.frame_count:
+        profiler.dump(trace_path)
+
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,180 @@
+"""変換済みアセットのディスクキャッシュ
+
+PNG のデコードや拡大縮小、WAV のデコードの結果を生のバイト列として
+キャッシュディレクトリに保存し、次回起動時はそれを読むだけで済ませる。
+
+各エントリは元ファイル（複数可）の更新時刻・サイズ・SHA-1 を記録し、
+更新時刻かサイズが変わっていれば内容のハッシュを比べ直して、
+変わっていれば無効とみなす。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+
+import pygame
+
+# キャッシュディレクトリを指定する環境変数（"off" で無効化）
+ASSET_CACHE_ENV = "MENU_CALENDAR_ASSET_CACHE"
+
+_MAGIC = b"MCAC1\n"
+_HEADER_LEN = struct.Struct("<I")
+
+
+def default_cache_dir() -> str | None:
+    """既定のキャッシュディレクトリ。環境変数で "off" が指定されたら None。
+
+    Windows は %LOCALAPPDATA%、それ以外は $XDG_CACHE_HOME（なければ ~/.cache）の下。
+    """
+    override = os.environ.get(ASSET_CACHE_ENV, "")
+    if override.lower() == "off":
+        return None
+    if override:
+        return override
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "menu-calendar", "assets")
+
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamp(path: str, sha1: str | None = None) -> dict:
+    st = os.stat(path)
+    return {
+        "path": os.path.abspath(path),
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "sha1": sha1 or _file_sha1(path),
+    }
+
+
+class AssetCache:
+    """元ファイルの変更で自動的に無効になるキー付きバイト列キャッシュ。
+
+    読み書きの失敗はすべて「キャッシュなし」として扱い、例外は出さない。
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, name: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(name.encode("utf-8")).hexdigest() + ".bin")
+
+    # --- バイト列 ---
+
+    def get(self, name: str, sources: list[str]) -> tuple[dict, bytes] | None:
+        """name のエントリを (meta, payload) で返す。ない・古いなら None。"""
+        entry = self._read(name)
+        if entry is None or not self._sources_valid(name, entry, sources):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry["meta"], entry["payload"]
+
+    def put(self, name: str, sources: list[str], meta: dict, payload: bytes) -> None:
+        """sources から作った payload を name で保存する。"""
+        try:
+            stamps = [_stamp(path) for path in sources]
+        except OSError:
+            return
+        self._write(name, stamps, meta, payload)
+
+    def _read(self, name: str) -> dict | None:
+        try:
+            with open(self._entry_path(name), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if not data.startswith(_MAGIC):
+            return None
+        offset = len(_MAGIC)
+        try:
+            (header_len,) = _HEADER_LEN.unpack_from(data, offset)
+            offset += _HEADER_LEN.size
+            header = json.loads(data[offset:offset + header_len])
+        except (struct.error, ValueError):
+            return None
+        if header.get("name") != name:
+            return None
+        header["payload"] = data[offset + header_len:]
+        return header
+
+    def _write(self, name: str, stamps: list[dict], meta: dict, payload: bytes) -> None:
+        header = json.dumps({"name": name, "sources": stamps, "meta": meta}).encode("utf-8")
+        path = self._entry_path(name)
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # 同じエントリを複数スレッド・プロセスが同時に書いても混ざらないよう一時ファイルは毎回別にする
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_MAGIC)
+                f.write(_HEADER_LEN.pack(len(header)))
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _sources_valid(self, name: str, entry: dict, sources: list[str]) -> bool:
+        stamps = entry.get("sources", [])
+        if [s.get("path") for s in stamps] != [os.path.abspath(p) for p in sources]:
+            return False
+        refreshed = False
+        for i, stamp in enumerate(stamps):
+            try:
+                st = os.stat(sources[i])
+            except OSError:
+                return False
+            if st.st_mtime_ns == stamp["mtime_ns"] and st.st_size == stamp["size"]:
+                continue
+            # 更新時刻だけ変わった（チェックアウト直後など）なら内容で判定する
+            if st.st_size != stamp["size"] or _file_sha1(sources[i]) != stamp["sha1"]:
+                return False
+            stamps[i] = _stamp(sources[i], stamp["sha1"])
+            refreshed = True
+        if refreshed:
+            self._write(name, stamps, entry["meta"], entry["payload"])
+        return True
+
+    # --- サーフェス ---
+
+    def load_surface(self, name: str, sources: list[str]) -> tuple[pygame.Surface, dict] | None:
+        """保存済みの RGBA 画素からサーフェスを復元する。(surface, meta) を返す。"""
+        entry = self.get(name, sources)
+        if entry is None:
+            return None
+        meta, payload = entry
+        try:
+            size = (meta["width"], meta["height"])
+            surf = pygame.image.frombuffer(payload, size, "RGBA")
+        except (KeyError, TypeError, ValueError, pygame.error):
+            return None
+        return surf, meta
+
+    def store_surface(
+        self, name: str, sources: list[str], surf: pygame.Surface, meta: dict | None = None
+    ) -> None:
+        """サーフェスの画素を RGBA のまま保存する。"""
+        width, height = surf.get_size()
+        full_meta = {**(meta or {}), "width": width, "height": height}
+        self.put(name, sources, full_meta, pygame.image.tobytes(surf, "RGBA"))
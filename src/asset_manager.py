@@ -1,24 +1,262 @@
 """アセット管理: config.json 読込、欠損時プレースホルダ"""
 
 from __future__ import annotations
+import io
 import json
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait as futures_wait
+from functools import partial
+from typing import Callable, Iterable
 
 import pygame
 
+from src.asset_cache import AssetCache
+from src.constants import BGM_TRANSITIONS
+
+# preload のワーカースレッド数
+PRELOAD_WORKERS = 4
+
+# BGM ファイルをメモリに保持する合計サイズの上限（バイト）。
+# 1曲でこれを超えるファイルは保持せず、ディスクからストリーミング再生する
+BGM_MEMORY_BUDGET = 8 * 1024 * 1024
+# 同じ設定キーで探す BGM の拡張子（先にあるものを優先）
+BGM_EXTENSIONS = (".ogg", ".wav")
+
+# テキスト描画キャッシュの既定上限（エントリ数）
+TEXT_CACHE_MAX_ENTRIES = 512
+
+
+class TextCache:
+    """font.render の結果を (font, text, color, antialias) ごとに保持する LRU キャッシュ。
+
+    返すサーフェスは共有されるため、呼び出し側で書き換えないこと。
+    """
+
+    def __init__(self, max_entries: int = TEXT_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, ...],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        """記録とカウンタを消す。"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """ヒット数・ミス数・現在のエントリ数。"""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class IconAtlas:
+    """アイコンを必要な全サイズで 1 枚のテクスチャに詰めたアトラス。
+
+    サイズごとに 1 段ずつ並べ、各アイコンはそのサブサーフェスとして返す。
+    構築時にまとめて拡大縮小するので、描画中の smoothscale はなくなる。
+    配置は keys と sizes だけで決まるので、保存したテクスチャから復元できる。
+    """
+
+    def __init__(self, surface: pygame.Surface, keys: Iterable[str], sizes: Iterable[int]) -> None:
+        self.surface = surface
+        self.keys = tuple(sorted(keys))
+        self.sizes = frozenset(sizes)
+        self._icons: dict[tuple[str, int], pygame.Surface] = {
+            (key, size): surface.subsurface(rect)
+            for (key, size), rect in self._layout(self.keys, self.sizes).items()
+        }
+
+    @staticmethod
+    def _layout(keys: tuple[str, ...], sizes: frozenset[int]) -> dict[tuple[str, int], pygame.Rect]:
+        rects = {}
+        y = 0
+        for size in sorted(sizes, reverse=True):
+            for i, key in enumerate(keys):
+                rects[(key, size)] = pygame.Rect(i * size, y, size, size)
+            y += size
+        return rects
+
+    @staticmethod
+    def texture_size(keys: Iterable[str], sizes: Iterable[int]) -> tuple[int, int]:
+        """アトラスのテクスチャの大きさ（空でも 1×1）。"""
+        n = len(tuple(keys))
+        sizes = tuple(sizes)
+        return max(n * max(sizes, default=0), 1), max(sum(sizes), 1)
+
+    @classmethod
+    def build(cls, sources: dict[str, pygame.Surface], sizes: Iterable[int]) -> IconAtlas:
+        """元画像を各サイズに縮小してアトラスを作る。"""
+        sizes = frozenset(sizes)
+        keys = tuple(sorted(sources))
+        atlas = pygame.Surface(cls.texture_size(keys, sizes), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        for (key, size), rect in cls._layout(keys, sizes).items():
+            scaled = pygame.transform.smoothscale(sources[key], (size, size))
+            # 透明な下地との合成で色が変わらないよう、画素をそのまま写す
+            atlas.blit(scaled, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        return cls(atlas, keys, sizes)
+
+    def get(self, key: str, size: int) -> pygame.Surface | None:
+        """key のアイコンを一辺 size で返す。アトラスにないなら None。"""
+        return self._icons.get((key, size))
+
+    def __contains__(self, item: tuple[str, int]) -> bool:
+        return item in self._icons
+
+
+class BgmCache:
+    """BGM ファイルの中身（圧縮されたまま）を合計サイズの上限付きで保持する LRU。
+
+    再生は pygame.mixer.music がストリーミングでデコードするので、
+    メモリに載るのはファイルの中身だけで、上限を超える分は古い曲から捨てる。
+    """
+
+    def __init__(self, budget: int = BGM_MEMORY_BUDGET) -> None:
+        self.budget = budget
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes) -> bool:
+        """保持する。1曲で上限を超えるなら保持せず False を返す。"""
+        if len(data) > self.budget:
+            return False
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.budget:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+
+class PreloadProgress:
+    """AssetManager.preload の進捗。
+
+    ワーカーはファイルの読み込みとデコードだけを行う。SDL・FreeType を使う
+    仕上げ（convert_alpha、Sound・Font の生成、辞書への登録）は、
+    メインスレッドが update() を呼んだときに、終わったタスクの分だけ行う。
+    """
+
+    def __init__(self, tasks: list[tuple[Future, Callable[[object], object] | None]]) -> None:
+        self._pending = tasks
+        self._total = len(tasks)
+        self._completed = 0
+
+    def update(self) -> int:
+        """読み込みの終わったタスクを仕上げ、仕上げた数を返す。メインスレッドから呼ぶこと。
+
+        ワーカーで例外になったタスクは仕上げず、後で使うときの通常の読み込みに任せる。
+        """
+        pending = []
+        finished = 0
+        for future, finish in self._pending:
+            if not future.done():
+                pending.append((future, finish))
+                continue
+            if finish is not None and future.exception() is None:
+                finish(future.result())
+            finished += 1
+        self._pending = pending
+        self._completed += finished
+        return finished
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    @property
+    def completed(self) -> int:
+        """仕上げまで終わったタスク数。"""
+        return self._completed
+
+    @property
+    def fraction(self) -> float:
+        """完了した割合 (0.0 - 1.0)。対象がなければ 1.0。"""
+        return self._completed / self._total if self._total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """読み込みの完了まで待って仕上げる。timeout 内に終われば True。メインスレッドから呼ぶこと。"""
+        _, not_done = futures_wait([future for future, _ in self._pending], timeout=timeout)
+        self.update()
+        return not not_done
+
 
 class AssetManager:
     """画像・音声・フォントの読み込みと管理。
 
     アセットが欠損してもゲームは継続する。
+
+    cache_dir を指定すると、デコード済みの画像・アイコンアトラス・効果音を
+    そこに保存し、次回以降の起動ではデコードせずに読み込む。
     """
 
-    def __init__(self, base_path: str = "", config_path: str = "assets/config.json") -> None:
+    def __init__(
+        self,
+        base_path: str = "",
+        config_path: str = "assets/config.json",
+        cache_dir: str | None = None,
+    ) -> None:
         self._base_path = base_path
+        self._cache = AssetCache(cache_dir) if cache_dir else None
         self._config: dict = {}
         self._images: dict[str, pygame.Surface | None] = {}
         self._sounds: dict[str, pygame.mixer.Sound | None] = {}
         self._font_cache: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._font_bytes: dict[str, bytes | None] = {}  # フォントファイルの中身（サイズ間で共有）
+        self._bgm_cache = BgmCache()  # 読み込み済みの BGM ファイルの中身
+        self._bgm_prefetcher: ThreadPoolExecutor | None = None
+        self.text_cache = TextCache()
+        self._icon_atlas: IconAtlas | None = None
         self._bgm_enabled: bool = True
         self._sfx_enabled: bool = True
         self._current_bgm: str | None = None
@@ -39,23 +277,90 @@ class AssetManager:
         except (FileNotFoundError, json.JSONDecodeError):
             self._config = {}
 
+    # --- 一括読み込み ---
+
+    def preload(
+        self, font_sizes: Iterable[int] = (), max_workers: int = PRELOAD_WORKERS
+    ) -> PreloadProgress:
+        """config.json の全アセットとフォントをスレッドプールで読み込み始める。
+
+        ワーカーではファイルの読み込みとアイコンのデコードだけを行い、BGM は
+        BGM_MEMORY_BUDGET の範囲でファイルの中身まで読み込む。描画と同時に
+        SDL・FreeType を触らないよう、サーフェスの変換や Sound・Font の生成は
+        メインスレッドで PreloadProgress.update() が行う。
+        すぐに戻るので、返り値の PreloadProgress で完了を確認すること。
+        """
+        mixer_format = pygame.mixer.get_init()
+        jobs: list[tuple[Callable[[], object], Callable[[object], object] | None]] = []
+        jobs += [
+            (partial(self._decode_image, key), partial(self._publish_image, key))
+            for key in self._config.get("icons", {})
+        ]
+        jobs += [
+            (partial(self._read_sound, key, mixer_format), partial(self._publish_sound, key))
+            for key in self._config.get("sounds", {})
+        ]
+        jobs += [(partial(self._read_bgm, key), None) for key in self._config.get("bgm", {})]
+        sizes = tuple(font_sizes)
+        if sizes:
+            jobs.append(
+                (partial(self._read_font_file, self._font_path()), lambda _: self._make_fonts(sizes))
+            )
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preload")
+        tasks = [(executor.submit(work), finish) for work, finish in jobs]
+        executor.shutdown(wait=False)
+        return PreloadProgress(tasks)
+
     # --- 画像 ---
 
     def load_image(self, key: str) -> pygame.Surface | None:
         if key in self._images:
             return self._images[key]
+        return self._publish_image(key, self._decode_image(key))
+
+    def _decode_image(self, key: str) -> pygame.Surface | None:
+        """アイコンのファイルをデコードする（convert_alpha 前）。ワーカーから呼んでよい。"""
         path = self._resolve(self._config.get("icons", {}).get(key, ""))
-        surf = None
-        if path and os.path.isfile(path):
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            return self._load_image_file(f"image:{key}", path)
+        except pygame.error:
+            return None
+
+    def _publish_image(self, key: str, surf: pygame.Surface | None) -> pygame.Surface | None:
+        """デコード済みのアイコンを画面の形式に変換して登録する。メインスレッド専用。"""
+        if key in self._images:
+            return self._images[key]
+        if surf is not None:
             try:
-                surf = pygame.image.load(path).convert_alpha()
+                surf = surf.convert_alpha()
             except pygame.error:
                 surf = None
         self._images[key] = surf
         return surf
 
+    def _load_image_file(self, cache_name: str, path: str) -> pygame.Surface:
+        """画像を読み込む。ディスクキャッシュがあればデコード済みの画素を使う。"""
+        if self._cache is not None:
+            cached = self._cache.load_surface(cache_name, [path])
+            if cached is not None:
+                return cached[0]
+        surf = pygame.image.load(path)
+        if self._cache is not None:
+            self._cache.store_surface(cache_name, [path], surf)
+        return surf
+
     def get_icon(self, key: str, size: tuple[int, int]) -> pygame.Surface | None:
-        """アイコン画像を指定サイズにスケーリングして返す。キャッシュ付き。"""
+        """アイコン画像を指定サイズにスケーリングして返す。キャッシュ付き。
+
+        アイコンアトラスにあるサイズはアトラスから返す。
+        """
+        atlas = self._icon_atlas
+        if atlas is not None and size[0] == size[1]:
+            icon = atlas.get(key, size[0])
+            if icon is not None:
+                return icon
         cache_key = (key, size)
         if cache_key in self._images:
             return self._images[cache_key]
@@ -67,21 +372,115 @@ class AssetManager:
         self._images[cache_key] = scaled
         return scaled
 
+    @property
+    def icon_atlas(self) -> IconAtlas | None:
+        return self._icon_atlas
+
+    def build_icon_atlas(self, sizes: Iterable[int]) -> IconAtlas:
+        """config.json の全アイコンを sizes の各サイズで詰めたアトラスを作る。
+
+        既存のアトラスにあるサイズも引き継ぐので、画面ごとに追加してよい。
+        読み込めないアイコンは含めない（get_icon は従来どおり None を返す）。
+        """
+        all_sizes = set(sizes)
+        if self._icon_atlas is not None:
+            all_sizes |= self._icon_atlas.sizes
+        paths = {}
+        for key, relative in self._config.get("icons", {}).items():
+            path = self._resolve(relative)
+            if path and os.path.isfile(path):
+                paths[key] = path
+        cache_name = f"atlas:{sorted(paths)}:{sorted(all_sizes)}"
+        source_paths = [paths[key] for key in sorted(paths)]
+
+        atlas = None
+        if self._cache is not None:
+            cached = self._cache.load_surface(cache_name, source_paths)
+            if cached is not None:
+                surf, meta = cached
+                try:
+                    if pygame.display.get_surface() is not None:
+                        surf = surf.convert_alpha()
+                    atlas = IconAtlas(surf, meta["keys"], all_sizes)
+                except (KeyError, ValueError, pygame.error):
+                    atlas = None
+        if atlas is None:
+            sources = {}
+            for key in paths:
+                surf = self.load_image(key)
+                if surf is not None:
+                    sources[key] = surf
+            atlas = IconAtlas.build(sources, all_sizes)
+            if self._cache is not None:
+                self._cache.store_surface(
+                    cache_name, source_paths, atlas.surface, {"keys": list(atlas.keys)}
+                )
+        self._icon_atlas = atlas
+        return atlas
+
     # --- 音声 ---
 
     def load_sound(self, key: str) -> pygame.mixer.Sound | None:
         if key in self._sounds:
             return self._sounds[key]
+        return self._publish_sound(key, self._read_sound(key, pygame.mixer.get_init()))
+
+    def _sound_path(self, key: str) -> str | None:
         path = self._resolve(self._config.get("sounds", {}).get(key, ""))
+        return path if path and os.path.isfile(path) else None
+
+    @staticmethod
+    def _sound_cache_name(key: str, mixer_format: tuple | None) -> str:
+        # PCM はミキサーの形式に依存するので、形式ごとに別エントリにする
+        return f"sound:{key}:{mixer_format}"
+
+    def _read_sound(self, key: str, mixer_format: tuple | None) -> tuple[str, bytes] | None:
+        """効果音のデータを読む。ワーカーから呼んでよい。
+
+        ディスクキャッシュにデコード済みの PCM があれば ("pcm", PCM)、
+        なければ ("file", ファイルの中身) を返す。
+        """
+        path = self._sound_path(key)
+        if path is None:
+            return None
+        if self._cache is not None:
+            cached = self._cache.get(self._sound_cache_name(key, mixer_format), [path])
+            if cached is not None:
+                return "pcm", cached[1]
+        try:
+            with open(path, "rb") as f:
+                return "file", f.read()
+        except OSError:
+            return None
+
+    def _publish_sound(
+        self, key: str, data: tuple[str, bytes] | None
+    ) -> pygame.mixer.Sound | None:
+        """読み込んだデータから Sound を作って登録する。メインスレッド専用。"""
+        if key in self._sounds:
+            return self._sounds[key]
         sound = None
-        if path and os.path.isfile(path):
+        if data is not None:
+            kind, payload = data
             try:
-                sound = pygame.mixer.Sound(path)
+                if kind == "pcm":
+                    sound = pygame.mixer.Sound(buffer=payload)
+                else:
+                    sound = pygame.mixer.Sound(file=io.BytesIO(payload))
+                    self._store_sound_pcm(key, sound)
             except pygame.error:
                 sound = None
         self._sounds[key] = sound
         return sound
 
+    def _store_sound_pcm(self, key: str, sound: pygame.mixer.Sound) -> None:
+        """デコードした PCM をディスクキャッシュに保存する。"""
+        path = self._sound_path(key)
+        if self._cache is None or path is None:
+            return
+        cache_name = self._sound_cache_name(key, pygame.mixer.get_init())
+        self._cache.put(cache_name, [path], {}, sound.get_raw())
+
     def play_sound(self, key: str) -> None:
         if not self._sfx_enabled:
             return
@@ -91,16 +490,61 @@ class AssetManager:
 
     # --- BGM ---
 
+    def _bgm_path(self, key: str) -> str | None:
+        """BGM のファイルパス。同名で BGM_EXTENSIONS の別形式があればそちらを優先する。"""
+        path = self._resolve(self._config.get("bgm", {}).get(key, ""))
+        if not path:
+            return None
+        stem = os.path.splitext(path)[0]
+        for ext in BGM_EXTENSIONS:
+            if os.path.isfile(stem + ext):
+                return stem + ext
+        return path if os.path.isfile(path) else None
+
+    def _read_bgm(self, key: str) -> bytes | None:
+        """BGM ファイルの中身を読み込んで保持する。上限を超える曲は読まない。"""
+        path = self._bgm_path(key)
+        if path is None:
+            return None
+        data = self._bgm_cache.get(key)
+        if data is not None:
+            return data
+        try:
+            if os.path.getsize(path) > self._bgm_cache.budget:
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._bgm_cache.put(key, data)
+        return data
+
+    def _prefetch_bgm(self, key: str) -> None:
+        """次に流れる曲をバックグラウンドで読み込んでおく。"""
+        if key not in self._config.get("bgm", {}) or key in self._bgm_cache:
+            return
+        if self._bgm_prefetcher is None:
+            self._bgm_prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bgm")
+        self._bgm_prefetcher.submit(self._read_bgm, key)
+
     def play_bgm(self, key: str) -> None:
-        """BGMをループ再生する。同じ曲なら再読み込みしない。"""
+        """BGMをループ再生する。同じ曲なら再読み込みしない。
+
+        読み込み済みならメモリ上の中身から再生し、ディスクは読まない。
+        再生を始めたら、BGM_TRANSITIONS で次に流れる曲を先読みする。
+        """
         if key == self._current_bgm:
             return
         self._current_bgm = key
-        path = self._resolve(self._config.get("bgm", {}).get(key, ""))
-        if not path or not os.path.isfile(path):
+        path = self._bgm_path(key)
+        if path is None:
             return
         try:
-            pygame.mixer.music.load(path)
+            data = self._bgm_cache.get(key)
+            if data is not None:
+                pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(path)[1].lstrip("."))
+            else:
+                pygame.mixer.music.load(path)
             if self._bgm_enabled:
                 pygame.mixer.music.play(-1)
             else:
@@ -108,6 +552,9 @@ class AssetManager:
                 pygame.mixer.music.pause()
         except pygame.error:
             pass
+        next_key = BGM_TRANSITIONS.get(key)
+        if next_key is not None:
+            self._prefetch_bgm(next_key)
 
     def stop_bgm(self) -> None:
         self._current_bgm = None
@@ -139,18 +586,51 @@ class AssetManager:
 
     # --- フォント ---
 
+    def _font_path(self) -> str:
+        return self._resolve(self._config.get("fonts", {}).get("main", ""))
+
     def get_font(self, size: int) -> pygame.font.Font:
-        font_path = self._resolve(self._config.get("fonts", {}).get("main", ""))
+        """フォントを返す。FreeType を使うのでメインスレッドから呼ぶこと。"""
+        font_path = self._font_path()
         cache_key = (font_path, size)
         if cache_key in self._font_cache:
             return self._font_cache[cache_key]
         font = None
-        if font_path and os.path.isfile(font_path):
+        data = self._read_font_file(font_path)
+        if data is not None:
             try:
-                font = pygame.font.Font(font_path, size)
+                font = pygame.font.Font(io.BytesIO(data), size)
             except pygame.error:
                 font = None
         if font is None:
             font = pygame.font.SysFont("meiryoui", size)
         self._font_cache[cache_key] = font
         return font
+
+    def _make_fonts(self, sizes: Iterable[int]) -> None:
+        """sizes の各サイズのフォントを作っておく。"""
+        for size in sizes:
+            self.get_font(size)
+
+    def _read_font_file(self, font_path: str) -> bytes | None:
+        """フォントファイルを一度だけ読み、全サイズで使い回す。ワーカーから呼んでよい。"""
+        if font_path not in self._font_bytes:
+            data = None
+            if font_path and os.path.isfile(font_path):
+                try:
+                    with open(font_path, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    data = None
+            self._font_bytes[font_path] = data
+        return self._font_bytes[font_path]
+
+    def render_text(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, ...],
+        antialias: bool = True,
+    ) -> pygame.Surface:
+        """テキストを描画したサーフェスを返す（LRU キャッシュ付き）。"""
+        return self.text_cache.render(font, text, color, antialias)
@@ -4,6 +4,10 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+# アイドル時（描画に変化がない間）にイベントを待つ最長時間 (ms)。1Hz で起床する
+IDLE_MAX_WAIT_MS = 1000
+# ヒント1回の計算に使ってよい最長時間 (ms)。1フレーム (約16.7ms) に収まるよう小さく取る
+HINT_BUDGET_MS = 4
 TITLE = "献立表カレンダー作成ゲーム"
 
 # --- グリッド ---
@@ -103,6 +107,27 @@ MENU_ICON_KEYS = {
     MENU_CHIRASHI: "chirashi",
 }
 
+# --- アイコンサイズ（正方形の一辺 px） ---
+ICON_SIZE_GRID = 56  # グリッドのセル
+ICON_SIZE_DRAG = 44  # ドラッグ中のゴースト
+ICON_SIZE_PALETTE = 32  # パレット
+ICON_SIZE_START = 28  # スタート画面のメニュー紹介
+ICON_SIZE_MINI_MIN = 24  # 結果画面ミニグリッドの下限（実寸はセルサイズの半分）
+
+# 起動時にアイコンアトラスへ詰めるサイズ（ミニグリッド用は ResultScreen.icon_sizes）
+UI_ICON_SIZES = (ICON_SIZE_GRID, ICON_SIZE_DRAG, ICON_SIZE_PALETTE, ICON_SIZE_START)
+
+# --- BGM ---
+# 各 BGM の次に流れる曲（画面遷移の順）。再生中に次の曲を先読みする
+BGM_TRANSITIONS = {
+    "opening": "playing",
+    "playing": "ending",
+    "ending": "opening",
+}
+
+# UI で使うフォントサイズ（起動時にまとめて読み込む）
+UI_FONT_SIZES = (9, 11, 12, 13, 14, 15, 16, 18, 20, 24, 26, 28, 36, 40)
+
 # メニュー絵文字
 MENU_EMOJI = {
     MENU_KARAAGE: "\U0001f357",  # 🍗
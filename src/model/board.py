@@ -1,72 +1,199 @@
 """5×5 盤面クラス"""
 
 from __future__ import annotations
-import copy
-from src.constants import GRID_ROWS, GRID_COLS
+
+import random
+from typing import Callable
+
+from src.constants import GRID_ROWS, GRID_COLS, MENU_COUNT
+
+# セル数
+CELL_COUNT = GRID_ROWS * GRID_COLS
+
+# 空欄を表す値（メニューIDと衝突しない値）。to_bytes() の空欄もこの値
+EMPTY_BYTE = 0xFF
+
+# Zobrist ハッシュの乱数表 _ZOBRIST[idx * MENU_COUNT + menu_id]（実行ごとに同じ値）
+_ZOBRIST_SEED = 0x4D454E55
+_zobrist_rng = random.Random(_ZOBRIST_SEED)
+_ZOBRIST: tuple[int, ...] = tuple(
+    _zobrist_rng.getrandbits(64) for _ in range(CELL_COUNT * MENU_COUNT)
+)
+del _zobrist_rng
 
 
 class Board:
     """5日×5ブロックの献立配置盤面。
 
     セルの値は メニューID (0-4) または None (空欄)。
+
+    内部表現は 25 セルの bytearray（行優先）と、行・列ごとの
+    メニュー出現数テーブル。コピーはバッファ複製のみで済み、
+    空マス数は配置数カウンタから O(1) で求まる。
+
+    zobrist_hash は配置済みセルの (位置, メニュー) ごとの乱数の XOR で、
+    セルの書き換えごとに差分更新される。空の盤面は 0。
+
+    add_listener で登録したコールバックは、セル値が変化するたびに
+    (row, col) を引数に呼ばれる。
     """
 
+    __slots__ = ("_cells", "_row_counts", "_col_counts", "_filled", "_hash", "_listeners")
+
     def __init__(self) -> None:
-        self._grid: list[list[int | None]] = [
-            [None] * GRID_COLS for _ in range(GRID_ROWS)
-        ]
+        self._cells = bytearray([EMPTY_BYTE]) * CELL_COUNT
+        # _row_counts[r * MENU_COUNT + m]: 行 r におけるメニュー m の個数
+        self._row_counts = bytearray(GRID_ROWS * MENU_COUNT)
+        # _col_counts[c * MENU_COUNT + m]: 列 c におけるメニュー m の個数
+        self._col_counts = bytearray(GRID_COLS * MENU_COUNT)
+        self._filled = 0
+        self._hash = 0
+        self._listeners: list[Callable[[int, int], None]] = []
 
     # --- 参照 ---
 
     def get(self, row: int, col: int) -> int | None:
         """指定セルのメニューIDを返す。空なら None。"""
-        return self._grid[row][col]
+        self._validate_pos(row, col)
+        value = self._cells[row * GRID_COLS + col]
+        return None if value == EMPTY_BYTE else value
 
     @property
     def grid(self) -> list[list[int | None]]:
         """盤面の読み取り専用コピー。"""
-        return copy.deepcopy(self._grid)
+        cells = [None if v == EMPTY_BYTE else v for v in self._cells]
+        return [cells[r * GRID_COLS:(r + 1) * GRID_COLS] for r in range(GRID_ROWS)]
+
+    def row_count(self, row: int, menu_id: int) -> int:
+        """行 row に置かれたメニュー menu_id の個数。"""
+        return self._row_counts[row * MENU_COUNT + menu_id]
+
+    def col_count(self, col: int, menu_id: int) -> int:
+        """列 col に置かれたメニュー menu_id の個数。"""
+        return self._col_counts[col * MENU_COUNT + menu_id]
+
+    def row_mask(self, row: int) -> int:
+        """行 row に出現するメニューのビットマスク（bit m = メニュー m）。"""
+        base = row * MENU_COUNT
+        counts = self._row_counts
+        return sum(1 << m for m in range(MENU_COUNT) if counts[base + m])
+
+    def col_mask(self, col: int) -> int:
+        """列 col に出現するメニューのビットマスク（bit m = メニュー m）。"""
+        base = col * MENU_COUNT
+        counts = self._col_counts
+        return sum(1 << m for m in range(MENU_COUNT) if counts[base + m])
+
+    @property
+    def zobrist_hash(self) -> int:
+        """盤面内容の 64 ビット Zobrist ハッシュ。同じ配置なら同じ値。"""
+        return self._hash
 
     # --- 操作 ---
 
     def place(self, row: int, col: int, menu_id: int) -> None:
         """セルにメニューを配置（上書き可）。"""
         self._validate_pos(row, col)
-        self._grid[row][col] = menu_id
+        self._validate_menu(menu_id)
+        self._set(row, col, menu_id)
 
     def remove(self, row: int, col: int) -> None:
         """セルを空にする。"""
         self._validate_pos(row, col)
-        self._grid[row][col] = None
+        self._set(row, col, EMPTY_BYTE)
 
     def move(self, src_row: int, src_col: int, dst_row: int, dst_col: int) -> None:
         """セルからセルへ移動（元は空になる）。"""
         value = self.get(src_row, src_col)
         if value is None:
             return
-        self._grid[dst_row][dst_col] = value
-        self._grid[src_row][src_col] = None
+        self._validate_pos(dst_row, dst_col)
+        self._set(dst_row, dst_col, value)
+        self._set(src_row, src_col, EMPTY_BYTE)
 
     def reset(self) -> None:
         """盤面を全て空にする。"""
-        self._grid = [[None] * GRID_COLS for _ in range(GRID_ROWS)]
+        if self._listeners:
+            # 購読者へセル単位で通知する
+            for idx in range(CELL_COUNT):
+                self._set(idx // GRID_COLS, idx % GRID_COLS, EMPTY_BYTE)
+            return
+        self._cells[:] = bytearray([EMPTY_BYTE]) * CELL_COUNT
+        self._row_counts[:] = bytes(len(self._row_counts))
+        self._col_counts[:] = bytes(len(self._col_counts))
+        self._filled = 0
+        self._hash = 0
 
     def copy(self) -> Board:
-        """盤面のディープコピーを返す。"""
-        new_board = Board()
-        new_board._grid = copy.deepcopy(self._grid)
+        """盤面の独立したコピーを返す。"""
+        new_board = Board.__new__(Board)
+        new_board._cells = self._cells[:]
+        new_board._row_counts = self._row_counts[:]
+        new_board._col_counts = self._col_counts[:]
+        new_board._filled = self._filled
+        new_board._hash = self._hash
+        new_board._listeners = []
         return new_board
 
+    def to_bytes(self) -> bytes:
+        """セル値を行優先 25 バイトで返す。空欄は EMPTY_BYTE（int8 では -1）。"""
+        return bytes(self._cells)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Board:
+        """to_bytes の出力から盤面を復元する。"""
+        if len(data) != CELL_COUNT:
+            raise ValueError(f"Expected {CELL_COUNT} bytes, got {len(data)}")
+        board = cls()
+        for idx, value in enumerate(data):
+            if value != EMPTY_BYTE:
+                board.place(idx // GRID_COLS, idx % GRID_COLS, value)
+        return board
+
+    # --- 変更通知 ---
+
+    def add_listener(self, callback: Callable[[int, int], None]) -> None:
+        """セル変更時に callback(row, col) を呼ぶよう登録する。"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[int, int], None]) -> None:
+        """登録済みのコールバックを解除する。"""
+        self._listeners.remove(callback)
+
     # --- ユーティリティ ---
 
     def empty_count(self) -> int:
         """空マスの数を返す。"""
-        return sum(1 for r in self._grid for c in r if c is None)
+        return CELL_COUNT - self._filled
 
     def is_full(self) -> bool:
         """全マスが埋まっているか。"""
-        return self.empty_count() == 0
+        return self._filled == CELL_COUNT
+
+    def _set(self, row: int, col: int, value: int) -> None:
+        """セル値を書き換え、出現数テーブルを差分更新する。"""
+        idx = row * GRID_COLS + col
+        old = self._cells[idx]
+        if old == value:
+            return
+        if old != EMPTY_BYTE:
+            self._row_counts[row * MENU_COUNT + old] -= 1
+            self._col_counts[col * MENU_COUNT + old] -= 1
+            self._filled -= 1
+            self._hash ^= _ZOBRIST[idx * MENU_COUNT + old]
+        if value != EMPTY_BYTE:
+            self._row_counts[row * MENU_COUNT + value] += 1
+            self._col_counts[col * MENU_COUNT + value] += 1
+            self._filled += 1
+            self._hash ^= _ZOBRIST[idx * MENU_COUNT + value]
+        self._cells[idx] = value
+        for callback in self._listeners:
+            callback(row, col)
 
     def _validate_pos(self, row: int, col: int) -> None:
         if not (0 <= row < GRID_ROWS and 0 <= col < GRID_COLS):
             raise IndexError(f"Position ({row}, {col}) is out of bounds")
+
+    def _validate_menu(self, menu_id: int) -> None:
+        if not (0 <= menu_id < MENU_COUNT):
+            raise ValueError(f"Invalid menu_id {menu_id}")
@@ -0,0 +1,191 @@
+"""全解の数え上げ・列挙
+
+全制約を満たす盤面を、ortools を使わずに厳密に数え上げ・列挙する。
+
+盤面を列ごとに組み立てるバックトラッキングで、
+- 列制約（AllDifferent・カレー連続禁止）は列パターン表で事前に解決し、
+- 行制約（ちらし寿司・揚げ物の上限）は行ごとの累積個数を
+  3ビットずつ詰めたビットマスク状態で枝刈りする。
+行制約から見て同じ働きをする列パターン（からあげ⇔エビフライ、
+カレーうどん⇔カレーライスの入れ替えなど）は同一シグネチャにまとめ、
+残り列数と行状態ごとの完成数をメモ化するので、全解数は一瞬で求まる。
+この完成数を使って、i 番目の解の復元や一様ランダムな解の生成もできる。
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence
+
+from src.model.board import Board
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_COUNT,
+    MENU_CHIRASHI,
+    FRIED_FOODS,
+    MENU_CURRY_UDON,
+    MENU_CURRY_RICE,
+    CHIRASHI_PER_ROW_MAX,
+    FRIED_PER_ROW_MAX,
+)
+
+# 行状態: 行 r ごとに ROW_BITS ビット [ちらし寿司数(1bit) | 揚げ物数(2bit)] を詰めた整数。
+# 行 r のちらし寿司数は state >> (r * ROW_BITS + CHIRASHI_SHIFT) & 1、
+# 揚げ物数は state >> (r * ROW_BITS) & FRIED_MASK で取り出せる（propagation でも使う）
+ROW_BITS = 3
+FRIED_MASK = 0b011
+CHIRASHI_SHIFT = 2
+
+
+def _column_patterns() -> list[tuple[int, ...]]:
+    """列単体で成立する並び（AllDifferent かつカレー連続なし）の一覧。"""
+    curry_pair = {MENU_CURRY_UDON, MENU_CURRY_RICE}
+    return [
+        perm
+        for perm in itertools.permutations(range(MENU_COUNT), GRID_ROWS)
+        if all({perm[r], perm[r + 1]} != curry_pair for r in range(GRID_ROWS - 1))
+    ]
+
+
+def column_signature(pattern: tuple[int, ...]) -> int:
+    """列パターンが行状態に加える増分（行ごとの ROW_BITS ビット値を詰めた整数）。
+
+    行制約から見て同じ働きをする列パターンは同じ値になる。
+    """
+    delta = 0
+    for r, menu_id in enumerate(pattern):
+        if menu_id == MENU_CHIRASHI:
+            delta |= 1 << (r * ROW_BITS + CHIRASHI_SHIFT)
+        elif menu_id in FRIED_FOODS:
+            delta |= 1 << (r * ROW_BITS)
+    return delta
+
+
+# 列単体で成立する全パターン（72 通り）。並び順は固定で、添字で参照してよい
+COLUMN_PATTERNS: tuple[tuple[int, ...], ...] = tuple(_column_patterns())
+
+# シグネチャ → そのシグネチャを持つ列パターン（同値類）
+_CLASSES: dict[int, list[tuple[int, ...]]] = {}
+for _p in COLUMN_PATTERNS:
+    _CLASSES.setdefault(column_signature(_p), []).append(_p)
+_SIGNATURES = sorted(_CLASSES)
+
+
+def _add(state: int, delta: int) -> int | None:
+    """行状態に列の増分を加える。行制約を超えるなら None。"""
+    for r in range(GRID_ROWS):
+        shift = r * ROW_BITS
+        cell = delta >> shift & 0b111
+        if not cell:
+            continue
+        cur = state >> shift & 0b111
+        chirashi = (cur >> CHIRASHI_SHIFT) + (cell >> CHIRASHI_SHIFT)
+        fried = (cur & FRIED_MASK) + (cell & FRIED_MASK)
+        if chirashi > CHIRASHI_PER_ROW_MAX or fried > FRIED_PER_ROW_MAX:
+            return None
+        state += cell << shift
+    return state
+
+
+@lru_cache(maxsize=None)
+def _transition(state: int, delta: int) -> int | None:
+    return _add(state, delta)
+
+
+@lru_cache(maxsize=None)
+def _completions(cols_left: int, state: int) -> int:
+    """残り cols_left 列を埋めて全制約を満たす方法の数。"""
+    if cols_left == 0:
+        return 1
+    total = 0
+    for sig in _SIGNATURES:
+        nxt = _transition(state, sig)
+        if nxt is not None:
+            total += len(_CLASSES[sig]) * _completions(cols_left - 1, nxt)
+    return total
+
+
+def count_solutions() -> int:
+    """全制約を満たす盤面の総数。"""
+    return _completions(GRID_COLS, 0)
+
+
+Columns = tuple[tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=None)
+def _last_columns(state: int) -> tuple[tuple[int, ...], ...]:
+    """行状態 state の後に置ける最終列のパターン（列挙順）。"""
+    return tuple(
+        pattern
+        for sig in _SIGNATURES
+        if _transition(state, sig) is not None
+        for pattern in _CLASSES[sig]
+    )
+
+
+def iter_solutions() -> Iterator[Columns]:
+    """全制約を満たす解を列パターンの組として列挙する（solution_at の添字順）。
+
+    盤面が必要なときだけ board_from_columns で Board にすること。
+    列の組だけなら全 4,900 万解を 20 秒ほどで回せる。
+    """
+    columns: list[tuple[int, ...]] = []
+
+    def backtrack(state: int) -> Iterator[Columns]:
+        cols_left = GRID_COLS - len(columns)
+        if cols_left == 1:
+            prefix = tuple(columns)
+            for pattern in _last_columns(state):
+                yield prefix + (pattern,)
+            return
+        for sig in _SIGNATURES:
+            nxt = _transition(state, sig)
+            if nxt is None or not _completions(cols_left - 1, nxt):
+                continue
+            for pattern in _CLASSES[sig]:
+                columns.append(pattern)
+                yield from backtrack(nxt)
+                columns.pop()
+
+    yield from backtrack(0)
+
+
+def solution_at(index: int) -> Board:
+    """列挙順で index 番目（0 始まり）の解を返す。"""
+    total = count_solutions()
+    if not (0 <= index < total):
+        raise IndexError(f"Solution index {index} is out of range (0..{total - 1})")
+    columns: list[tuple[int, ...]] = []
+    state = 0
+    for cols_left in range(GRID_COLS - 1, -1, -1):
+        for sig in _SIGNATURES:
+            nxt = _transition(state, sig)
+            if nxt is None:
+                continue
+            per_pattern = _completions(cols_left, nxt)
+            block = per_pattern * len(_CLASSES[sig])
+            if index < block:
+                pattern_idx, index = divmod(index, per_pattern)
+                columns.append(_CLASSES[sig][pattern_idx])
+                state = nxt
+                break
+            index -= block
+    return board_from_columns(columns)
+
+
+def random_solution(rng: Optional[random.Random] = None) -> Board:
+    """全解から一様ランダムに1つ選んで返す。"""
+    return solution_at((rng or random).randrange(count_solutions()))
+
+
+def board_from_columns(columns: Sequence[tuple[int, ...]]) -> Board:
+    """列パターンの並び（iter_solutions の要素など）から盤面を作る。"""
+    board = Board()
+    for c, pattern in enumerate(columns):
+        for r, menu_id in enumerate(pattern):
+            board.place(r, c, menu_id)
+    return board
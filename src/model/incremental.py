@@ -0,0 +1,85 @@
+"""差分制約チェッカー
+
+Board の変更通知を購読し、変更セルの行・列・隣接ペアだけを
+再評価して check_all と同じ ViolationResult を保持する。
+"""
+
+from __future__ import annotations
+
+from src.model.board import Board
+from src.model.rules import (
+    Violation,
+    ViolationResult,
+    col_duplicates,
+    row_chirashi_excess,
+    row_fried_excess,
+    curry_pair_violation,
+)
+from src.constants import GRID_ROWS, GRID_COLS
+
+
+class IncrementalChecker:
+    """盤面に追従して違反を差分更新するチェッカー。
+
+    result は常に check_all(board) と等しい。
+    """
+
+    def __init__(self, board: Board) -> None:
+        self.board = board
+        self._duplicates: list[list[Violation]] = [[] for _ in range(GRID_COLS)]
+        self._chirashi: list[Violation | None] = [None] * GRID_ROWS
+        self._fried: list[Violation | None] = [None] * GRID_ROWS
+        # _curry[c][r]: (r, c)-(r+1, c) ペアの違反
+        self._curry: list[list[Violation | None]] = [
+            [None] * (GRID_ROWS - 1) for _ in range(GRID_COLS)
+        ]
+        self._result: ViolationResult | None = None
+        self.rebuild()
+        board.add_listener(self._on_cell_changed)
+
+    def detach(self) -> None:
+        """盤面の購読を解除する。"""
+        self.board.remove_listener(self._on_cell_changed)
+
+    def rebuild(self) -> None:
+        """盤面全体から違反を再計算する。"""
+        for c in range(GRID_COLS):
+            self._update_col(c)
+        for r in range(GRID_ROWS):
+            self._update_row(r)
+
+    @property
+    def result(self) -> ViolationResult:
+        """現在の違反結果（check_all と同じ並び順）。"""
+        if self._result is None:
+            violations: list[Violation] = []
+            for col_violations in self._duplicates:
+                violations.extend(col_violations)
+            violations.extend(v for v in self._chirashi if v is not None)
+            violations.extend(v for v in self._fried if v is not None)
+            for col_pairs in self._curry:
+                violations.extend(v for v in col_pairs if v is not None)
+            self._result = ViolationResult(violations=violations)
+        return self._result
+
+    def _on_cell_changed(self, row: int, col: int) -> None:
+        self._update_row(row)
+        self._duplicates[col] = col_duplicates(self.board, col)
+        pairs = self._curry[col]
+        if row > 0:
+            pairs[row - 1] = curry_pair_violation(self.board, row - 1, col)
+        if row < GRID_ROWS - 1:
+            pairs[row] = curry_pair_violation(self.board, row, col)
+        self._result = None
+
+    def _update_row(self, row: int) -> None:
+        self._chirashi[row] = row_chirashi_excess(self.board, row)
+        self._fried[row] = row_fried_excess(self.board, row)
+        self._result = None
+
+    def _update_col(self, col: int) -> None:
+        self._duplicates[col] = col_duplicates(self.board, col)
+        self._curry[col] = [
+            curry_pair_violation(self.board, r, col) for r in range(GRID_ROWS - 1)
+        ]
+        self._result = None
@@ -0,0 +1,69 @@
+"""盤面をキーにした判定結果のメモ
+
+Board.zobrist_hash（と呼び出しごとの追加引数）をキーに、直近の結果を
+件数上限つきの LRU で保持する。ハッシュの衝突に備えて盤面のバイト列も
+記録し、一致したときだけヒットとみなす。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from src.model.board import Board
+
+T = TypeVar("T")
+
+
+class BoardMemo(Generic[T]):
+    """盤面ごとの計算結果の LRU メモ。
+
+    返す結果は共有されるため、呼び出し側で書き換えないこと。
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[bytes, T]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, board: Board, compute: Callable[[], T], *extra: Hashable) -> T:
+        """board（と extra）の結果を返す。なければ compute() で求めて記録する。"""
+        key = (board.zobrist_hash, *extra)
+        cells = board.to_bytes()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == cells:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (cells, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """記録とカウンタを消す。"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """これまでの呼び出しに占めるヒットの割合（呼び出しがなければ 0）。"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """ヒット数・ミス数・現在のエントリ数・ヒット率。"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,353 @@
+"""途中盤面の候補伝播
+
+途中まで埋まった盤面から、違反なし（100点）で完成させられるかと、
+各セルに置けるメニューの候補（ドメイン）を求める。
+
+enumerator と同じく、列は「列単体で成立する並び」（AllDifferent・
+カレー連続禁止）のどれかで、行制約（ちらし寿司・揚げ物の上限）は
+行ごとの累積個数を 3 ビットずつ詰めた行状態で扱う。
+- 置き済みセルと矛盾する並びを列ごとに除き（並びの集合はビット集合で持つ）、
+- 行状態の集合も「bit s = 行状態 s」のビット集合で持つ。列の増分 sig を
+  加えても上限を超えない状態の集合 _ADDABLE[sig] で絞ってから sig だけ
+  シフトすれば、全状態の遷移が整数演算数回で済む。
+- 置き済みセルのない列は、残り k 列で完成できる状態の集合
+  _COMPLETABLE[k] でまとめて扱う（行制約は列の順番によらない）。
+前向きに到達できて後ろ向きに完成できる遷移だけを残すので、候補は
+ちょうど「その値を置いた完成盤面が存在するメニュー」の集合になる。
+
+nearest_completion は同じ状態集合を「置き済みセルの書き換え数」ごとに
+持ち、書き換えの最も少ない完成盤面を求める。
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.model.board import EMPTY_BYTE, Board
+from src.model.enumerator import (
+    CHIRASHI_SHIFT,
+    COLUMN_PATTERNS,
+    FRIED_MASK,
+    ROW_BITS,
+    column_signature,
+)
+from src.model.memo import BoardMemo
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_COUNT,
+    CHIRASHI_PER_ROW_MAX,
+    FRIED_PER_ROW_MAX,
+)
+
+# propagate の結果を覚えておく盤面数
+PROPAGATION_MEMO_SIZE = 256
+
+# 何も置いていない列（to_bytes から切り出した形）
+_EMPTY_COLUMN = bytes([EMPTY_BYTE]) * GRID_ROWS
+
+# 全パターンの集合（bit i = COLUMN_PATTERNS[i]）
+_ALL_PATTERNS = (1 << len(COLUMN_PATTERNS)) - 1
+
+# _PATTERNS_AT[r][m]: 行 r がメニュー m のパターンの集合
+_PATTERNS_AT: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sum(1 << i for i, p in enumerate(COLUMN_PATTERNS) if p[r] == m)
+        for m in range(MENU_COUNT)
+    )
+    for r in range(GRID_ROWS)
+)
+
+# (行状態への増分, その増分を持つパターンの集合) の一覧
+_SIGNATURE_SETS: tuple[tuple[int, int], ...] = tuple(sorted(
+    {
+        sig: sum(1 << i for i, p in enumerate(COLUMN_PATTERNS) if column_signature(p) == sig)
+        for sig in {column_signature(p) for p in COLUMN_PATTERNS}
+    }.items()
+))
+
+# _PATTERN_SIGNATURES[i]: COLUMN_PATTERNS[i] の行状態への増分
+_PATTERN_SIGNATURES: tuple[int, ...] = tuple(column_signature(p) for p in COLUMN_PATTERNS)
+
+_FIELD_VALUES = 1 << ROW_BITS
+_STATE_COUNT = _FIELD_VALUES ** GRID_ROWS
+
+
+def _addable_states(sig: int) -> int:
+    """sig を加えても行制約を超えない行状態の集合。
+
+    行ごとに許される 3 ビット値の組の直積なので、下位の行から順に
+    「許される値 × その行の重み」だけシフトして重ねていけば作れる。
+    """
+    states = 1
+    for r in range(GRID_ROWS):
+        add = sig >> (r * ROW_BITS) & (_FIELD_VALUES - 1)
+        weight = _FIELD_VALUES ** r
+        row_states = 0
+        for cur in range(_FIELD_VALUES):
+            chirashi = (cur >> CHIRASHI_SHIFT) + (add >> CHIRASHI_SHIFT)
+            fried = (cur & FRIED_MASK) + (add & FRIED_MASK)
+            if chirashi <= CHIRASHI_PER_ROW_MAX and fried <= FRIED_PER_ROW_MAX:
+                row_states |= states << (cur * weight)
+        states = row_states
+    return states
+
+
+_ADDABLE: dict[int, int] = {sig: _addable_states(sig) for sig, _ in _SIGNATURE_SETS}
+
+
+def _completable_states() -> tuple[int, ...]:
+    """_COMPLETABLE[k]: 残り k 列を（置き済みセルなしで）埋めて完成できる状態の集合。"""
+    completable = [(1 << _STATE_COUNT) - 1]
+    for _ in range(GRID_COLS):
+        prev = completable[-1]
+        states = 0
+        for sig, _ in _SIGNATURE_SETS:
+            states |= _ADDABLE[sig] & (prev >> sig)
+        completable.append(states)
+    return tuple(completable)
+
+
+_COMPLETABLE = _completable_states()
+
+
+@dataclass(slots=True)
+class CandidateDomains:
+    """各セルの候補メニュー。
+
+    domains[r * GRID_COLS + c] はセル (r, c) に置けるメニューのビットマスク
+    （bit m = メニュー m）。置き済みセルはそのメニューだけ。
+    feasible が False（100点で完成できない）ならすべて 0。
+    """
+    feasible: bool
+    domains: tuple[int, ...]
+
+    def candidates(self, row: int, col: int) -> list[int]:
+        """セル (row, col) に置けるメニューID（昇順）。"""
+        mask = self.domains[row * GRID_COLS + col]
+        return [m for m in range(MENU_COUNT) if mask >> m & 1]
+
+
+_INFEASIBLE = CandidateDomains(False, (0,) * (GRID_ROWS * GRID_COLS))
+
+
+def propagate(board: Board) -> CandidateDomains:
+    """盤面を違反なしで完成できるかと、各セルの候補を求める。
+
+    最近調べた盤面はメモから返す。
+    """
+    return _memo.get_or_compute(board, lambda: _propagate_uncached(board))
+
+
+def propagation_memo_stats() -> dict[str, float]:
+    """propagate のメモのヒット数・ミス数・エントリ数・ヒット率。"""
+    return _memo.stats()
+
+
+def clear_propagation_memo() -> None:
+    """propagate のメモとカウンタを消す。"""
+    _memo.clear()
+
+
+def _column_patterns(board: Board, col: int) -> int:
+    """列 col の置き済みセルと矛盾しないパターンの集合。"""
+    allowed = _ALL_PATTERNS
+    for r in range(GRID_ROWS):
+        menu_id = board.get(r, col)
+        if menu_id is not None:
+            allowed &= _PATTERNS_AT[r][menu_id]
+    return allowed
+
+
+def _propagate_uncached(board: Board) -> CandidateDomains:
+    # 置き済みセルのある列: (列, 使える (増分, パターン) の一覧)
+    fixed_cols: list[tuple[int, list[tuple[int, int]]]] = []
+    free_cols: list[int] = []
+    for c in range(GRID_COLS):
+        allowed = _column_patterns(board, c)
+        if allowed == _ALL_PATTERNS:
+            free_cols.append(c)
+            continue
+        sigs = [(sig, pats & allowed) for sig, pats in _SIGNATURE_SETS if pats & allowed]
+        if not sigs:
+            return _INFEASIBLE
+        fixed_cols.append((c, sigs))
+
+    # 前向き: 置き済みの列を順に置いたときに到達しうる行状態
+    layers = [1]  # 最初は状態 0 だけ
+    for _, sigs in fixed_cols:
+        states = layers[-1]
+        nxt = 0
+        for sig, _ in sigs:
+            nxt |= (states & _ADDABLE[sig]) << sig
+        if not nxt:
+            return _INFEASIBLE
+        layers.append(nxt)
+
+    free_count = len(free_cols)
+    good = layers[-1] & _COMPLETABLE[free_count]
+    if not good:
+        return _INFEASIBLE
+
+    supported: dict[int, int] = {}
+    if free_cols:
+        # 空の列はどれも同じ候補になる
+        rest = _COMPLETABLE[free_count - 1]
+        free_supported = 0
+        for sig, pats in _SIGNATURE_SETS:
+            if ((good & _ADDABLE[sig]) << sig) & rest:
+                free_supported |= pats
+        for c in free_cols:
+            supported[c] = free_supported
+
+    # 後ろ向き: 完成できる行状態へ進むパターンだけを候補に残す
+    for i in range(len(fixed_cols) - 1, -1, -1):
+        c, sigs = fixed_cols[i]
+        states = layers[i]
+        col_supported = 0
+        prev_good = 0
+        for sig, pats in sigs:
+            reached = ((states & _ADDABLE[sig]) << sig) & good
+            if reached:
+                col_supported |= pats
+                prev_good |= reached >> sig
+        supported[c] = col_supported
+        good = prev_good
+
+    domains = [0] * (GRID_ROWS * GRID_COLS)
+    for c, pats in supported.items():
+        for r in range(GRID_ROWS):
+            at = _PATTERNS_AT[r]
+            domains[r * GRID_COLS + c] = sum(1 << m for m in range(MENU_COUNT) if at[m] & pats)
+    return CandidateDomains(True, tuple(domains))
+
+
+_memo: BoardMemo[CandidateDomains] = BoardMemo(PROPAGATION_MEMO_SIZE)
+
+
+# --- 書き換え最少の完成盤面 ---
+
+@lru_cache(maxsize=None)
+def _column_costs(column: bytes) -> tuple[tuple[int, int, int], ...]:
+    """列の並び（to_bytes から切り出した 5 バイト）に対する増分ごとの最少書き換え数。
+
+    (増分, 書き換え数, それを実現するパターン番号) を書き換え数の昇順で返す。
+    """
+    best: dict[int, tuple[int, int]] = {}
+    for i, pattern in enumerate(COLUMN_PATTERNS):
+        cost = sum(1 for r, v in enumerate(column) if v != EMPTY_BYTE and v != pattern[r])
+        sig = _PATTERN_SIGNATURES[i]
+        if sig not in best or cost < best[sig][0]:
+            best[sig] = (cost, i)
+    return tuple(sorted(((sig, cost, i) for sig, (cost, i) in best.items()), key=lambda e: e[1]))
+
+
+def _lowest(states: int) -> int:
+    """状態集合の中で最小の行状態。"""
+    return (states & -states).bit_length() - 1
+
+
+def nearest_completion(board: Board, deadline: float | None = None) -> tuple[Board, int] | None:
+    """置き済みセルの書き換えが最も少ない完成盤面（違反なし）と、その書き換え数。
+
+    書き換え数 k = 0, 1, 2, ... の順に、k 回の書き換えで到達できる行状態を
+    置き済みの列ごとに求め、初めて完成できた k で盤面を復元する。
+    deadline（time.perf_counter() の値）を過ぎたら探索をやめて None を返す。
+    """
+    cells = board.to_bytes()
+    fixed_cols: list[tuple[int, tuple[tuple[int, int, int], ...]]] = []
+    free_cols: list[int] = []
+    for c in range(GRID_COLS):
+        column = cells[c::GRID_COLS]
+        if column == _EMPTY_COLUMN:
+            free_cols.append(c)
+        else:
+            fixed_cols.append((c, _column_costs(column)))
+    finish = _COMPLETABLE[len(free_cols)]
+    placed = sum(1 for v in cells if v != EMPTY_BYTE)
+
+    # reach[i][k]: 置き済みの列を i 本、計 k 回の書き換えで置いたときの行状態の集合
+    reach: list[list[int]] = [[] for _ in range(len(fixed_cols) + 1)]
+    for k in range(placed + 1):
+        reach[0].append(1 if k == 0 else 0)
+        for i, (_, costs) in enumerate(fixed_cols):
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            states = 0
+            for sig, cost, _ in costs:
+                if cost > k:
+                    break
+                states |= (reach[i][k - cost] & _ADDABLE[sig]) << sig
+            reach[i + 1].append(states)
+        if reach[-1][k] & finish:
+            return _rebuild_completion(fixed_cols, free_cols, reach, k, finish), k
+    return None
+
+
+def _rebuild_completion(
+    fixed_cols: list[tuple[int, tuple[tuple[int, int, int], ...]]],
+    free_cols: list[int],
+    reach: list[list[int]],
+    changes: int,
+    finish: int,
+) -> Board:
+    """nearest_completion の状態集合から、書き換え changes 回の完成盤面を 1 つ復元する。"""
+    patterns: dict[int, tuple[int, ...]] = {}
+    end_state = _lowest(reach[-1][changes] & finish)
+
+    # 置き済みの列: 後ろから、到達可能な直前の状態へ戻れる増分を選ぶ
+    state, k = end_state, changes
+    for i in range(len(fixed_cols) - 1, -1, -1):
+        c, costs = fixed_cols[i]
+        for sig, cost, pattern_index in costs:
+            if cost > k:
+                break
+            prev = state - sig
+            if prev >= 0 and _ADDABLE[sig] >> prev & 1 and reach[i][k - cost] >> prev & 1:
+                patterns[c] = COLUMN_PATTERNS[pattern_index]
+                state, k = prev, k - cost
+                break
+
+    # 空の列: 残りの列で完成できる状態へ進む増分を前から選ぶ
+    state = end_state
+    for n, c in enumerate(free_cols):
+        rest = _COMPLETABLE[len(free_cols) - n - 1]
+        for sig, pats in _SIGNATURE_SETS:
+            if _ADDABLE[sig] >> state & 1 and rest >> (state + sig) & 1:
+                patterns[c] = COLUMN_PATTERNS[_lowest(pats)]
+                state += sig
+                break
+
+    target = Board()
+    for c, pattern in patterns.items():
+        for r, menu_id in enumerate(pattern):
+            target.place(r, c, menu_id)
+    return target
+
+
+class CandidateTracker:
+    """盤面に追従して候補を保持するトラッカー。
+
+    セルが変わると結果を捨て、次に result を参照したときに求め直す。
+    """
+
+    def __init__(self, board: Board) -> None:
+        self.board = board
+        self._result: CandidateDomains | None = None
+        board.add_listener(self._on_cell_changed)
+
+    def detach(self) -> None:
+        """盤面の購読を解除する。"""
+        self.board.remove_listener(self._on_cell_changed)
+
+    @property
+    def result(self) -> CandidateDomains:
+        """現在の盤面の候補（propagate(board) と同じ）。"""
+        if self._result is None:
+            self._result = propagate(self.board)
+        return self._result
+
+    def _on_cell_changed(self, row: int, col: int) -> None:
+        self._result = None
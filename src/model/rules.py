@@ -1,17 +1,23 @@
 """制約違反検出
 
-4種類の制約をチェックし、違反セル座標リストを返す。
+4種類の制約をチェックし、違反セルを返す。
+
+違反セルの集合は 25 ビットの整数マスク（bit r*5+c = セル (r, c)）で持つ。
 """
 
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field
-from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable
 
-from src.model.board import Board
+from src.model.board import EMPTY_BYTE, Board
+from src.model.memo import BoardMemo
 from src.constants import (
     GRID_ROWS,
     GRID_COLS,
+    MENU_COUNT,
     MENU_CHIRASHI,
     FRIED_FOODS,
     MENU_CURRY_UDON,
@@ -20,45 +26,156 @@ from src.constants import (
     FRIED_PER_ROW_MAX,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+_CURRY_PAIR = {MENU_CURRY_UDON, MENU_CURRY_RICE}
+
+# バッチ配列で空欄を表す値
+BATCH_EMPTY = -1
+
+# check_all の結果を覚えておく盤面数
+CHECK_ALL_MEMO_SIZE = 256
+
+# 違反種別（check_all の並び順。ViolationResult.kind_counts の添字もこの順）
+VIOLATION_KINDS = ("duplicate", "chirashi", "fried", "curry")
+_KIND_INDEX = {kind: i for i, kind in enumerate(VIOLATION_KINDS)}
+
+
+def cell_bit(row: int, col: int) -> int:
+    """セル (row, col) を表すマスクのビット。"""
+    return 1 << (row * GRID_COLS + col)
+
+
+def mask_to_cells(mask: int) -> list[tuple[int, int]]:
+    """セルマスクを (row, col) のリスト（行優先の昇順）に戻す。"""
+    cells: list[tuple[int, int]] = []
+    while mask:
+        low = mask & -mask
+        cells.append(divmod(low.bit_length() - 1, GRID_COLS))
+        mask ^= low
+    return cells
+
 
-@dataclass
+def cells_to_mask(cells: Iterable[tuple[int, int]]) -> int:
+    """(row, col) の列をセルマスクにする。"""
+    mask = 0
+    for row, col in cells:
+        mask |= cell_bit(row, col)
+    return mask
+
+
+@dataclass(slots=True)
 class Violation:
     """違反1件。"""
     kind: str            # "duplicate", "chirashi", "fried", "curry"
-    cells: list[tuple[int, int]]  # 違反セル座標 (row, col)
+    cell_mask: int       # 違反セルのマスク
     count: int = 1       # 違反件数
 
+    @property
+    def cells(self) -> list[tuple[int, int]]:
+        """違反セル座標 (row, col) のリスト（行優先の昇順）。"""
+        return mask_to_cells(self.cell_mask)
 
-@dataclass
+
+@dataclass(slots=True)
 class ViolationResult:
-    """全違反の集約。"""
+    """全違反の集約。
+
+    kind_counts（VIOLATION_KINDS 順の件数）と cell_mask（全違反セル）は
+    check_all が判定しながら埋める。省略すると violations から求める。
+    """
     violations: list[Violation] = field(default_factory=list)
+    kind_counts: list[int] | None = None
+    cell_mask: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.kind_counts is None:
+            counts = [0] * len(VIOLATION_KINDS)
+            for v in self.violations:
+                counts[_KIND_INDEX[v.kind]] += v.count
+            self.kind_counts = counts
+        if self.cell_mask is None:
+            mask = 0
+            for v in self.violations:
+                mask |= v.cell_mask
+            self.cell_mask = mask
 
     @property
     def total_count(self) -> int:
-        return sum(v.count for v in self.violations)
+        return sum(self.kind_counts)
 
     def by_kind(self, kind: str) -> list[Violation]:
         return [v for v in self.violations if v.kind == kind]
 
     def count_by_kind(self, kind: str) -> int:
-        return sum(v.count for v in self.violations if v.kind == kind)
+        return self.kind_counts[_KIND_INDEX[kind]]
 
     def all_violation_cells(self) -> set[tuple[int, int]]:
-        cells: set[tuple[int, int]] = set()
-        for v in self.violations:
-            cells.update(v.cells)
-        return cells
+        return set(mask_to_cells(self.cell_mask))
 
 
 def check_all(board: Board) -> ViolationResult:
-    """盤面の全制約をチェックし、違反結果を返す。"""
-    result = ViolationResult()
-    result.violations.extend(check_block_duplicates(board))
-    result.violations.extend(check_chirashi_limit(board))
-    result.violations.extend(check_fried_limit(board))
-    result.violations.extend(check_curry_consecutive(board))
-    return result
+    """盤面の全制約をチェックし、違反結果を返す。
+
+    最近調べた盤面（駒を動かして戻した場合など）はメモから返す。
+    返す結果は共有されるため、呼び出し側で書き換えないこと。
+    """
+    return _check_all_memo.get_or_compute(board, lambda: _check_all_uncached(board))
+
+
+def check_all_memo_stats() -> dict[str, float]:
+    """check_all のメモのヒット数・ミス数・エントリ数・ヒット率。"""
+    return _check_all_memo.stats()
+
+
+def clear_check_all_memo() -> None:
+    """check_all のメモとカウンタを消す。"""
+    _check_all_memo.clear()
+
+
+def _check_all_uncached(board: Board) -> ViolationResult:
+    """check_all の本体（メモを使わない）。
+
+    結果は check_block_duplicates / check_chirashi_limit / check_fried_limit /
+    check_curry_consecutive をこの順に連結したものと同じだが、
+    各行・各列の違反は事前計算した表（line_tables）から引く。
+    """
+    row_table, col_table = line_tables()
+    cells = board.to_bytes()
+    rows = [row_table[cells[r * GRID_COLS:(r + 1) * GRID_COLS]] for r in range(GRID_ROWS)]
+    cols = [col_table[cells[c::GRID_COLS]] for c in range(GRID_COLS)]
+
+    # 表のマスクは 0 行目・0 列目の位置なので、行・列の位置までずらす
+    violations: list[Violation] = []
+    counts = [0] * len(VIOLATION_KINDS)
+    all_cells = 0
+    for c, (duplicates, _) in enumerate(cols):
+        for count, mask in duplicates:
+            violations.append(Violation("duplicate", mask << c, count))
+            counts[0] += count
+            all_cells |= mask << c
+    for r, (chirashi, _) in enumerate(rows):
+        if chirashi is not None:
+            count, mask = chirashi[0], chirashi[1] << (r * GRID_COLS)
+            violations.append(Violation("chirashi", mask, count))
+            counts[1] += count
+            all_cells |= mask
+    for r, (_, fried) in enumerate(rows):
+        if fried is not None:
+            count, mask = fried[0], fried[1] << (r * GRID_COLS)
+            violations.append(Violation("fried", mask, count))
+            counts[2] += count
+            all_cells |= mask
+    for c, (_, curry_masks) in enumerate(cols):
+        for mask in curry_masks:
+            violations.append(Violation("curry", mask << c, 1))
+            counts[3] += 1
+            all_cells |= mask << c
+    return ViolationResult(violations, counts, all_cells)
+
+
+_check_all_memo: BoardMemo[ViolationResult] = BoardMemo(CHECK_ALL_MEMO_SIZE)
 
 
 def check_block_duplicates(board: Board) -> list[Violation]:
@@ -68,19 +185,7 @@ def check_block_duplicates(board: Board) -> list[Violation]:
     """
     violations: list[Violation] = []
     for c in range(GRID_COLS):
-        counter: dict[int, list[int]] = {}
-        for r in range(GRID_ROWS):
-            mid = board.get(r, c)
-            if mid is not None:
-                counter.setdefault(mid, []).append(r)
-        for mid, rows in counter.items():
-            if len(rows) > 1:
-                cells = [(r, c) for r in rows]
-                violations.append(Violation(
-                    kind="duplicate",
-                    cells=cells,
-                    count=len(rows) - 1,
-                ))
+        violations.extend(col_duplicates(board, c))
     return violations
 
 
@@ -91,15 +196,9 @@ def check_chirashi_limit(board: Board) -> list[Violation]:
     """
     violations: list[Violation] = []
     for r in range(GRID_ROWS):
-        cols = [c for c in range(GRID_COLS) if board.get(r, c) == MENU_CHIRASHI]
-        excess = len(cols) - CHIRASHI_PER_ROW_MAX
-        if excess > 0:
-            cells = [(r, c) for c in cols]
-            violations.append(Violation(
-                kind="chirashi",
-                cells=cells,
-                count=excess,
-            ))
+        v = row_chirashi_excess(board, r)
+        if v is not None:
+            violations.append(v)
     return violations
 
 
@@ -111,16 +210,9 @@ def check_fried_limit(board: Board) -> list[Violation]:
     """
     violations: list[Violation] = []
     for r in range(GRID_ROWS):
-        fried_cols = [c for c in range(GRID_COLS) if board.get(r, c) in FRIED_FOODS]
-        excess = len(fried_cols) - FRIED_PER_ROW_MAX
-        if excess > 0:
-            # 左から3つ許容、4つ目以降が超過
-            excess_cells = [(r, c) for c in fried_cols[FRIED_PER_ROW_MAX:]]
-            violations.append(Violation(
-                kind="fried",
-                cells=excess_cells,
-                count=excess,
-            ))
+        v = row_fried_excess(board, r)
+        if v is not None:
+            violations.append(v)
     return violations
 
 
@@ -130,17 +222,181 @@ def check_curry_consecutive(board: Board) -> list[Violation]:
     同じブロック（列）で連続する2日に
     (カレーうどん→カレーライス) or (カレーライス→カレーうどん) を禁止。
     """
-    curry_pair = {MENU_CURRY_UDON, MENU_CURRY_RICE}
     violations: list[Violation] = []
     for c in range(GRID_COLS):
         for r in range(GRID_ROWS - 1):
-            m1 = board.get(r, c)
-            m2 = board.get(r + 1, c)
-            if m1 is not None and m2 is not None:
-                if {m1, m2} == curry_pair:
-                    violations.append(Violation(
-                        kind="curry",
-                        cells=[(r, c), (r + 1, c)],
-                        count=1,
-                    ))
+            v = curry_pair_violation(board, r, c)
+            if v is not None:
+                violations.append(v)
+    return violations
+
+
+# --- 1行・1列単位のチェック（差分チェッカーからも利用） ---
+
+def col_duplicates(board: Board, col: int) -> list[Violation]:
+    """列 col のブロック内重複違反（出現行の早いメニュー順）。"""
+    if not any(board.col_count(col, m) > 1 for m in range(MENU_COUNT)):
+        return []
+    counter: dict[int, list[int]] = {}
+    for r in range(GRID_ROWS):
+        mid = board.get(r, col)
+        if mid is not None:
+            counter.setdefault(mid, []).append(r)
+    violations: list[Violation] = []
+    for mid, rows in counter.items():
+        if len(rows) > 1:
+            violations.append(Violation(
+                kind="duplicate",
+                cell_mask=cells_to_mask((r, col) for r in rows),
+                count=len(rows) - 1,
+            ))
     return violations
+
+
+def row_chirashi_excess(board: Board, row: int) -> Violation | None:
+    """行 row のちらし寿司超過違反。なければ None。"""
+    excess = board.row_count(row, MENU_CHIRASHI) - CHIRASHI_PER_ROW_MAX
+    if excess <= 0:
+        return None
+    cells = [(row, c) for c in range(GRID_COLS) if board.get(row, c) == MENU_CHIRASHI]
+    return Violation(kind="chirashi", cell_mask=cells_to_mask(cells), count=excess)
+
+
+def row_fried_excess(board: Board, row: int) -> Violation | None:
+    """行 row の揚げ物超過違反。なければ None。
+
+    左から3つ許容、4つ目以降が超過。
+    """
+    fried = sum(board.row_count(row, m) for m in FRIED_FOODS)
+    excess = fried - FRIED_PER_ROW_MAX
+    if excess <= 0:
+        return None
+    fried_cols = [c for c in range(GRID_COLS) if board.get(row, c) in FRIED_FOODS]
+    excess_cells = [(row, c) for c in fried_cols[FRIED_PER_ROW_MAX:]]
+    return Violation(kind="fried", cell_mask=cells_to_mask(excess_cells), count=excess)
+
+
+def curry_pair_violation(board: Board, row: int, col: int) -> Violation | None:
+    """(row, col) と (row+1, col) のカレー連続違反。なければ None。"""
+    m1 = board.get(row, col)
+    m2 = board.get(row + 1, col)
+    if m1 is not None and m2 is not None and {m1, m2} == _CURRY_PAIR:
+        return Violation(
+            kind="curry",
+            cell_mask=cell_bit(row, col) | cell_bit(row + 1, col),
+            count=1,
+        )
+    return None
+
+
+# --- 行・列単位の違反表 ---
+
+def _row_entry(line: tuple[int, ...]) -> tuple[tuple | None, tuple | None]:
+    """1行の並びに対する (ちらし寿司違反, 揚げ物違反)。
+
+    各々 (件数, 0 行目に置いたときの違反セルマスク) か None。
+    """
+    chirashi_cols = [c for c, v in enumerate(line) if v == MENU_CHIRASHI]
+    chirashi_excess = len(chirashi_cols) - CHIRASHI_PER_ROW_MAX
+    chirashi = None
+    if chirashi_excess > 0:
+        chirashi = (chirashi_excess, cells_to_mask((0, c) for c in chirashi_cols))
+
+    # row_fried_excess と同じく左から3つ許容、4つ目以降が超過
+    fried_cols = [c for c, v in enumerate(line) if v in FRIED_FOODS]
+    fried_excess = len(fried_cols) - FRIED_PER_ROW_MAX
+    fried = None
+    if fried_excess > 0:
+        fried = (fried_excess, cells_to_mask((0, c) for c in fried_cols[FRIED_PER_ROW_MAX:]))
+    return chirashi, fried
+
+
+def _col_entry(line: tuple[int, ...]) -> tuple[tuple, tuple]:
+    """1列の並びに対する (重複違反, カレー連続違反)。マスクは 0 列目に置いたときの値。
+
+    重複違反は (件数, 出現セルのマスク) を出現行の早いメニュー順に並べたもの、
+    カレー連続違反は違反ペアのマスクを上から並べたもの。
+    """
+    rows_by_menu: dict[int, list[int]] = {}
+    for r, v in enumerate(line):
+        if v != EMPTY_BYTE:
+            rows_by_menu.setdefault(v, []).append(r)
+    duplicates = tuple(
+        (len(rows) - 1, cells_to_mask((r, 0) for r in rows))
+        for rows in rows_by_menu.values() if len(rows) > 1
+    )
+    curry_masks = tuple(
+        cell_bit(r, 0) | cell_bit(r + 1, 0)
+        for r in range(len(line) - 1) if {line[r], line[r + 1]} == _CURRY_PAIR
+    )
+    return duplicates, curry_masks
+
+
+@lru_cache(maxsize=1)
+def line_tables() -> tuple[dict[bytes, tuple], dict[bytes, tuple]]:
+    """全ての行・列の並びについて違反を求めた表 (行の表, 列の表)。
+
+    1行・1列は (空欄 + メニュー5種)^5 = 7776 通りしかないので、初回に
+    すべて計算しておく。キーは Board.to_bytes() から切り出した 5 バイト。
+    """
+    values = (EMPTY_BYTE, *range(MENU_COUNT))
+    row_table = {
+        bytes(line): _row_entry(line) for line in itertools.product(values, repeat=GRID_COLS)
+    }
+    col_table = {
+        bytes(line): _col_entry(line) for line in itertools.product(values, repeat=GRID_ROWS)
+    }
+    return row_table, col_table
+
+
+# --- バッチ判定（NumPy） ---
+
+def boards_to_array(boards: Iterable[Board]) -> np.ndarray:
+    """Board 列を (N, 5, 5) の int8 配列に変換する。空欄は BATCH_EMPTY。"""
+    import numpy as np
+
+    data = b"".join(board.to_bytes() for board in boards)
+    return np.frombuffer(data, dtype=np.int8).reshape(-1, GRID_ROWS, GRID_COLS)
+
+
+def check_all_batch(boards: np.ndarray) -> dict[str, np.ndarray]:
+    """(N, 5, 5) の盤面配列をまとめて判定し、種別ごとの違反件数を返す。
+
+    各値は長さ N の int 配列で、check_all(board).count_by_kind(kind) と一致する。
+    空欄は BATCH_EMPTY で表す。
+    """
+    import numpy as np
+
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1:] != (GRID_ROWS, GRID_COLS):
+        raise ValueError(f"Expected shape (N, {GRID_ROWS}, {GRID_COLS}), got {boards.shape}")
+
+    # onehot[n, r, c, m]: セル (r, c) がメニュー m か
+    onehot = boards[..., np.newaxis] == np.arange(MENU_COUNT)
+
+    # 制約1: 列ごとに出現数 k のメニュー → k-1 件
+    col_counts = onehot.sum(axis=1)
+    duplicate = np.maximum(col_counts - 1, 0).sum(axis=(1, 2))
+
+    # 制約2: 行ごとのちらし寿司超過
+    chirashi_per_row = onehot[..., MENU_CHIRASHI].sum(axis=2)
+    chirashi = np.maximum(chirashi_per_row - CHIRASHI_PER_ROW_MAX, 0).sum(axis=1)
+
+    # 制約3: 行ごとの揚げ物超過
+    fried_per_row = onehot[..., sorted(FRIED_FOODS)].sum(axis=(2, 3))
+    fried = np.maximum(fried_per_row - FRIED_PER_ROW_MAX, 0).sum(axis=1)
+
+    # 制約4: 列方向に隣接するカレー2種
+    upper, lower = boards[:, :-1, :], boards[:, 1:, :]
+    curry_pairs = (
+        ((upper == MENU_CURRY_UDON) & (lower == MENU_CURRY_RICE))
+        | ((upper == MENU_CURRY_RICE) & (lower == MENU_CURRY_UDON))
+    )
+    curry = curry_pairs.sum(axis=(1, 2))
+
+    return {
+        "duplicate": duplicate,
+        "chirashi": chirashi,
+        "fried": fried,
+        "curry": curry,
+    }
@@ -6,9 +6,11 @@ score = min(100, max(0, 100 - penalty + bonus))
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from src.model.board import Board
-from src.model.rules import ViolationResult, check_all
+from src.model.memo import BoardMemo
+from src.model.rules import BATCH_EMPTY, ViolationResult, check_all, check_all_batch
 from src.constants import (
     PENALTY_EMPTY,
     PENALTY_BLOCK_DUPLICATE,
@@ -19,8 +21,22 @@ from src.constants import (
     BONUS_EARLY_60,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass
+# calculate_score の結果を覚えておく件数
+SCORE_MEMO_SIZE = 128
+
+# 違反種別ごとの減点項目（VIOLATION_KINDS 順）
+_VIOLATION_PENALTIES = (
+    ("ブロック内重複", PENALTY_BLOCK_DUPLICATE),
+    ("ちらし寿司 同日超過", PENALTY_CHIRASHI_EXCESS),
+    ("揚げ物 同日超過", PENALTY_FRIED_EXCESS),
+    ("カレー2種 連続", PENALTY_CURRY_CONSECUTIVE),
+)
+
+
+@dataclass(slots=True)
 class PenaltyDetail:
     """減点内訳1件。"""
     label: str
@@ -32,7 +48,7 @@ class PenaltyDetail:
         return self.count * self.per_point
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreResult:
     """採点結果。"""
     score: int
@@ -52,7 +68,34 @@ def calculate_score(
     remaining_seconds: int,
     completed_by_button: bool,
 ) -> ScoreResult:
-    """盤面を採点し、結果を返す。"""
+    """盤面を採点し、結果を返す。
+
+    同じ盤面・残り秒数・完了方法の組は直近の結果をメモから返す。
+    返す結果は共有されるため、呼び出し側で書き換えないこと。
+    """
+    return _score_memo.get_or_compute(
+        board,
+        lambda: _calculate_score_uncached(board, remaining_seconds, completed_by_button),
+        remaining_seconds,
+        completed_by_button,
+    )
+
+
+def score_memo_stats() -> dict[str, float]:
+    """calculate_score のメモのヒット数・ミス数・エントリ数・ヒット率。"""
+    return _score_memo.stats()
+
+
+def clear_score_memo() -> None:
+    """calculate_score のメモとカウンタを消す。"""
+    _score_memo.clear()
+
+
+def _calculate_score_uncached(
+    board: Board,
+    remaining_seconds: int,
+    completed_by_button: bool,
+) -> ScoreResult:
     violations = check_all(board)
     penalties: list[PenaltyDetail] = []
 
@@ -65,41 +108,10 @@ def calculate_score(
             per_point=PENALTY_EMPTY,
         ))
 
-    # B) ブロック内重複
-    dup_count = violations.count_by_kind("duplicate")
-    if dup_count > 0:
-        penalties.append(PenaltyDetail(
-            label="ブロック内重複",
-            count=dup_count,
-            per_point=PENALTY_BLOCK_DUPLICATE,
-        ))
-
-    # ちらし寿司超過
-    chi_count = violations.count_by_kind("chirashi")
-    if chi_count > 0:
-        penalties.append(PenaltyDetail(
-            label="ちらし寿司 同日超過",
-            count=chi_count,
-            per_point=PENALTY_CHIRASHI_EXCESS,
-        ))
-
-    # 揚げ物超過
-    fri_count = violations.count_by_kind("fried")
-    if fri_count > 0:
-        penalties.append(PenaltyDetail(
-            label="揚げ物 同日超過",
-            count=fri_count,
-            per_point=PENALTY_FRIED_EXCESS,
-        ))
-
-    # カレー連続
-    cur_count = violations.count_by_kind("curry")
-    if cur_count > 0:
-        penalties.append(PenaltyDetail(
-            label="カレー2種 連続",
-            count=cur_count,
-            per_point=PENALTY_CURRY_CONSECUTIVE,
-        ))
+    # B) 制約違反（ブロック内重複・ちらし寿司超過・揚げ物超過・カレー連続）
+    for (label, per_point), count in zip(_VIOLATION_PENALTIES, violations.kind_counts):
+        if count > 0:
+            penalties.append(PenaltyDetail(label=label, count=count, per_point=per_point))
 
     # C) 早解きボーナス
     bonus = 0
@@ -127,6 +139,44 @@ def calculate_score(
     )
 
 
+_score_memo: BoardMemo[ScoreResult] = BoardMemo(SCORE_MEMO_SIZE)
+
+
+def calculate_score_batch(
+    boards: np.ndarray,
+    remaining_seconds: int | np.ndarray = 0,
+    completed_by_button: bool | np.ndarray = False,
+) -> np.ndarray:
+    """(N, 5, 5) の盤面配列をまとめて採点し、長さ N の得点配列を返す。
+
+    各要素は calculate_score(...).score と一致する。
+    remaining_seconds / completed_by_button はスカラーまたは長さ N の配列。
+    """
+    import numpy as np
+
+    boards = np.asarray(boards)
+    counts = check_all_batch(boards)
+
+    empty = (boards == BATCH_EMPTY).sum(axis=(1, 2))
+    total_penalty = (
+        empty * PENALTY_EMPTY
+        + counts["duplicate"] * PENALTY_BLOCK_DUPLICATE
+        + counts["chirashi"] * PENALTY_CHIRASHI_EXCESS
+        + counts["fried"] * PENALTY_FRIED_EXCESS
+        + counts["curry"] * PENALTY_CURRY_CONSECUTIVE
+    )
+
+    remaining = np.asarray(remaining_seconds)
+    completed = np.asarray(completed_by_button, dtype=bool)
+    bonus = np.where(
+        completed & (remaining >= 120),
+        BONUS_EARLY_120,
+        np.where(completed & (remaining >= 60), BONUS_EARLY_60, 0),
+    )
+
+    return np.clip(100 - total_penalty + bonus, 0, 100)
+
+
 def _generate_comment(score: int, empty: int, violations: ViolationResult) -> str:
     """点数帯別の講評コメント。"""
     if score == 100:
@@ -0,0 +1,133 @@
+"""模範解答プール
+
+全制約を満たす盤面をまとめて生成し、1盤面 = 5進数25桁の整数（8バイト）
+としてバイナリファイルに保存する。ゲーム開始時はファイルから
+一様ランダムに1件取り出すだけで模範解答が得られる。
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from typing import Optional
+
+from src.model.board import Board
+from src.model.enumerator import random_solution
+from src.constants import GRID_ROWS, GRID_COLS, MENU_COUNT
+
+# 既定のプールファイル（リポジトリ直下の assets/）
+DEFAULT_POOL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "assets",
+    "solution_pool.bin",
+)
+
+# ファイル先頭のマジックバイト
+_MAGIC = b"MCP1"
+# 1盤面あたりのバイト数（5^25 < 2^64）
+_RECORD_SIZE = 8
+
+
+def encode_board(board: Board) -> int:
+    """全マス埋まった盤面を 5進数の整数に変換する（行優先、先頭セルが最上位桁）。"""
+    code = 0
+    for r in range(GRID_ROWS):
+        for c in range(GRID_COLS):
+            value = board.get(r, c)
+            if value is None:
+                raise ValueError(f"Cell ({r}, {c}) is empty")
+            code = code * MENU_COUNT + value
+    return code
+
+
+def decode_board(code: int) -> Board:
+    """encode_board の逆変換。"""
+    values = []
+    for _ in range(GRID_ROWS * GRID_COLS):
+        code, value = divmod(code, MENU_COUNT)
+        values.append(value)
+    values.reverse()
+    board = Board()
+    for idx, value in enumerate(values):
+        board.place(idx // GRID_COLS, idx % GRID_COLS, value)
+    return board
+
+
+def sample_solutions(count: int, rng: Optional[random.Random] = None) -> list[int]:
+    """全制約を満たす盤面を count 件（重複なし）サンプリングし、符号化して返す。
+
+    各盤面は全解の数え上げ（enumerator.random_solution）から一様に選ぶので、
+    制約の判定はここでは持たない。
+    """
+    rng = rng or random.Random()
+    codes: set[int] = set()
+    result: list[int] = []
+    while len(result) < count:
+        code = encode_board(random_solution(rng))
+        if code not in codes:
+            codes.add(code)
+            result.append(code)
+    return result
+
+
+class SolutionPool:
+    """符号化済み盤面の集合。ファイルのバイト列をそのまま保持する。"""
+
+    def __init__(self, data: bytes = b"") -> None:
+        if len(data) % _RECORD_SIZE:
+            raise ValueError("Solution pool data is truncated")
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._data) // _RECORD_SIZE
+
+    @classmethod
+    def from_codes(cls, codes: list[int]) -> SolutionPool:
+        return cls(b"".join(code.to_bytes(_RECORD_SIZE, "little") for code in codes))
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_POOL_PATH) -> SolutionPool:
+        """プールファイルを読み込む。形式不正なら ValueError。"""
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(_MAGIC):
+            raise ValueError(f"{path} is not a solution pool file")
+        return cls(data[len(_MAGIC):])
+
+    def save(self, path: str = DEFAULT_POOL_PATH) -> None:
+        with open(path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(self._data)
+
+    def code_at(self, index: int) -> int:
+        offset = index * _RECORD_SIZE
+        return int.from_bytes(self._data[offset:offset + _RECORD_SIZE], "little")
+
+    def board_at(self, index: int) -> Board:
+        return decode_board(self.code_at(index))
+
+    def sample(self, rng: Optional[random.Random] = None) -> Board:
+        """プールから一様ランダムに1盤面を返す。"""
+        if not len(self):
+            raise ValueError("Solution pool is empty")
+        index = (rng or random).randrange(len(self))
+        return self.board_at(index)
+
+
+def build_pool(
+    count: int,
+    path: str = DEFAULT_POOL_PATH,
+    rng: Optional[random.Random] = None,
+) -> SolutionPool:
+    """count 件のプールを生成してファイルに保存する。"""
+    pool = SolutionPool.from_codes(sample_solutions(count, rng))
+    pool.save(path)
+    return pool
+
+
+if __name__ == "__main__":
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    built = build_pool(n)
+    print(f"Wrote {len(built)} solutions to {DEFAULT_POOL_PATH}")
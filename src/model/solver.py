@@ -1,16 +1,33 @@
-"""CP-SAT ソルバーによる模範解答生成
+"""模範解答生成
 
-OR-Tools の CP-SAT ソルバーで全制約を満たす解を生成する。
+事前生成した解答プールがあればそこから1件選ぶ。プールがなければ
+全解の数え上げ（enumerator）から一様ランダムに1件選ぶ。
+OR-Tools の CP-SAT ソルバーによる生成も method="cpsat" で選べ、
 失敗時はハードコード済みのフォールバック解を返す。
+
+suggest_hint はプレイ中の盤面に対し、次に置くべき1マスを時間予算内で返す。
 """
 
 from __future__ import annotations
 
 import logging
 import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
-from src.model.board import Board
+from src.model.board import EMPTY_BYTE, Board
+from src.model.enumerator import random_solution
+from src.model.propagation import nearest_completion, propagate
+from src.model.rules import (
+    check_block_duplicates,
+    check_chirashi_limit,
+    check_curry_consecutive,
+    check_fried_limit,
+)
+from src.model.solution_pool import DEFAULT_POOL_PATH, SolutionPool
 from src.constants import (
     GRID_ROWS,
     GRID_COLS,
@@ -23,6 +40,7 @@ from src.constants import (
     FRIED_FOODS,
     CHIRASHI_PER_ROW_MAX,
     FRIED_PER_ROW_MAX,
+    HINT_BUDGET_MS,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,17 +55,36 @@ _FALLBACK_SOLUTION: list[list[int]] = [
 ]
 
 
-def generate_solution(timeout_seconds: float = 5.0) -> Board:
+# generate_solution の生成方式
+SOLUTION_METHODS = ("auto", "pool", "exact", "cpsat")
+
+
+def generate_solution(timeout_seconds: float = 5.0, method: str = "auto") -> Board:
     """全制約を満たす模範解答を生成する。
 
-    CP-SAT で解を探索し、失敗時はフォールバック解を返す。
+    method:
+        "auto"  -- 解答プールがあればプール、なければ "exact"。
+        "pool"  -- 解答プールから一様ランダムに選ぶ（プールがなければ "exact"）。
+        "exact" -- 全解の数え上げから一様ランダムに選ぶ（ortools 不要）。
+        "cpsat" -- CP-SAT で解を探索し、失敗時はフォールバック解を返す。
 
     Args:
-        timeout_seconds: ソルバーのタイムアウト（秒）。
+        timeout_seconds: ソルバーのタイムアウト（秒）。"cpsat" のみ使用。
+        method: 生成方式。
 
     Returns:
         全制約を満たす Board。
     """
+    if method not in SOLUTION_METHODS:
+        raise ValueError(f"Unknown solution method: {method}")
+
+    if method in ("auto", "pool"):
+        pool = _get_solution_pool()
+        if pool is not None:
+            return pool.sample()
+    if method != "cpsat":
+        return random_solution()
+
     board = _solve_with_cpsat(timeout_seconds)
     if board is not None:
         return board
@@ -56,95 +93,165 @@ def generate_solution(timeout_seconds: float = 5.0) -> Board:
     return _fallback_board()
 
 
+def generate_solution_async(
+    timeout_seconds: float = 5.0, method: str = "auto"
+) -> Future[Board]:
+    """generate_solution をバックグラウンドスレッドで実行する。
+
+    描画ループを止めずに模範解答を用意するため、結果は Future で返す。
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+        return _executor.submit(generate_solution, timeout_seconds, method)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_solution_pool: Optional[SolutionPool] = None
+_solution_pool_loaded = False
+_solution_pool_lock = threading.Lock()
+
+
+def _get_solution_pool(path: str = DEFAULT_POOL_PATH) -> Optional[SolutionPool]:
+    """解答プールを返す（初回のみ読込）。ファイルがない・空・不正なら None。"""
+    global _solution_pool, _solution_pool_loaded
+    with _solution_pool_lock:
+        if not _solution_pool_loaded:
+            _solution_pool_loaded = True
+            try:
+                pool = SolutionPool.load(path)
+            except FileNotFoundError:
+                pool = None
+            except (OSError, ValueError) as e:
+                logger.warning("Failed to load solution pool: %s", e)
+                pool = None
+            _solution_pool = pool if pool else None
+        return _solution_pool
+
+
 def _solve_with_cpsat(timeout_seconds: float) -> Optional[Board]:
-    """CP-SAT ソルバーで解を生成する。失敗時は None。"""
-    try:
-        from ortools.sat.python import cp_model
-    except ImportError:
-        logger.warning("ortools not installed, skipping CP-SAT solver")
+    """CP-SAT ソルバーで解を生成する。失敗時は None。
+
+    制約モデルはプロセス内で一度だけ構築し、呼び出しごとに
+    ランダム目的関数と乱数シードだけを差し替えて解く。
+    """
+    model = _get_cpsat_model()
+    if model is None:
         return None
+    return model.solve(timeout_seconds)
 
-    model = cp_model.CpModel()
 
-    # 変数: x[r][c] ∈ {0..4}
-    x = [
-        [model.new_int_var(0, MENU_COUNT - 1, f"x_{r}_{c}") for c in range(GRID_COLS)]
-        for r in range(GRID_ROWS)
-    ]
+class _CpSatModel:
+    """全制約を組み込んだ再利用可能な CP-SAT モデル。"""
 
-    # 制約1: 列ごと AllDifferent
-    for c in range(GRID_COLS):
-        model.add_all_different([x[r][c] for r in range(GRID_ROWS)])
+    def __init__(self, cp_model) -> None:
+        self._cp_model = cp_model
+        self._lock = threading.Lock()
+        model = cp_model.CpModel()
+        self._model = model
 
-    # 制約2: 行ごと ちらし寿司 ≤ 1
-    for r in range(GRID_ROWS):
-        chirashi_bools = []
-        for c in range(GRID_COLS):
-            b = model.new_bool_var(f"chirashi_{r}_{c}")
-            model.add(x[r][c] == MENU_CHIRASHI).only_enforce_if(b)
-            model.add(x[r][c] != MENU_CHIRASHI).only_enforce_if(b.negated())
-            chirashi_bools.append(b)
-        model.add(sum(chirashi_bools) <= CHIRASHI_PER_ROW_MAX)
-
-    # 制約3: 行ごと 揚げ物 ≤ 3
-    fried_list = sorted(FRIED_FOODS)  # [0, 1]
-    for r in range(GRID_ROWS):
-        fried_bools = []
-        for c in range(GRID_COLS):
-            b = model.new_bool_var(f"fried_{r}_{c}")
-            # b == 1 ⟺ x[r][c] ∈ FRIED_FOODS
-            model.add_linear_expression_in_domain(
-                x[r][c],
-                cp_model.Domain.from_values(fried_list),
-            ).only_enforce_if(b)
-            model.add_linear_expression_in_domain(
-                x[r][c],
-                cp_model.Domain.from_values(fried_list).complement(),
-            ).only_enforce_if(b.negated())
-            fried_bools.append(b)
-        model.add(sum(fried_bools) <= FRIED_PER_ROW_MAX)
-
-    # 制約4: 列ごと隣接カレー連続禁止
-    # カレーうどん→カレーライス or カレーライス→カレーうどん を禁止
-    curry_pair = {MENU_CURRY_UDON, MENU_CURRY_RICE}
-    for c in range(GRID_COLS):
-        for r in range(GRID_ROWS - 1):
-            # 2セルが異なるカレー種の組合せを禁止
-            for m1 in curry_pair:
-                m2 = (curry_pair - {m1}).pop()
-                b1 = model.new_bool_var(f"curry_a_{r}_{c}_{m1}")
-                b2 = model.new_bool_var(f"curry_b_{r}_{c}_{m2}")
-                model.add(x[r][c] == m1).only_enforce_if(b1)
-                model.add(x[r][c] != m1).only_enforce_if(b1.negated())
-                model.add(x[r + 1][c] == m2).only_enforce_if(b2)
-                model.add(x[r + 1][c] != m2).only_enforce_if(b2.negated())
-                # b1 AND b2 を禁止
-                model.add_bool_or([b1.negated(), b2.negated()])
-
-    # ランダム目的関数で解を多様化
-    coeffs = [random.randint(-10, 10) for _ in range(GRID_ROWS * GRID_COLS)]
-    obj = sum(
-        coeffs[r * GRID_COLS + c] * x[r][c]
-        for r in range(GRID_ROWS)
-        for c in range(GRID_COLS)
-    )
-    model.maximize(obj)
+        # 変数: x[r][c] ∈ {0..4}
+        x = [
+            [model.new_int_var(0, MENU_COUNT - 1, f"x_{r}_{c}") for c in range(GRID_COLS)]
+            for r in range(GRID_ROWS)
+        ]
+        self._x = x
+        self._flat_x = [x[r][c] for r in range(GRID_ROWS) for c in range(GRID_COLS)]
 
-    # ソルバー実行
-    solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = timeout_seconds
+        # 制約1: 列ごと AllDifferent
+        for c in range(GRID_COLS):
+            model.add_all_different([x[r][c] for r in range(GRID_ROWS)])
 
-    status = solver.solve(model)
+        # 制約2: 行ごと ちらし寿司 ≤ 1
+        for r in range(GRID_ROWS):
+            chirashi_bools = []
+            for c in range(GRID_COLS):
+                b = model.new_bool_var(f"chirashi_{r}_{c}")
+                model.add(x[r][c] == MENU_CHIRASHI).only_enforce_if(b)
+                model.add(x[r][c] != MENU_CHIRASHI).only_enforce_if(b.negated())
+                chirashi_bools.append(b)
+            model.add(sum(chirashi_bools) <= CHIRASHI_PER_ROW_MAX)
 
-    if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        board = Board()
+        # 制約3: 行ごと 揚げ物 ≤ 3
+        fried_list = sorted(FRIED_FOODS)  # [0, 1]
         for r in range(GRID_ROWS):
+            fried_bools = []
             for c in range(GRID_COLS):
-                board.place(r, c, solver.value(x[r][c]))
-        return board
+                b = model.new_bool_var(f"fried_{r}_{c}")
+                # b == 1 ⟺ x[r][c] ∈ FRIED_FOODS
+                model.add_linear_expression_in_domain(
+                    x[r][c],
+                    cp_model.Domain.from_values(fried_list),
+                ).only_enforce_if(b)
+                model.add_linear_expression_in_domain(
+                    x[r][c],
+                    cp_model.Domain.from_values(fried_list).complement(),
+                ).only_enforce_if(b.negated())
+                fried_bools.append(b)
+            model.add(sum(fried_bools) <= FRIED_PER_ROW_MAX)
+
+        # 制約4: 列ごと隣接カレー連続禁止
+        # カレーうどん→カレーライス or カレーライス→カレーうどん を禁止
+        curry_pair = {MENU_CURRY_UDON, MENU_CURRY_RICE}
+        for c in range(GRID_COLS):
+            for r in range(GRID_ROWS - 1):
+                # 2セルが異なるカレー種の組合せを禁止
+                for m1 in curry_pair:
+                    m2 = (curry_pair - {m1}).pop()
+                    b1 = model.new_bool_var(f"curry_a_{r}_{c}_{m1}")
+                    b2 = model.new_bool_var(f"curry_b_{r}_{c}_{m2}")
+                    model.add(x[r][c] == m1).only_enforce_if(b1)
+                    model.add(x[r][c] != m1).only_enforce_if(b1.negated())
+                    model.add(x[r + 1][c] == m2).only_enforce_if(b2)
+                    model.add(x[r + 1][c] != m2).only_enforce_if(b2.negated())
+                    # b1 AND b2 を禁止
+                    model.add_bool_or([b1.negated(), b2.negated()])
+
+    def solve(self, timeout_seconds: float) -> Optional[Board]:
+        """ランダム目的関数を設定して解く。失敗時は None。"""
+        cp_model = self._cp_model
+        with self._lock:
+            # ランダム目的関数で解を多様化（maximize は既存の目的関数を置き換える）
+            coeffs = [random.randint(-10, 10) for _ in range(GRID_ROWS * GRID_COLS)]
+            self._model.maximize(cp_model.LinearExpr.weighted_sum(self._flat_x, coeffs))
+
+            # ソルバー実行
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = timeout_seconds
+            solver.parameters.random_seed = random.randrange(2**31)
 
-    logger.warning("CP-SAT solver status: %s", status)
-    return None
+            status = solver.solve(self._model)
+
+            if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                board = Board()
+                for r in range(GRID_ROWS):
+                    for c in range(GRID_COLS):
+                        board.place(r, c, solver.value(self._x[r][c]))
+                return board
+
+        logger.warning("CP-SAT solver status: %s", status)
+        return None
+
+
+_cpsat_model: Optional[_CpSatModel] = None
+_cpsat_model_lock = threading.Lock()
+
+
+def _get_cpsat_model() -> Optional[_CpSatModel]:
+    """プロセス共有の CP-SAT モデルを返す（初回のみ構築）。ortools がなければ None。"""
+    global _cpsat_model
+    with _cpsat_model_lock:
+        if _cpsat_model is None:
+            try:
+                from ortools.sat.python import cp_model
+            except ImportError:
+                logger.warning("ortools not installed, skipping CP-SAT solver")
+                return None
+            _cpsat_model = _CpSatModel(cp_model)
+        return _cpsat_model
 
 
 def _fallback_board() -> Board:
@@ -154,3 +261,96 @@ def _fallback_board() -> Board:
         for c in range(GRID_COLS):
             board.place(r, c, _FALLBACK_SOLUTION[r][c])
     return board
+
+
+# --- ヒント ---
+
+@dataclass(slots=True)
+class Hint:
+    """次の一手のヒント。
+
+    changes は目標の完成盤面に対して書き換えが必要な置き済みセルの数。
+    exact が False のときは時間内に探索が終わらず、手持ちの完成盤面
+    （模範解答など）のうち書き換えの少ないものを目標にしている。
+    """
+
+    row: int
+    col: int
+    menu_id: int
+    changes: int
+    replaces: bool  # 置き済みのセルを書き換える一手か
+    exact: bool
+
+
+def suggest_hint(
+    board: Board,
+    budget_ms: float = HINT_BUDGET_MS,
+    fallback: Optional[Board] = None,
+) -> Optional[Hint]:
+    """board から完成盤面へ近づく最善の1マスを返す。完成済みなら None。
+
+    置き済みセルの書き換えが最も少ない完成盤面を目標にし、書き換えが
+    必要なら違反に関わるセルの書き換えを、不要なら候補の最も少ない
+    空きマスへの配置を勧める。budget_ms を過ぎたら探索を打ち切り、
+    fallback（プレイ中の模範解答など）とフォールバック固定解のうち
+    書き換えの少ない方を目標にする。探索後の空きマスの選択も、
+    予算を過ぎていれば候補の計算を省いて先頭の空きマスにする。
+    """
+    deadline = time.perf_counter() + budget_ms / 1000
+    found = nearest_completion(board, deadline)
+    if found is not None:
+        target, changes = found
+        return _hint_towards(board, target, changes, True, deadline)
+
+    targets = [b for b in (fallback, _fallback_board()) if b is not None]
+    target = min(targets, key=lambda b: _count_changes(board, b))
+    return _hint_towards(board, target, _count_changes(board, target), False, deadline)
+
+
+def _count_changes(board: Board, target: Board) -> int:
+    """board の置き済みセルのうち target と値が異なるものの数。"""
+    return sum(
+        1
+        for a, b in zip(board.to_bytes(), target.to_bytes())
+        if a != EMPTY_BYTE and a != b
+    )
+
+
+def _violation_cells(board: Board) -> int:
+    """違反に関わるセルのマスク（check_all の cell_mask と同じ）。
+
+    check_all は初回に違反表（line_tables）を作るため数十 ms かかることがあり、
+    ヒントの時間予算を守れない。ここでは表を使わない走査で求める。
+    """
+    mask = 0
+    checks = (check_block_duplicates, check_chirashi_limit, check_fried_limit, check_curry_consecutive)
+    for check in checks:
+        for violation in check(board):
+            mask |= violation.cell_mask
+    return mask
+
+
+def _hint_towards(
+    board: Board, target: Board, changes: int, exact: bool, deadline: float
+) -> Optional[Hint]:
+    """target へ近づける1マスを選ぶ。"""
+    cells = board.to_bytes()
+    goal = target.to_bytes()
+
+    if changes:
+        # 書き換えるセル: 違反に関わるものを優先し、なければ先頭から
+        wrong = [i for i, (a, b) in enumerate(zip(cells, goal)) if a != EMPTY_BYTE and a != b]
+        violated = _violation_cells(board)
+        i = next((i for i in wrong if violated >> i & 1), wrong[0])
+        return Hint(i // GRID_COLS, i % GRID_COLS, goal[i], changes, True, exact)
+
+    empty = [i for i, v in enumerate(cells) if v == EMPTY_BYTE]
+    if not empty:
+        return None
+    # 置くセル: 候補の最も少ない空きマス（迷いの少ない所から埋める）
+    if exact and time.perf_counter() <= deadline:
+        domains = propagate(board).domains
+        i = min(empty, key=lambda i: bin(domains[i]).count("1"))
+    else:
+        i = empty[0]
+    return Hint(i // GRID_COLS, i % GRID_COLS, goal[i], changes, False, exact)
@@ -0,0 +1,218 @@
+"""フレーム時間の計測とオーバーレイ表示
+
+メインループの各段階（イベント処理・更新・描画・画面反映）と、
+画面ごとの描画サブステップの所要時間をフレーム単位で記録する。
+直近フレームの p50/p95/p99 をオーバーレイに表示し、
+終了時に CSV / JSON でトレースを書き出せる。
+
+環境変数 MENU_CALENDAR_PROFILE=1 で起動時から有効になり、
+ゲーム中は PROFILER_HOTKEY (F3) で切り替える。
+MENU_CALENDAR_PROFILE_OUT にファイルパス（.csv / .json）を指定すると
+終了時にトレースを保存する。
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+import pygame
+
+# 有効化・出力先の環境変数
+PROFILE_ENV = "MENU_CALENDAR_PROFILE"
+PROFILE_OUT_ENV = "MENU_CALENDAR_PROFILE_OUT"
+
+# 計測の切り替えキー
+PROFILER_HOTKEY = pygame.K_F3
+
+# パーセンタイルを計算する直近フレーム数
+PROFILER_WINDOW = 240
+# トレースとして保持する最大フレーム数（超えたら古いものから捨てる）
+PROFILER_TRACE_MAX = 100_000
+
+# 1フレーム全体の計測区間名
+FRAME_SECTION = "frame"
+
+_PERCENTILES = (50, 95, 99)
+_OVERLAY_BG = (20, 20, 20)
+_OVERLAY_TEXT = (230, 230, 230)
+_OVERLAY_PAD = 6
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """最近傍順位法によるパーセンタイル。空なら 0。"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil(n * pct / 100)
+    return ordered[int(rank) - 1]
+
+
+class FrameProfiler:
+    """区間ごとの所要時間 (ms) をフレーム単位で集計する。
+
+    無効時の section / 計測ラッパーはほぼ何もしない。
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        window: int = PROFILER_WINDOW,
+        trace_max: int = PROFILER_TRACE_MAX,
+    ) -> None:
+        self.enabled = enabled
+        self._window: deque[dict[str, float]] = deque(maxlen=window)
+        self._trace: deque[dict[str, float]] = deque(maxlen=trace_max)
+        self._current: dict[str, float] | None = None
+        self._frame_start = 0.0
+        self._section_order: list[str] = []  # 初出順（表示・CSV 列の並び）
+        self._font: pygame.font.Font | None = None
+
+    @classmethod
+    def from_env(cls) -> FrameProfiler:
+        """環境変数 MENU_CALENDAR_PROFILE に従って生成する。"""
+        return cls(enabled=os.environ.get(PROFILE_ENV, "") not in ("", "0"))
+
+    def toggle(self) -> bool:
+        """有効/無効を切り替え、切り替え後の状態を返す。"""
+        self.enabled = not self.enabled
+        self._current = None
+        return self.enabled
+
+    # --- 計測 ---
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """フレームを締めて記録する。"""
+        frame = self._current
+        if frame is None:
+            return
+        self._record(frame, FRAME_SECTION, (time.perf_counter() - self._frame_start) * 1000.0)
+        self._window.append(frame)
+        self._trace.append(frame)
+        self._current = None
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """with 文の区間を計測する。同じフレームで複数回呼ばれたら合算する。"""
+        if self._current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._current is not None:
+                self._record(self._current, name, (time.perf_counter() - start) * 1000.0)
+
+    def instrument(self, obj: object, method_names: list[str], prefix: str) -> None:
+        """obj のメソッドを計測付きのラッパーに差し替える（インスタンス単位）。
+
+        区間名は "<prefix>.<メソッド名>"。
+        """
+        for method_name in method_names:
+            method = getattr(obj, method_name)
+            setattr(obj, method_name, self._timed(method, f"{prefix}.{method_name}"))
+
+    def _timed(self, func, name: str):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self._current is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if self._current is not None:
+                    self._record(self._current, name, (time.perf_counter() - start) * 1000.0)
+
+        return wrapper
+
+    def _record(self, frame: dict[str, float], name: str, elapsed_ms: float) -> None:
+        if name not in frame:
+            frame[name] = 0.0
+            if name not in self._section_order:
+                self._section_order.append(name)
+        frame[name] += elapsed_ms
+
+    # --- 集計 ---
+
+    @property
+    def frame_count(self) -> int:
+        """トレースに残っているフレーム数。"""
+        return len(self._trace)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """直近フレームにおける区間ごとの p50/p95/p99 (ms)。
+
+        その区間を通らなかったフレームは集計に含めない。
+        """
+        result: dict[str, dict[str, float]] = {}
+        for name in self._section_order:
+            values = [frame[name] for frame in self._window if name in frame]
+            if values:
+                result[name] = {f"p{p}": percentile(values, p) for p in _PERCENTILES}
+        return result
+
+    # --- 表示 ---
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """左上に集計表を描き、描いた領域を返す。無効なら None。
+
+        背景は不透明なので、毎フレーム上書きしても前回の表示は残らない。
+        """
+        if not self.enabled:
+            return None
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        summary = self.summary()
+        lines = [f"{'section':<28}{'p50':>8}{'p95':>8}{'p99':>8}  (ms)"]
+        for name, stats in summary.items():
+            lines.append(
+                f"{name:<28}" + "".join(f"{stats[f'p{p}']:>8.2f}" for p in _PERCENTILES)
+            )
+        # 数値は毎フレーム変わるので TextCache は通さない（キャッシュを汚すだけ）
+        rendered = [self._font.render(line, True, _OVERLAY_TEXT) for line in lines]
+        width = max(s.get_width() for s in rendered) + _OVERLAY_PAD * 2
+        height = sum(s.get_height() for s in rendered) + _OVERLAY_PAD * 2
+        rect = pygame.Rect(0, 0, width, height).clip(surface.get_rect())
+        surface.fill(_OVERLAY_BG, rect)
+        y = _OVERLAY_PAD
+        for s in rendered:
+            surface.blit(s, (_OVERLAY_PAD, y))
+            y += s.get_height()
+        return rect
+
+    # --- 書き出し ---
+
+    def dump(self, path: str) -> None:
+        """トレースを書き出す。拡張子 .json なら JSON、それ以外は CSV。
+
+        CSV は 1 行 1 フレーム（通らなかった区間は空欄）、
+        JSON は {"sections": [...], "summary": {...}, "frames": [...]}。
+        """
+        if path.lower().endswith(".json"):
+            data = {
+                "sections": list(self._section_order),
+                "summary": self.summary(),
+                "frames": list(self._trace),
+            }
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            return
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=["index", *self._section_order])
+            writer.writeheader()
+            for index, frame in enumerate(self._trace):
+                writer.writerow({"index": index, **{k: f"{v:.4f}" for k, v in frame.items()}})
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
+if TYPE_CHECKING:
+    from src.asset_manager import AssetManager
+
 
 class Button:
-    """矩形＋テキストのボタン。ホバー・クリック判定付き。"""
+    """矩形＋テキストのボタン。ホバー・クリック判定付き。
+
+    enabled が False の間はホバー・クリックに反応せず、disabled_color で描く。
+    """
 
     def __init__(
         self,
@@ -17,6 +25,8 @@ class Button:
         hover_color: tuple[int, int, int] = (220, 60, 0),
         text_color: tuple[int, int, int] = (255, 255, 255),
         border_radius: int = 12,
+        assets: AssetManager | None = None,
+        disabled_color: tuple[int, int, int] = (200, 200, 200),
     ) -> None:
         self.rect = rect
         self.text = text
@@ -25,20 +35,33 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.border_radius = border_radius
+        self.assets = assets
+        self.disabled_color = disabled_color
+        self.enabled = True
         self._hovered = False
 
+    @property
+    def hovered(self) -> bool:
+        return self._hovered and self.enabled
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理。クリックされたら True を返す。"""
         if event.type == pygame.MOUSEMOTION:
             self._hovered = self.rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
+            if self.enabled and self.rect.collidepoint(event.pos):
                 return True
         return False
 
     def draw(self, surface: pygame.Surface) -> None:
-        color = self.hover_color if self._hovered else self.color
+        if not self.enabled:
+            color = self.disabled_color
+        else:
+            color = self.hover_color if self._hovered else self.color
         pygame.draw.rect(surface, color, self.rect, border_radius=self.border_radius)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        if self.assets is not None:
+            text_surf = self.assets.render_text(self.font, self.text, self.text_color)
+        else:
+            text_surf = self.font.render(self.text, True, self.text_color)
         text_rect = text_surf.get_rect(center=self.rect.center)
         surface.blit(text_surf, text_rect)
@@ -11,11 +11,15 @@ from src.ui.palette import Palette
 from src.constants import (
     MENU_EMOJI,
     MENU_ICON_KEYS,
+    ICON_SIZE_DRAG,
     MENU_NAMES,
     MENU_COLORS,
     MENU_BG_COLORS,
 )
 
+# ドラッグ中アイテムの一辺
+_GHOST_SIZE = 80
+
 
 class DragDrop:
     """パレット→セル、セル→セルのドラッグ＆ドロップを管理。"""
@@ -29,6 +33,7 @@ class DragDrop:
         self._drag_menu_id: int | None = None
         self._drag_source: tuple[int, int] | None = None  # セル起点の場合 (row, col)
         self._drag_pos: tuple[int, int] = (0, 0)
+        self._hover_cell: tuple[int, int] | None = None  # ドラッグ中にカーソルがあるセル
 
         self._font_emoji = None
         try:
@@ -41,6 +46,26 @@ class DragDrop:
     def is_dragging(self) -> bool:
         return self._dragging
 
+    @property
+    def drag_menu_id(self) -> int | None:
+        return self._drag_menu_id if self._dragging else None
+
+    @property
+    def drag_pos(self) -> tuple[int, int]:
+        return self._drag_pos
+
+    @property
+    def hover_cell(self) -> tuple[int, int] | None:
+        """ドラッグ中にドロップ先となるセル。ドラッグしていなければ None。"""
+        return self._hover_cell if self._dragging else None
+
+    def ghost_rect(self, pos: tuple[int, int] | None = None) -> pygame.Rect:
+        """ドラッグ中アイテム（影を含む）の描画範囲。pos 省略時は現在位置。"""
+        mx, my = pos if pos is not None else self._drag_pos
+        half = _GHOST_SIZE // 2
+        # 影は (x-2, y+2) から (size+4) 四方に描かれる
+        return pygame.Rect(mx - half - 2, my - half, _GHOST_SIZE + 4, _GHOST_SIZE + 6)
+
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """イベント処理。戻り値: 'placed', 'moved', 'removed', None。"""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -50,6 +75,7 @@ class DragDrop:
         elif event.type == pygame.MOUSEMOTION:
             if self._dragging:
                 self._drag_pos = event.pos
+                self._hover_cell = grid_hit_test(event.pos)
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             if self._dragging:
                 return self._on_drop(event.pos)
@@ -97,6 +123,7 @@ class DragDrop:
         self._drag_menu_id = menu_id
         self._drag_source = source
         self._drag_pos = pos
+        self._hover_cell = grid_hit_test(pos)
         self.assets.play_sound("grab")
         if source is not None:
             self.board.remove(source[0], source[1])
@@ -124,6 +151,7 @@ class DragDrop:
         self._dragging = False
         self._drag_menu_id = None
         self._drag_source = None
+        self._hover_cell = None
 
     def draw_dragging(self, surface: pygame.Surface) -> None:
         """ドラッグ中のメニューアイテムを描画。"""
@@ -132,7 +160,7 @@ class DragDrop:
 
         mid = self._drag_menu_id
         mx, my = self._drag_pos
-        size = 80
+        size = _GHOST_SIZE
 
         bg = MENU_BG_COLORS.get(mid, (240, 240, 240))
         rect = pygame.Rect(mx - size // 2, my - size // 2, size, size)
@@ -145,7 +173,7 @@ class DragDrop:
         pygame.draw.rect(surface, MENU_COLORS.get(mid, (100, 100, 100)), rect, width=2, border_radius=10)
 
         icon_key = MENU_ICON_KEYS.get(mid)
-        icon_size = (44, 44)
+        icon_size = (ICON_SIZE_DRAG, ICON_SIZE_DRAG)
         icon = self.assets.get_icon(icon_key, icon_size) if icon_key else None
 
         if icon is not None:
@@ -153,11 +181,11 @@ class DragDrop:
             surface.blit(icon, icon_rect)
         else:
             emoji = MENU_EMOJI.get(mid, "?")
-            emoji_surf = self._font_emoji.render(emoji, True, (10, 10, 10))
+            emoji_surf = self.assets.render_text(self._font_emoji, emoji, (10, 10, 10))
             icon_rect = emoji_surf.get_rect(centerx=rect.centerx, centery=rect.centery - 6)
             surface.blit(emoji_surf, icon_rect)
 
         name = MENU_NAMES.get(mid, "?")
-        name_surf = self._font_name.render(name, True, MENU_COLORS.get(mid, (10, 10, 10)))
+        name_surf = self.assets.render_text(self._font_name, name, MENU_COLORS.get(mid, (10, 10, 10)))
         name_rect = name_surf.get_rect(centerx=rect.centerx, top=icon_rect.bottom + 2)
         surface.blit(name_surf, name_rect)
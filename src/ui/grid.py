@@ -6,14 +6,18 @@ import pygame
 
 from src.asset_manager import AssetManager
 from src.model.board import Board
+from src.model.propagation import CandidateDomains
 from src.constants import (
     GRID_ROWS,
     GRID_COLS,
+    MENU_COUNT,
     DAY_LABELS,
     BLOCK_LABELS,
     MENU_NAMES,
     MENU_EMOJI,
     MENU_ICON_KEYS,
+    ICON_SIZE_GRID,
+    ICON_SIZE_START,
     MENU_COLORS,
     MENU_BG_COLORS,
     COLOR_WHITE,
@@ -22,6 +26,8 @@ from src.constants import (
     COLOR_DAY_LABEL_TEXT,
     COLOR_CELL_EMPTY,
     COLOR_CELL_PLUS,
+    COLOR_HIGHLIGHT_RED,
+    COLOR_RESULT_ANSWER_HEADING,
 )
 
 # レイアウト定数
@@ -31,22 +37,52 @@ DAY_LABEL_W = 55      # 曜日ラベル幅
 HEADER_H = 22         # ブロックヘッダ高さ
 CELL_SIZE = 110       # セル一辺
 CELL_GAP = 4          # セル間隔
+CANDIDATE_DOT_R = 5   # 候補表示の点の半径
+CANDIDATE_DOT_GAP = 6 # 候補表示の点の間隔
+HINT_BADGE_R = 18     # ヒントのメニューを示す丸の半径
+
+
+CELL_PITCH = CELL_SIZE + CELL_GAP
+CELLS_LEFT = GRID_X + DAY_LABEL_W     # セル領域左端
+CELLS_TOP = GRID_Y + HEADER_H         # セル領域上端
+
+# セル矩形の表 _CELL_RECTS[row][col]（起動時に一度だけ作る）
+_CELL_RECTS: tuple[tuple[pygame.Rect, ...], ...] = tuple(
+    tuple(
+        pygame.Rect(CELLS_LEFT + c * CELL_PITCH, CELLS_TOP + r * CELL_PITCH, CELL_SIZE, CELL_SIZE)
+        for c in range(GRID_COLS)
+    )
+    for r in range(GRID_ROWS)
+)
 
 
 def cell_rect(row: int, col: int) -> pygame.Rect:
-    """セル (row, col) の矩形を返す。"""
-    x = GRID_X + DAY_LABEL_W + col * (CELL_SIZE + CELL_GAP)
-    y = GRID_Y + HEADER_H + row * (CELL_SIZE + CELL_GAP)
-    return pygame.Rect(x, y, CELL_SIZE, CELL_SIZE)
+    """セル (row, col) の矩形を返す（呼び出し側で変更してよいコピー）。"""
+    return _CELL_RECTS[row][col].copy()
+
+
+def _band_index(offset: int, count: int) -> int | None:
+    """先頭からの距離 offset が何番目のセル上か。セル間の隙間・範囲外は None。"""
+    if offset < 0:
+        return None
+    index, within = divmod(offset, CELL_PITCH)
+    if index >= count or within >= CELL_SIZE:
+        return None
+    return int(index)
 
 
 def grid_hit_test(pos: tuple[int, int]) -> tuple[int, int] | None:
-    """マウス座標からセル (row, col) を返す。該当なし None。"""
-    for r in range(GRID_ROWS):
-        for c in range(GRID_COLS):
-            if cell_rect(r, c).collidepoint(pos):
-                return (r, c)
-    return None
+    """マウス座標からセル (row, col) を返す。該当なし None。
+
+    全セルの矩形を調べる代わりに、座標とセル間隔から直接求める。
+    """
+    col = _band_index(pos[0] - CELLS_LEFT, GRID_COLS)
+    if col is None:
+        return None
+    row = _band_index(pos[1] - CELLS_TOP, GRID_ROWS)
+    if row is None:
+        return None
+    return (row, col)
 
 
 class Grid:
@@ -65,14 +101,22 @@ class Grid:
             self._font_emoji = pygame.font.SysFont(None, 32)
 
     def draw(self, surface: pygame.Surface, board: Board) -> None:
+        self.draw_static(surface)
+        self.draw_cells(surface, board)
+
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """盤面に依存しない部分（ブロックヘッダ・曜日ラベル）を描画。"""
         self._draw_block_headers(surface)
         self._draw_day_labels(surface)
+
+    def draw_cells(self, surface: pygame.Surface, board: Board) -> None:
+        """セルを描画。"""
         self._draw_cells(surface, board)
 
     def _draw_block_headers(self, surface: pygame.Surface) -> None:
         for c in range(GRID_COLS):
             r = cell_rect(0, c)
-            label = self._font_header.render(BLOCK_LABELS[c], True, COLOR_BLOCK_LABEL)
+            label = self.assets.render_text(self._font_header, BLOCK_LABELS[c], COLOR_BLOCK_LABEL)
             label_rect = label.get_rect(centerx=r.centerx, bottom=GRID_Y + HEADER_H - 2)
             surface.blit(label, label_rect)
 
@@ -81,7 +125,7 @@ class Grid:
             cr = cell_rect(r, 0)
             label_rect = pygame.Rect(GRID_X, cr.y, DAY_LABEL_W, CELL_SIZE)
             pygame.draw.rect(surface, COLOR_DAY_LABEL_BG, label_rect, border_radius=6)
-            label = self._font_day.render(DAY_LABELS[r], True, COLOR_DAY_LABEL_TEXT)
+            label = self.assets.render_text(self._font_day, DAY_LABELS[r], COLOR_DAY_LABEL_TEXT)
             lr = label.get_rect(center=label_rect.center)
             surface.blit(label, lr)
 
@@ -97,7 +141,7 @@ class Grid:
 
     def _draw_empty_cell(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
         pygame.draw.rect(surface, COLOR_CELL_EMPTY, rect, border_radius=8)
-        plus = self._font_cell_plus.render("＋", True, COLOR_CELL_PLUS)
+        plus = self.assets.render_text(self._font_cell_plus, "＋", COLOR_CELL_PLUS)
         pr = plus.get_rect(center=rect.center)
         surface.blit(plus, pr)
 
@@ -106,7 +150,7 @@ class Grid:
         pygame.draw.rect(surface, bg, rect, border_radius=8)
 
         icon_key = MENU_ICON_KEYS.get(menu_id)
-        icon_size = (56, 56)
+        icon_size = (ICON_SIZE_GRID, ICON_SIZE_GRID)
         icon = self.assets.get_icon(icon_key, icon_size) if icon_key else None
 
         if icon is not None:
@@ -114,12 +158,50 @@ class Grid:
             surface.blit(icon, icon_rect)
         else:
             emoji_text = MENU_EMOJI.get(menu_id, "?")
-            emoji_surf = self._font_emoji.render(emoji_text, True, (10, 10, 10))
+            emoji_surf = self.assets.render_text(self._font_emoji, emoji_text, (10, 10, 10))
             icon_rect = emoji_surf.get_rect(centerx=rect.centerx, centery=rect.centery - 10)
             surface.blit(emoji_surf, icon_rect)
 
         name = MENU_NAMES.get(menu_id, "?")
         text_color = MENU_COLORS.get(menu_id, (10, 10, 10))
-        name_surf = self._font_menu_name.render(name, True, text_color)
+        name_surf = self.assets.render_text(self._font_menu_name, name, text_color)
         name_rect = name_surf.get_rect(centerx=rect.centerx, top=icon_rect.bottom + 4)
         surface.blit(name_surf, name_rect)
+
+    def draw_candidates(self, surface: pygame.Surface, board: Board, domains: CandidateDomains) -> None:
+        """空きセルの下部に、置けるメニューの色の点を並べる。
+
+        100点で完成できない盤面なら、空きセルを赤枠で囲む。
+        """
+        pitch = CANDIDATE_DOT_R * 2 + CANDIDATE_DOT_GAP
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                if board.get(r, c) is not None:
+                    continue
+                rect = _CELL_RECTS[r][c]
+                if not domains.feasible:
+                    pygame.draw.rect(surface, COLOR_HIGHLIGHT_RED, rect, width=2, border_radius=8)
+                    continue
+                # メニューID順に固定位置へ置くので、同じメニューは常に同じ位置に出る
+                x0 = rect.centerx - (MENU_COUNT - 1) * pitch // 2
+                y = rect.bottom - CANDIDATE_DOT_R - 8
+                for menu_id in domains.candidates(r, c):
+                    color = MENU_COLORS.get(menu_id, COLOR_CELL_PLUS)
+                    pygame.draw.circle(surface, color, (x0 + menu_id * pitch, y), CANDIDATE_DOT_R)
+
+    def draw_hint(self, surface: pygame.Surface, row: int, col: int, menu_id: int) -> None:
+        """ヒントのセルを緑枠で囲み、右上に置くべきメニューのアイコンを出す。"""
+        rect = _CELL_RECTS[row][col]
+        pygame.draw.rect(surface, COLOR_RESULT_ANSWER_HEADING, rect, width=4, border_radius=8)
+
+        center = (rect.right - HINT_BADGE_R - 4, rect.top + HINT_BADGE_R + 4)
+        pygame.draw.circle(surface, COLOR_WHITE, center, HINT_BADGE_R)
+        pygame.draw.circle(surface, COLOR_RESULT_ANSWER_HEADING, center, HINT_BADGE_R, width=2)
+        icon_key = MENU_ICON_KEYS.get(menu_id)
+        icon = self.assets.get_icon(icon_key, (ICON_SIZE_START, ICON_SIZE_START)) if icon_key else None
+        if icon is None:
+            # アイコンがなければメニュー色の点で示す
+            color = MENU_COLORS.get(menu_id, COLOR_CELL_PLUS)
+            pygame.draw.circle(surface, color, center, HINT_BADGE_R // 2)
+        else:
+            surface.blit(icon, icon.get_rect(center=center))
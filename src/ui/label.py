@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
+if TYPE_CHECKING:
+    from src.asset_manager import AssetManager
+
 
 class Label:
     """テキストラベル。フォント・色・位置を指定して描画。"""
@@ -15,12 +20,14 @@ class Label:
         color: tuple[int, int, int] = (10, 10, 10),
         pos: tuple[int, int] = (0, 0),
         anchor: str = "topleft",
+        assets: AssetManager | None = None,
     ) -> None:
         self.text = text
         self.font = font
         self.color = color
         self.pos = pos
         self.anchor = anchor
+        self.assets = assets
         self._surface: pygame.Surface | None = None
 
     def set_text(self, text: str) -> None:
@@ -30,6 +37,9 @@ class Label:
 
     def draw(self, surface: pygame.Surface) -> None:
         if self._surface is None:
-            self._surface = self.font.render(self.text, True, self.color)
+            if self.assets is not None:
+                self._surface = self.assets.render_text(self.font, self.text, self.color)
+            else:
+                self._surface = self.font.render(self.text, True, self.color)
         rect = self._surface.get_rect(**{self.anchor: self.pos})
         surface.blit(self._surface, rect)
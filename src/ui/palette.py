@@ -14,6 +14,7 @@ from src.constants import (
     MENU_NAMES,
     MENU_EMOJI,
     MENU_ICON_KEYS,
+    ICON_SIZE_PALETTE,
     MENU_COLORS,
     MENU_BG_COLORS,
     FRIED_FOODS,
@@ -29,6 +30,10 @@ PALETTE_Y = 65
 PALETTE_W = 200
 ITEM_H = 52
 ITEM_GAP = 8
+ITEM_PITCH = ITEM_H + ITEM_GAP
+ITEMS_LEFT = PALETTE_X + 12           # 項目左端
+ITEMS_TOP = PALETTE_Y + 36            # 先頭項目の上端
+ITEM_W = PALETTE_W - 24
 
 MENU_ORDER = [MENU_KARAAGE, MENU_EBI_FRY, MENU_CURRY_UDON, MENU_CURRY_RICE, MENU_CHIRASHI]
 
@@ -49,28 +54,36 @@ class Palette:
             self._font_emoji = pygame.font.SysFont(None, 22)
 
         self._item_rects: list[tuple[int, pygame.Rect]] = []
+        self._rect_by_menu: dict[int, pygame.Rect] = {}
         self._build_rects()
 
     def _build_rects(self) -> None:
         self._item_rects = []
-        y = PALETTE_Y + 36
+        y = ITEMS_TOP
         for mid in MENU_ORDER:
-            rect = pygame.Rect(PALETTE_X + 12, y, PALETTE_W - 24, ITEM_H)
+            rect = pygame.Rect(ITEMS_LEFT, y, ITEM_W, ITEM_H)
             self._item_rects.append((mid, rect))
-            y += ITEM_H + ITEM_GAP
+            y += ITEM_PITCH
+        self._rect_by_menu = {mid: rect for mid, rect in self._item_rects}
 
     def hit_test(self, pos: tuple[int, int]) -> int | None:
-        """マウス座標がパレット項目上ならメニューIDを返す。"""
-        for mid, rect in self._item_rects:
-            if rect.collidepoint(pos):
-                return mid
-        return None
+        """マウス座標がパレット項目上ならメニューIDを返す。
+
+        項目は等間隔に縦に並ぶので、座標から番号を直接求める。
+        """
+        dx = pos[0] - ITEMS_LEFT
+        if dx < 0 or dx >= ITEM_W:
+            return None
+        dy = pos[1] - ITEMS_TOP
+        if dy < 0:
+            return None
+        index, within = divmod(dy, ITEM_PITCH)
+        if index >= len(MENU_ORDER) or within >= ITEM_H:
+            return None
+        return MENU_ORDER[int(index)]
 
     def get_item_rect(self, menu_id: int) -> pygame.Rect | None:
-        for mid, rect in self._item_rects:
-            if mid == menu_id:
-                return rect
-        return None
+        return self._rect_by_menu.get(menu_id)
 
     def draw(self, surface: pygame.Surface) -> None:
         # パレット背景
@@ -79,7 +92,7 @@ class Palette:
         pygame.draw.rect(surface, (230, 230, 230), bg_rect, width=1, border_radius=12)
 
         # 見出し
-        heading = self._font_heading.render("メニュー", True, COLOR_ACCENT_ORANGE)
+        heading = self.assets.render_text(self._font_heading, "メニュー", COLOR_ACCENT_ORANGE)
         surface.blit(heading, (PALETTE_X + 14, PALETTE_Y + 10))
 
         # メニュー項目
@@ -87,7 +100,7 @@ class Palette:
             self._draw_item(surface, mid, rect)
 
         # ヒント
-        hint = self._font_hint.render("ドラッグしてグリッドに配置！", True, COLOR_TEXT_SUB)
+        hint = self.assets.render_text(self._font_hint, "ドラッグしてグリッドに配置！", COLOR_TEXT_SUB)
         hint_rect = hint.get_rect(centerx=PALETTE_X + PALETTE_W // 2,
                                   top=self._item_rects[-1][1].bottom + 12)
         surface.blit(hint, hint_rect)
@@ -101,17 +114,17 @@ class Palette:
         text_color = MENU_COLORS[menu_id]
 
         icon_key = MENU_ICON_KEYS.get(menu_id)
-        icon_size = (32, 32)
+        icon_size = (ICON_SIZE_PALETTE, ICON_SIZE_PALETTE)
         icon = self.assets.get_icon(icon_key, icon_size) if icon_key else None
 
-        name_surf = self._font_name.render(name, True, text_color)
+        name_surf = self.assets.render_text(self._font_name, name, text_color)
 
         if icon is not None:
             icon_y = rect.centery - icon.get_height() // 2
             surface.blit(icon, (rect.x + 10, icon_y))
             icon_w = icon.get_width()
         else:
-            emoji_surf = self._font_emoji.render(emoji, True, (10, 10, 10))
+            emoji_surf = self.assets.render_text(self._font_emoji, emoji, (10, 10, 10))
             emoji_y = rect.centery - emoji_surf.get_height() // 2
             surface.blit(emoji_surf, (rect.x + 10, emoji_y))
             icon_w = emoji_surf.get_width()
@@ -120,7 +133,7 @@ class Palette:
         surface.blit(name_surf, (rect.x + 10 + icon_w + 6, name_y))
 
         if menu_id in FRIED_FOODS:
-            badge_surf = self._font_badge.render("揚げ物", True, COLOR_WHITE)
+            badge_surf = self.assets.render_text(self._font_badge, "揚げ物", COLOR_WHITE)
             bw = badge_surf.get_width() + 8
             bh = 18
             bx = rect.right - bw - 8
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
 from src.asset_manager import AssetManager
 from src.model.board import Board
-from src.model.rules import check_all
-from src.model.solver import generate_solution
+from src.model.incremental import IncrementalChecker
+from src.model.propagation import CandidateDomains, CandidateTracker
+from src.model.rules import mask_to_cells
+from src.model.solver import Hint, generate_solution_async, suggest_hint
 from src.ui.grid import Grid, cell_rect, GRID_X, DAY_LABEL_W, CELL_SIZE, CELL_GAP, GRID_Y, HEADER_H
 from src.ui.palette import Palette
 from src.ui.timer import Timer
@@ -17,6 +21,7 @@ from src.ui.toggle_switch import ToggleSwitch
 from src.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    IDLE_MAX_WAIT_MS,
     GRID_ROWS,
     GRID_COLS,
     COLOR_BG,
@@ -38,6 +43,9 @@ from src.constants import (
     RULES,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 # 違反種別→枠色のマッピング
 _VIOLATION_COLORS = {
     "duplicate": COLOR_HIGHLIGHT_RED,
@@ -46,9 +54,19 @@ _VIOLATION_COLORS = {
     "curry": COLOR_HIGHLIGHT_PURPLE,
 }
 
+# 候補表示の切り替えキー
+CANDIDATE_OVERLAY_HOTKEY = pygame.K_c
+# ヒント表示のキー
+HINT_HOTKEY = pygame.K_h
+
 # 警告点滅の持続時間(フレーム数)
 _FLASH_DURATION = 20
 
+# dirty rect 用の固定領域（ヘッダ内のタイマー、カウンター＋トグル）
+_TIMER_RECT = pygame.Rect(SCREEN_WIDTH // 2 - 80, 0, 160, 55)
+_HEADER_RIGHT_RECT = pygame.Rect(SCREEN_WIDTH - 240, 0, 240, 60)
+_CELLS_RECT = cell_rect(0, 0).union(cell_rect(GRID_ROWS - 1, GRID_COLS - 1))
+
 
 class PlayScreen:
     """ゲーム実行画面の統合。"""
@@ -56,6 +74,8 @@ class PlayScreen:
     def __init__(self, assets: AssetManager) -> None:
         self.assets = assets
         self.board = Board()
+        self._checker = IncrementalChecker(self.board)
+        self._candidates = CandidateTracker(self.board)
         self.grid = Grid(assets)
         self.palette = Palette(assets)
         self.timer = Timer(assets)
@@ -86,6 +106,7 @@ class PlayScreen:
             hover_color=(210, 212, 216),
             text_color=COLOR_BTN_BACK_TEXT,
             border_radius=8,
+            assets=self.assets,
         )
         self.btn_reset = Button(
             rect=pygame.Rect(cx - 70, btn_y, 120, btn_h),
@@ -95,6 +116,7 @@ class PlayScreen:
             hover_color=(240, 185, 0),
             text_color=COLOR_BTN_RESET_TEXT,
             border_radius=8,
+            assets=self.assets,
         )
         self.btn_done = Button(
             rect=pygame.Rect(cx + 70, btn_y, 130, btn_h),
@@ -104,35 +126,55 @@ class PlayScreen:
             hover_color=(220, 60, 0),
             text_color=COLOR_BTN_DONE_TEXT,
             border_radius=8,
+            assets=self.assets,
         )
 
         # トグルスイッチ
         toggle_font = assets.get_font(14)
         self._bgm_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 220, 14, "BGM", toggle_font, initial=assets.bgm_enabled
+            SCREEN_WIDTH - 220, 14, "BGM", toggle_font,
+            initial=assets.bgm_enabled, assets=assets,
         )
         self._sfx_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 110, 14, "SFX", toggle_font, initial=assets.sfx_enabled
+            SCREEN_WIDTH - 110, 14, "SFX", toggle_font,
+            initial=assets.sfx_enabled, assets=assets,
         )
 
         self._locked = False
         self._flash_cells: dict[tuple[int, int], tuple[tuple[int, int, int], int]] = {}
-        self._prev_violation_cells: set[tuple[int, int]] = set()
-        self._answer: Board | None = None  # 模範解答キャッシュ
+        self._prev_violation_mask = 0  # 前回の違反セルのマスク
+        self._show_candidates = False  # 候補表示のオン/オフ
+        self._domains: CandidateDomains = self._candidates.result  # 直近のドロップ時点の候補
+        self._hint: Hint | None = None  # 表示中のヒント（盤面が変わったら消す）
+        self._answer_future: Future[Board] | None = None  # 模範解答（生成中も含む）
+        self._static_layer: pygame.Surface | None = None  # 静的描画のキャッシュ
+        self._full_redraw = True  # 次回 draw で画面全体を更新するか
+        self._prev_frame: dict | None = None  # 前回描画時の動的要素の状態
 
     def start(self) -> None:
-        """ゲーム開始時にリセットし、模範解答を生成。"""
+        """ゲーム開始時にリセットし、模範解答の生成をバックグラウンドで開始。"""
         self.board.reset()
         self.timer.start()
         self._locked = False
         self._flash_cells.clear()
-        self._prev_violation_cells.clear()
-        self._answer = generate_solution()
+        self._prev_violation_mask = 0
+        self._domains = self._candidates.result
+        self._hint = None
+        self._answer_future = generate_solution_async()
+        self.invalidate()
 
     @property
     def answer(self) -> Board | None:
-        """模範解答（結果画面で使用）。"""
-        return self._answer
+        """模範解答（結果画面で使用）。生成中・生成失敗時は None。"""
+        future = self._answer_future
+        if future is not None and future.done() and future.exception() is None:
+            return future.result()
+        return None
+
+    @property
+    def answer_future(self) -> Future[Board] | None:
+        """模範解答生成の Future。未開始なら None。"""
+        return self._answer_future
 
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """イベント処理。戻り値: 'done', 'back', 'timeout', None。"""
@@ -146,6 +188,14 @@ class PlayScreen:
         if self._locked:
             return None
 
+        if event.type == pygame.KEYDOWN and event.key == CANDIDATE_OVERLAY_HOTKEY:
+            self._show_candidates = not self._show_candidates
+            return None
+        if event.type == pygame.KEYDOWN and event.key == HINT_HOTKEY:
+            # 時間予算内で打ち切るので、1フレームの中で求めてよい
+            self._hint = suggest_hint(self.board, fallback=self.answer)
+            return None
+
         # ボタン
         if self.btn_done.handle_event(event):
             self.assets.play_sound("button_click")
@@ -157,6 +207,8 @@ class PlayScreen:
         if self.btn_reset.handle_event(event):
             self.assets.play_sound("button_click")
             self.board.reset()
+            self._domains = self._candidates.result
+            self._hint = None
             return None
 
         # D&D
@@ -165,24 +217,33 @@ class PlayScreen:
             if result != "removed":
                 self.assets.play_sound("drop")
             self._check_realtime_warnings()
+            self._domains = self._candidates.result
+            self._hint = None
 
         return None
 
     def _check_realtime_warnings(self) -> None:
         """配置直後に違反をチェックし、新規違反セルを点滅させる。"""
-        violations = check_all(self.board)
-        current_cells: set[tuple[int, int]] = set()
-        for v in violations.violations:
-            color = _VIOLATION_COLORS.get(v.kind, COLOR_HIGHLIGHT_RED)
-            for cell in v.cells:
-                current_cells.add(cell)
-                if cell not in self._prev_violation_cells:
+        violations = self._checker.result
+        new_mask = violations.cell_mask & ~self._prev_violation_mask
+        if new_mask:
+            for v in violations.violations:
+                color = _VIOLATION_COLORS.get(v.kind, COLOR_HIGHLIGHT_RED)
+                for cell in mask_to_cells(v.cell_mask & new_mask):
                     self._flash_cells[cell] = (color, _FLASH_DURATION)
-
-        if current_cells - self._prev_violation_cells:
             self.assets.play_sound("warning")
 
-        self._prev_violation_cells = current_cells
+        self._prev_violation_mask = violations.cell_mask
+
+    @property
+    def completable(self) -> bool:
+        """直近のドロップ時点の盤面を、違反なし（100点）で完成させられるか。"""
+        return self._domains.feasible
+
+    @property
+    def hint(self) -> Hint | None:
+        """表示中のヒント。なければ None。"""
+        return self._hint
 
     def update(self, dt_ms: int) -> str | None:
         """毎フレーム更新。タイムアウト時 'timeout' を返す。"""
@@ -202,41 +263,158 @@ class PlayScreen:
             return "timeout"
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COLOR_BG)
+    def idle_wait_ms(self) -> int | None:
+        """イベントを待って眠ってよい最長時間 (ms)。None なら毎フレーム描画する。
 
-        # ヘッダ
-        self._draw_header(surface)
+        ドラッグ中と点滅中はフル FPS、それ以外はタイマー表示が
+        次に変わる時刻まで眠る。
+        """
+        if self.drag_drop.is_dragging or self._flash_cells:
+            return None
+        until_tick = self.timer.ms_until_change()
+        if until_tick is None:
+            return IDLE_MAX_WAIT_MS
+        return min(until_tick, IDLE_MAX_WAIT_MS)
+
+    def invalidate(self) -> None:
+        """次回 draw で画面全体を描き直す。"""
+        self._full_redraw = True
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """画面を描画し、前回から変化した領域（dirty rect）を返す。
 
-        # パレット
-        self.palette.draw(surface)
+        動的要素に変化がなければ何も描かず空リストを返す。
+        """
+        frame = self._frame_state()
+        if not self._full_redraw and frame == self._prev_frame:
+            return []
+
+        # 静的レイヤー（背景・ヘッダ/フッター枠・パレット・ラベル・ルールパネル）
+        surface.blit(self._get_static_layer(surface), (0, 0))
+
+        # ヘッダ（タイマー・カウンター・トグル）
+        self._draw_header(surface)
 
-        # グリッド
-        self.grid.draw(surface, self.board)
+        # グリッド（セルのみ）
+        self.grid.draw_cells(surface, self.board)
 
         # 違反セル点滅ハイライト
         self._draw_flash_highlights(surface)
 
-        # ルールパネル（グリッド右横）
-        self._draw_rules_panel(surface)
+        # 候補（オンのときのみ）
+        if self._show_candidates:
+            self.grid.draw_candidates(surface, self.board, self._domains)
 
-        # フッター
+        # ヒント
+        if self._hint is not None:
+            self.grid.draw_hint(surface, self._hint.row, self._hint.col, self._hint.menu_id)
+
+        # ドロップ先セルの枠
+        self._draw_drop_target(surface)
+
+        # フッター（ボタン）
         self._draw_footer(surface)
 
         # ドラッグ中のアイテム（最前面）
         self.drag_drop.draw_dragging(surface)
 
-    def _draw_header(self, surface: pygame.Surface) -> None:
+        if self._full_redraw or self._prev_frame is None:
+            dirty = [surface.get_rect()]
+        else:
+            dirty = self._dirty_rects(self._prev_frame, frame)
+        self._full_redraw = False
+        self._prev_frame = frame
+        return dirty
+
+    def _frame_state(self) -> dict:
+        """描画結果を左右する動的要素の状態。"""
+        drag_id = self.drag_drop.drag_menu_id
+        return {
+            "timer": (self.timer.format_time(), self.timer.remaining_int <= 30),
+            "header": (self.board.empty_count(), self.assets.bgm_enabled, self.assets.sfx_enabled),
+            "cells": self.board.to_bytes(),
+            "flash": {
+                cell: frames % 4 < 2 for cell, (_, frames) in self._flash_cells.items()
+            },
+            "drag": (drag_id, self.drag_drop.drag_pos if drag_id is not None else None),
+            "hover": self.drag_drop.hover_cell,
+            "candidates": self._domains if self._show_candidates else None,
+            "hint": self._hint,
+            "buttons": tuple(
+                btn.hovered for btn in (self.btn_back, self.btn_reset, self.btn_done)
+            ),
+        }
+
+    def _dirty_rects(self, prev: dict, cur: dict) -> list[pygame.Rect]:
+        """前回と今回の状態差分から更新が必要な領域を求める。"""
+        dirty: list[pygame.Rect] = []
+        if prev["timer"] != cur["timer"]:
+            dirty.append(_TIMER_RECT)
+        if prev["header"] != cur["header"]:
+            dirty.append(_HEADER_RIGHT_RECT)
+
+        prev_cells, cur_cells = prev["cells"], cur["cells"]
+        prev_flash, cur_flash = prev["flash"], cur["flash"]
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                idx = r * GRID_COLS + c
+                if (prev_cells[idx] != cur_cells[idx]
+                        or prev_flash.get((r, c)) != cur_flash.get((r, c))):
+                    dirty.append(cell_rect(r, c))
+
+        if prev["candidates"] != cur["candidates"]:
+            dirty.append(_CELLS_RECT)
+
+        if prev["hover"] != cur["hover"]:
+            for cell in (prev["hover"], cur["hover"]):
+                if cell is not None:
+                    dirty.append(cell_rect(*cell))
+
+        if prev["hint"] != cur["hint"]:
+            for hint in (prev["hint"], cur["hint"]):
+                if hint is not None:
+                    dirty.append(cell_rect(hint.row, hint.col))
+
+        if prev["drag"] != cur["drag"]:
+            for menu_id, pos in (prev["drag"], cur["drag"]):
+                if menu_id is not None:
+                    dirty.append(self.drag_drop.ghost_rect(pos))
+
+        buttons = (self.btn_back, self.btn_reset, self.btn_done)
+        for btn, was, now in zip(buttons, prev["buttons"], cur["buttons"]):
+            if was != now:
+                dirty.append(btn.rect)
+        return dirty
+
+    def _get_static_layer(self, surface: pygame.Surface) -> pygame.Surface:
+        """ゲーム中に変化しない描画内容をまとめたサーフェスを返す（初回のみ描画）。"""
+        if self._static_layer is None or self._static_layer.get_size() != surface.get_size():
+            layer = pygame.Surface(surface.get_size(), 0, surface)
+            layer.fill(COLOR_BG)
+            self._draw_header_static(layer)
+            self.palette.draw(layer)
+            self.grid.draw_static(layer)
+            self._draw_rules_panel(layer)
+            self._draw_footer_static(layer)
+            self._static_layer = layer
+        return self._static_layer
+
+    def invalidate_static_layer(self) -> None:
+        """静的レイヤーを破棄し、次回描画時に作り直す。"""
+        self._static_layer = None
+
+    def _draw_header_static(self, surface: pygame.Surface) -> None:
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 50)
         pygame.draw.rect(surface, COLOR_HEADER_BG, header_rect)
         pygame.draw.line(surface, (230, 230, 230), (0, 50), (SCREEN_WIDTH, 50))
 
         # ロゴ
-        logo = self._font_logo.render("献立表パズル", True, COLOR_ACCENT_ORANGE)
-        emoji = self._font_emoji.render("\U0001f371", True, (10, 10, 10))
+        logo = self.assets.render_text(self._font_logo, "献立表パズル", COLOR_ACCENT_ORANGE)
+        emoji = self.assets.render_text(self._font_emoji, "\U0001f371", (10, 10, 10))
         surface.blit(emoji, (15, 12))
         surface.blit(logo, (15 + emoji.get_width() + 6, 14))
 
+    def _draw_header(self, surface: pygame.Surface) -> None:
         # タイマー
         self.timer.draw(surface, SCREEN_WIDTH // 2, 25)
 
@@ -244,7 +422,7 @@ class PlayScreen:
         placed = GRID_ROWS * GRID_COLS - self.board.empty_count()
         total = GRID_ROWS * GRID_COLS
         counter_text = f"配置: {placed}/{total}"
-        counter = self._font_counter.render(counter_text, True, COLOR_COUNTER_TEXT)
+        counter = self.assets.render_text(self._font_counter, counter_text, COLOR_COUNTER_TEXT)
         surface.blit(counter, (SCREEN_WIDTH - counter.get_width() - 20, 32))
 
         # トグルスイッチ（他画面での変更を反映）
@@ -261,6 +439,12 @@ class PlayScreen:
             rect = cell_rect(r, c)
             pygame.draw.rect(surface, color, rect, width=3, border_radius=8)
 
+    def _draw_drop_target(self, surface: pygame.Surface) -> None:
+        """ドラッグ中、カーソル下のセルを枠で示す。"""
+        cell = self.drag_drop.hover_cell
+        if cell is not None:
+            pygame.draw.rect(surface, COLOR_ACCENT_ORANGE, cell_rect(*cell), width=3, border_radius=8)
+
     def _draw_rules_panel(self, surface: pygame.Surface) -> None:
         """グリッド右横にルール（4つの約束）を描画。"""
         # グリッド右端の位置
@@ -270,8 +454,8 @@ class PlayScreen:
         panel_w = SCREEN_WIDTH - panel_x - 12
 
         # 見出し
-        heading = self._font_rule_heading.render(
-            "4つの約束", True, COLOR_ACCENT_ORANGE
+        heading = self.assets.render_text(
+            self._font_rule_heading, "4つの約束", COLOR_ACCENT_ORANGE
         )
         surface.blit(heading, (panel_x + 4, panel_y))
         card_y = panel_y + heading.get_height() + 8
@@ -299,12 +483,12 @@ class PlayScreen:
         badge_size = 20
         badge_rect = pygame.Rect(x + pad, y + pad, badge_size, badge_size)
         pygame.draw.rect(surface, rule["color"], badge_rect, border_radius=10)
-        num_surf = self._font_rule_num.render(str(rule["number"]), True, COLOR_WHITE)
+        num_surf = self.assets.render_text(self._font_rule_num, str(rule["number"]), COLOR_WHITE)
         surface.blit(num_surf, num_surf.get_rect(center=badge_rect.center))
 
         # タイトル
         title_x = x + pad + badge_size + 6
-        title_surf = self._font_rule_title.render(rule["title"], True, rule["color"])
+        title_surf = self.assets.render_text(self._font_rule_title, rule["title"], rule["color"])
         surface.blit(title_surf, (title_x, y + pad + 1))
 
         # 説明（パネル幅に収まるよう折り返し）
@@ -325,21 +509,22 @@ class PlayScreen:
         for ch in text:
             test = line + ch
             if font.size(test)[0] > max_w and line:
-                surf = font.render(line, True, color)
+                surf = self.assets.render_text(font, line, color)
                 surface.blit(surf, (x, y))
                 y += surf.get_height() + 2
                 line = ch
             else:
                 line = test
         if line:
-            surf = font.render(line, True, color)
+            surf = self.assets.render_text(font, line, color)
             surface.blit(surf, (x, y))
 
-    def _draw_footer(self, surface: pygame.Surface) -> None:
+    def _draw_footer_static(self, surface: pygame.Surface) -> None:
         footer_rect = pygame.Rect(0, SCREEN_HEIGHT - 65, SCREEN_WIDTH, 65)
         pygame.draw.rect(surface, COLOR_HEADER_BG, footer_rect)
         pygame.draw.line(surface, (230, 230, 230), (0, SCREEN_HEIGHT - 65), (SCREEN_WIDTH, SCREEN_HEIGHT - 65))
 
+    def _draw_footer(self, surface: pygame.Surface) -> None:
         self.btn_back.draw(surface)
         self.btn_reset.draw(surface)
         self.btn_done.draw(surface)
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import pygame
 
 from src.asset_manager import AssetManager
 from src.model.board import Board
 from src.model.scoring import ScoreResult
+from src.model.solver import generate_solution
 from src.ui.button import Button
 from src.ui.toggle_switch import ToggleSwitch
 from src.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    IDLE_MAX_WAIT_MS,
     GRID_ROWS,
     GRID_COLS,
     DAY_LABELS,
@@ -19,6 +25,7 @@ from src.constants import (
     MENU_NAMES,
     MENU_EMOJI,
     MENU_ICON_KEYS,
+    ICON_SIZE_MINI_MIN,
     MENU_COLORS,
     MENU_BG_COLORS,
     COLOR_WHITE,
@@ -43,6 +50,11 @@ from src.constants import (
     COLOR_HIGHLIGHT_PURPLE,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
 # 違反種別→枠色
 _VIOLATION_COLORS = {
     "duplicate": COLOR_HIGHLIGHT_RED,
@@ -51,6 +63,13 @@ _VIOLATION_COLORS = {
     "curry": COLOR_HIGHLIGHT_PURPLE,
 }
 
+# パネル見出し
+_PLAYER_HEADING = "あなたの献立表"
+_ANSWER_HEADING = "模範解答（コンピュータの回答）"
+
+# 模範解答の生成待ち中に完成を確認する間隔 (ms)
+_ANSWER_POLL_MS = 100
+
 # ミニグリッドレイアウト定数
 _MINI_CELL = 72
 _MINI_GAP = 3
@@ -58,6 +77,36 @@ _MINI_DAY_W = 45
 _MINI_HEADER_H = 18
 
 
+@lru_cache(maxsize=None)
+def _gradient_circle(r: int) -> pygame.Surface:
+    """上から下へ色が遷移する半径 r の円（外側は透明）。
+
+    行ごとの色と円の水平スパンを numpy でまとめて計算し、
+    surfarray で一度に書き込む。
+    """
+    import numpy as np
+
+    size = 2 * r + 1
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    offsets = np.arange(-r, r + 1)  # 中心からの距離（x, y 共通）
+    t = (offsets + r) / (2 * r) if r > 0 else np.zeros(size)
+    start = np.array(COLOR_SCORE_GRADIENT_START, dtype=np.float64)
+    end = np.array(COLOR_SCORE_GRADIENT_END, dtype=np.float64)
+    row_colors = (start * (1 - t[:, None]) + end * t[:, None]).astype(np.uint8)
+    # 円の水平方向のスパン（行ごとの半幅）
+    half_width = np.sqrt(np.maximum(0, r * r - offsets * offsets)).astype(np.int64)
+    # inside[x, y]: 行 y のスパンに x が含まれるか
+    inside = (np.abs(offsets)[:, None] <= half_width[None, :]) & (half_width[None, :] > 0)
+
+    rgb = pygame.surfarray.pixels3d(surf)
+    rgb[:] = row_colors[None, :, :]
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    alpha[:] = np.where(inside, 255, 0).astype(np.uint8)
+    del alpha
+    return surf
+
+
 class ResultScreen:
     """結果確認画面。"""
 
@@ -83,10 +132,12 @@ class ResultScreen:
         # トグルスイッチ
         toggle_font = assets.get_font(14)
         self._bgm_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 220, 8, "BGM", toggle_font, initial=assets.bgm_enabled
+            SCREEN_WIDTH - 220, 8, "BGM", toggle_font,
+            initial=assets.bgm_enabled, assets=assets,
         )
         self._sfx_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 110, 8, "SFX", toggle_font, initial=assets.sfx_enabled
+            SCREEN_WIDTH - 110, 8, "SFX", toggle_font,
+            initial=assets.sfx_enabled, assets=assets,
         )
 
         # フッターボタン
@@ -104,22 +155,53 @@ class ResultScreen:
             hover_color=(230, 110, 0),
             text_color=COLOR_WHITE,
             border_radius=22,
+            assets=self.assets,
         )
 
         self._player_board: Board | None = None
         self._answer_board: Board | None = None
+        self._answer_future: Future[Board] | None = None
         self._score_result: ScoreResult | None = None
 
+        self._static_layer: pygame.Surface | None = None  # 結果表示の合成済み画像
+        self._full_redraw = True  # 次回 draw で画面全体を更新するか
+        self._prev_frame: tuple | None = None  # 前回描画時の動的要素の状態
+
     def set_result(
         self,
         player_board: Board,
         answer_board: Board | None,
         score_result: ScoreResult,
+        answer_future: Future[Board] | None = None,
     ) -> None:
-        """結果データを設定する。"""
+        """結果データを設定する。
+
+        answer_board が未確定の場合は answer_future を渡すと、
+        生成完了後に模範解答を表示する。
+        """
         self._player_board = player_board
         self._answer_board = answer_board
+        self._answer_future = answer_future
         self._score_result = score_result
+        self._static_layer = self._build_static_layer()
+        self.invalidate()
+
+    def _resolve_answer(self) -> None:
+        """生成待ちの模範解答が完成していれば取り込む。
+
+        生成が例外で終わっていたら、全解の数え上げから選び直す。
+        """
+        if self._answer_board is None and self._answer_future is not None:
+            if self._answer_future.done():
+                error = self._answer_future.exception()
+                if error is None:
+                    self._answer_board = self._answer_future.result()
+                else:
+                    logger.warning("Model answer generation failed: %s", error)
+                    self._answer_board = generate_solution(method="exact")
+                self._answer_future = None
+                self._static_layer = self._build_static_layer()
+                self.invalidate()
 
     def handle_event(self, event: pygame.event.Event) -> str | None:
         """イベント処理。'back' を返すとスタート画面へ。"""
@@ -135,15 +217,49 @@ class ResultScreen:
             return "back"
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        surface.fill(COLOR_WHITE)
-
-        if self._score_result is None:
+    def idle_wait_ms(self) -> int | None:
+        """イベントを待って眠ってよい最長時間 (ms)。None なら毎フレーム描画する。
+
+        模範解答の生成待ちの間は、完成を拾えるよう短い間隔で起床する。
+        """
+        if self._answer_board is None and self._answer_future is not None:
+            return _ANSWER_POLL_MS
+        return IDLE_MAX_WAIT_MS
+
+    def invalidate(self) -> None:
+        """次回 draw で画面全体を描き直す。"""
+        self._full_redraw = True
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """画面を描画し、前回から変化した領域（dirty rect）を返す。"""
+        self._resolve_answer()
+        frame = (
+            self.btn_return.hovered,
+            self.assets.bgm_enabled,
+            self.assets.sfx_enabled,
+        )
+        if not self._full_redraw and frame == self._prev_frame:
+            return []
+
+        self._draw_all(surface)
+
+        if self._full_redraw or self._prev_frame is None:
+            dirty = [surface.get_rect()]
+        else:
+            widgets = (self.btn_return.rect, self._bgm_toggle.rect, self._sfx_toggle.rect)
+            dirty = [
+                rect for rect, was, now in zip(widgets, self._prev_frame, frame)
+                if was != now
+            ]
+        self._full_redraw = False
+        self._prev_frame = frame
+        return dirty
+
+    def _draw_all(self, surface: pygame.Surface) -> None:
+        if self._static_layer is None:
+            surface.fill(COLOR_WHITE)
             return
-
-        # トグルスイッチ（最前面に描画するため先にヘッダ）
-        # ヘッダ（スコア領域）
-        self._draw_header(surface)
+        surface.blit(self._static_layer, (0, 0))
 
         # トグルスイッチ（他画面での変更を反映）
         self._bgm_toggle.enabled = self.assets.bgm_enabled
@@ -151,23 +267,57 @@ class ResultScreen:
         self._bgm_toggle.draw(surface)
         self._sfx_toggle.draw(surface)
 
-        # ボディ（2パネル）
-        self._draw_body(surface)
+        self.btn_return.draw(surface)
+
+    def _build_static_layer(self) -> pygame.Surface:
+        """結果表示のうちトグル・ボタン以外をまとめて描いた画像を作る。
 
+        内容は set_result と模範解答の完成時にしか変わらないので、
+        毎フレームはこれを貼るだけで済む。
+        """
+        layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        layer.fill(COLOR_WHITE)
+        # ヘッダ（スコア領域）
+        self._draw_header(layer)
+        # ボディ（2パネル）
+        self._draw_body(layer)
         # フッター
-        self._draw_footer(surface)
+        self._draw_footer(layer)
+        return layer
 
     # ---- ヘッダ: スコア表示 ----
 
     def _header_height(self) -> int:
         """ヘッダの必要高さを計算する。"""
         sr = self._score_result
+        return self._header_height_for(bool(sr and sr.bonus > 0))
+
+    @staticmethod
+    def _header_height_for(has_bonus: bool) -> int:
         # タイトル(8) + タイトル高さ(~30) + スコア円(直径80) + コメント(~20) + 余白
         h = 8 + 30 + 80 + 6 + 20 + 16
-        if sr and sr.bonus > 0:
+        if has_bonus:
             h += 30  # ボーナスバッジ分 + 下マージン
         return h
 
+    def icon_sizes(self) -> set[int]:
+        """ミニグリッドで使いうるアイコンサイズ（ボーナス表示の有無で 2 通り）。
+
+        アイコンアトラスに事前に入れておくために使う。
+        """
+        headings = (
+            (_PLAYER_HEADING, COLOR_RESULT_PLAYER_HEADING),
+            (_ANSWER_HEADING, COLOR_RESULT_ANSWER_HEADING),
+        )
+        sizes = set()
+        for has_bonus in (False, True):
+            panel_rects = self._panel_rects(self._header_height_for(has_bonus))
+            for panel_rect, (heading, color) in zip(panel_rects, headings):
+                heading_h = self.assets.render_text(self._font_heading, heading, color).get_height()
+                cell = self._mini_cell_size(panel_rect, heading_h)
+                sizes.add(max(cell // 2, ICON_SIZE_MINI_MIN))
+        return sizes
+
     def _draw_header(self, surface: pygame.Surface) -> None:
         sr = self._score_result
         header_h = self._header_height()
@@ -180,7 +330,7 @@ class ResultScreen:
         cx = SCREEN_WIDTH // 2
 
         # タイトル "けっか発表！"
-        title = self._font_title.render("けっか発表！", True, COLOR_RESULT_TITLE)
+        title = self.assets.render_text(self._font_title, "けっか発表！", COLOR_RESULT_TITLE)
         title_rect = title.get_rect(centerx=cx, top=8)
         surface.blit(title, title_rect)
 
@@ -191,14 +341,14 @@ class ResultScreen:
         self._draw_score_circle(surface, circle_cx, circle_cy, circle_r, sr.score)
 
         # コメント
-        comment = self._font_comment.render(sr.comment, True, COLOR_RESULT_COMMENT)
+        comment = self.assets.render_text(self._font_comment, sr.comment, COLOR_RESULT_COMMENT)
         comment_rect = comment.get_rect(centerx=cx, top=circle_cy + circle_r + 6)
         surface.blit(comment, comment_rect)
 
         # ボーナスバッジ
         if sr.bonus > 0:
             badge_text = f"早解きボーナス: +{sr.bonus}点"
-            badge_surf = self._font_bonus.render(badge_text, True, COLOR_RESULT_BONUS_TEXT)
+            badge_surf = self.assets.render_text(self._font_bonus, badge_text, COLOR_RESULT_BONUS_TEXT)
             bw = badge_surf.get_width() + 20
             bh = 22
             badge_rect = pygame.Rect(cx - bw // 2, comment_rect.bottom + 4, bw, bh)
@@ -212,57 +362,53 @@ class ResultScreen:
         self, surface: pygame.Surface, cx: int, cy: int, r: int, score: int
     ) -> None:
         """グラデーション風スコア円を描画。"""
-        # 単色で代用（pygame にはネイティブグラデーションなし）
-        # 上から下に色を遷移させる簡易グラデーション
-        for dy in range(-r, r + 1):
-            t = (dy + r) / (2 * r) if r > 0 else 0
-            color = tuple(
-                int(COLOR_SCORE_GRADIENT_START[i] * (1 - t) + COLOR_SCORE_GRADIENT_END[i] * t)
-                for i in range(3)
-            )
-            # 円の水平方向のスパン
-            import math
-
-            dx = int(math.sqrt(max(0, r * r - dy * dy)))
-            if dx > 0:
-                pygame.draw.line(surface, color, (cx - dx, cy + dy), (cx + dx, cy + dy))
+        circle = _gradient_circle(r)
+        surface.blit(circle, circle.get_rect(center=(cx, cy)))
 
         # スコア数字
-        score_text = self._font_score.render(str(score), True, COLOR_WHITE)
+        score_text = self.assets.render_text(self._font_score, str(score), COLOR_WHITE)
         score_rect = score_text.get_rect(centerx=cx, centery=cy - 4)
         surface.blit(score_text, score_rect)
 
         # "てん"
-        unit = self._font_score_unit.render("てん", True, (255, 255, 255, 200))
+        unit = self.assets.render_text(self._font_score_unit, "てん", (255, 255, 255, 200))
         unit_rect = unit.get_rect(centerx=cx, top=score_rect.bottom - 2)
         surface.blit(unit, unit_rect)
 
     # ---- ボディ: 2パネル ----
 
-    def _draw_body(self, surface: pygame.Surface) -> None:
-        body_top = self._header_height() + 5
+    def _panel_rects(self, header_h: int) -> tuple[pygame.Rect, pygame.Rect]:
+        """左右パネルの矩形。"""
+        body_top = header_h + 5
         body_h = SCREEN_HEIGHT - body_top - 70
         panel_gap = 16
         panel_pad = 16
         panel_w = (SCREEN_WIDTH - panel_gap * 3) // 2
+        left_x = panel_pad
+        right_x = left_x + panel_w + panel_gap
+        return (
+            pygame.Rect(left_x, body_top, panel_w, body_h),
+            pygame.Rect(right_x, body_top, panel_w, body_h),
+        )
+
+    def _draw_body(self, surface: pygame.Surface) -> None:
+        left_rect, right_rect = self._panel_rects(self._header_height())
 
         # 左パネル: プレイヤーの献立表
-        left_x = panel_pad
         self._draw_panel(
             surface,
-            pygame.Rect(left_x, body_top, panel_w, body_h),
-            "あなたの献立表",
+            left_rect,
+            _PLAYER_HEADING,
             COLOR_RESULT_PLAYER_HEADING,
             self._player_board,
             show_violations=True,
         )
 
         # 右パネル: 模範解答
-        right_x = left_x + panel_w + panel_gap
         self._draw_panel(
             surface,
-            pygame.Rect(right_x, body_top, panel_w, body_h),
-            "模範解答（コンピュータの回答）",
+            right_rect,
+            _ANSWER_HEADING,
             COLOR_RESULT_ANSWER_HEADING,
             self._answer_board,
             show_violations=False,
@@ -286,29 +432,21 @@ class ResultScreen:
         inner_y = panel_rect.y + pad
 
         # 見出し（中央揃え）
-        heading_surf = self._font_heading.render(heading, True, heading_color)
+        heading_surf = self.assets.render_text(self._font_heading, heading, heading_color)
         heading_rect = heading_surf.get_rect(centerx=panel_rect.centerx, top=inner_y)
         surface.blit(heading_surf, heading_rect)
         grid_top = inner_y + heading_surf.get_height() + 8
 
         if board is None:
-            na = self._font_comment.render("データなし", True, (150, 150, 150))
+            message = "模範解答を作成中…" if self._answer_future is not None else "データなし"
+            na = self.assets.render_text(self._font_comment, message, (150, 150, 150))
             surface.blit(na, na.get_rect(center=panel_rect.center))
             return
 
         # ミニグリッド描画
         grid_y = grid_top
         avail_w = panel_rect.width - pad * 2
-        avail_h = panel_rect.height - pad - (grid_top - panel_rect.y)
-
-        # 違反一覧のスペースを予約（両パネル統一サイズ）
-        penalty_reserve = 5 * 17 + 8
-        avail_h -= penalty_reserve
-
-        # セルサイズを利用可能な領域に合わせて計算
-        cell_w = (avail_w - _MINI_DAY_W - _MINI_GAP * (GRID_COLS - 1)) // GRID_COLS
-        cell_h = (avail_h - _MINI_HEADER_H - _MINI_GAP * (GRID_ROWS - 1)) // GRID_ROWS
-        cell = min(cell_w, cell_h, _MINI_CELL)
+        cell = self._mini_cell_size(panel_rect, heading_surf.get_height())
 
         # グリッド全体幅を計算し、パネル内で中央揃え
         grid_total_w = _MINI_DAY_W + GRID_COLS * cell + (GRID_COLS - 1) * _MINI_GAP
@@ -321,6 +459,23 @@ class ResultScreen:
             penalty_y = grid_y + _MINI_HEADER_H + GRID_ROWS * (cell + _MINI_GAP) + 4
             self._draw_penalty_summary(surface, grid_x, penalty_y, avail_w)
 
+    @staticmethod
+    def _mini_cell_size(panel_rect: pygame.Rect, heading_h: int) -> int:
+        """パネルに収まるミニグリッドのセルサイズ。"""
+        pad = 12
+        grid_top = panel_rect.y + pad + heading_h + 8
+        avail_w = panel_rect.width - pad * 2
+        avail_h = panel_rect.height - pad - (grid_top - panel_rect.y)
+
+        # 違反一覧のスペースを予約（両パネル統一サイズ）
+        penalty_reserve = 5 * 17 + 8
+        avail_h -= penalty_reserve
+
+        # セルサイズを利用可能な領域に合わせて計算
+        cell_w = (avail_w - _MINI_DAY_W - _MINI_GAP * (GRID_COLS - 1)) // GRID_COLS
+        cell_h = (avail_h - _MINI_HEADER_H - _MINI_GAP * (GRID_ROWS - 1)) // GRID_ROWS
+        return min(cell_w, cell_h, _MINI_CELL)
+
     def _draw_mini_grid(
         self,
         surface: pygame.Surface,
@@ -334,7 +489,7 @@ class ResultScreen:
         # ブロックヘッダ
         for c in range(GRID_COLS):
             cx = gx + _MINI_DAY_W + c * (cell + _MINI_GAP) + cell // 2
-            label = self._font_block.render(BLOCK_LABELS[c], True, COLOR_BLOCK_LABEL)
+            label = self.assets.render_text(self._font_block, BLOCK_LABELS[c], COLOR_BLOCK_LABEL)
             lr = label.get_rect(centerx=cx, top=gy)
             surface.blit(label, lr)
 
@@ -354,7 +509,7 @@ class ResultScreen:
             # 曜日ラベル
             day_rect = pygame.Rect(gx, ry, _MINI_DAY_W - 4, cell)
             pygame.draw.rect(surface, COLOR_DAY_LABEL_BG, day_rect, border_radius=3)
-            day_label = self._font_day.render(DAY_LABELS[r], True, COLOR_DAY_LABEL_TEXT)
+            day_label = self.assets.render_text(self._font_day, DAY_LABELS[r], COLOR_DAY_LABEL_TEXT)
             surface.blit(day_label, day_label.get_rect(center=day_rect.center))
 
             for c in range(GRID_COLS):
@@ -365,7 +520,7 @@ class ResultScreen:
                 if menu_id is None:
                     # 空セル
                     pygame.draw.rect(surface, COLOR_CELL_EMPTY, rect, border_radius=6)
-                    q = self._font_menu.render("？", True, COLOR_CELL_PLUS)
+                    q = self.assets.render_text(self._font_menu, "？", COLOR_CELL_PLUS)
                     surface.blit(q, q.get_rect(center=rect.center))
                 else:
                     bg = MENU_BG_COLORS.get(menu_id, COLOR_CELL_EMPTY)
@@ -373,7 +528,7 @@ class ResultScreen:
 
                     # アイコン画像（欠損時は絵文字フォールバック）
                     icon_key = MENU_ICON_KEYS.get(menu_id)
-                    icon_sz = max(cell // 2, 24)
+                    icon_sz = max(cell // 2, ICON_SIZE_MINI_MIN)
                     icon = self.assets.get_icon(icon_key, (icon_sz, icon_sz)) if icon_key else None
 
                     if icon is not None:
@@ -383,7 +538,7 @@ class ResultScreen:
                         surface.blit(icon, img_rect)
                     else:
                         emoji_text = MENU_EMOJI.get(menu_id, "?")
-                        emoji_surf = self._font_emoji.render(emoji_text, True, (10, 10, 10))
+                        emoji_surf = self.assets.render_text(self._font_emoji, emoji_text, (10, 10, 10))
                         img_rect = emoji_surf.get_rect(
                             centerx=rect.centerx, centery=rect.centery - 6
                         )
@@ -392,7 +547,7 @@ class ResultScreen:
                     # メニュー名
                     name = MENU_NAMES.get(menu_id, "?")
                     text_color = MENU_COLORS.get(menu_id, (10, 10, 10))
-                    name_surf = self._font_menu.render(name, True, text_color)
+                    name_surf = self.assets.render_text(self._font_menu, name, text_color)
                     name_rect = name_surf.get_rect(
                         centerx=rect.centerx, top=img_rect.bottom + 1
                     )
@@ -426,13 +581,14 @@ class ResultScreen:
             pygame.draw.rect(surface, kind_color, marker_rect, border_radius=2)
 
             text = f"{p.label}: {p.count}件 (-{p.total}点)"
-            text_surf = self._font_penalty.render(text, True, COLOR_RESULT_COMMENT)
+            text_surf = self.assets.render_text(self._font_penalty, text, COLOR_RESULT_COMMENT)
             surface.blit(text_surf, (x + 14, cur_y))
             cur_y += text_surf.get_height() + 3
 
     # ---- フッター ----
 
     def _draw_footer(self, surface: pygame.Surface) -> None:
+        """フッター背景（ボタンは毎フレーム _draw_all で描く）。"""
         footer_h = 65
         footer_rect = pygame.Rect(0, SCREEN_HEIGHT - footer_h, SCREEN_WIDTH, footer_h)
         pygame.draw.rect(surface, COLOR_HEADER_BG, footer_rect)
@@ -442,4 +598,3 @@ class ResultScreen:
             (0, SCREEN_HEIGHT - footer_h),
             (SCREEN_WIDTH, SCREEN_HEIGHT - footer_h),
         )
-        self.btn_return.draw(surface)
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import pygame
 
-from src.asset_manager import AssetManager
+from src.asset_manager import AssetManager, PreloadProgress
 from src.ui.button import Button
 from src.ui.toggle_switch import ToggleSwitch
 from src.constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
+    IDLE_MAX_WAIT_MS,
     COLOR_BG,
     COLOR_ACCENT_ORANGE,
     COLOR_ACCENT_SUB,
@@ -23,6 +24,7 @@ from src.constants import (
     MENU_COLORS,
     MENU_BG_COLORS,
     MENU_ICON_KEYS,
+    ICON_SIZE_START,
     MENU_KARAAGE,
     MENU_EBI_FRY,
     MENU_CURRY_UDON,
@@ -36,6 +38,11 @@ from src.constants import (
     RULES,
 )
 
+# スタートボタンの文言
+_START_LABEL = "ゲームスタート！"
+# アセット読み込み中に進捗を確認する間隔 (ms)
+_PRELOAD_POLL_MS = 50
+
 
 class StartScreen:
     """スタート画面の描画とイベント処理。"""
@@ -55,10 +62,12 @@ class StartScreen:
         # トグルスイッチ
         toggle_font = assets.get_font(14)
         self._bgm_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 220, 8, "BGM", toggle_font, initial=assets.bgm_enabled
+            SCREEN_WIDTH - 220, 8, "BGM", toggle_font,
+            initial=assets.bgm_enabled, assets=assets,
         )
         self._sfx_toggle = ToggleSwitch(
-            SCREEN_WIDTH - 110, 8, "SFX", toggle_font, initial=assets.sfx_enabled
+            SCREEN_WIDTH - 110, 8, "SFX", toggle_font,
+            initial=assets.sfx_enabled, assets=assets,
         )
 
         # スタートボタン
@@ -67,14 +76,38 @@ class StartScreen:
         btn_y = SCREEN_HEIGHT - 75
         self.start_button = Button(
             rect=pygame.Rect(btn_x, btn_y, btn_w, btn_h),
-            text="ゲームスタート！",
+            text=_START_LABEL,
             font=self._font_large,
             color=COLOR_BUTTON_START,
             hover_color=COLOR_BUTTON_START_HOVER,
             text_color=COLOR_BUTTON_TEXT,
             border_radius=16,
+            assets=self.assets,
         )
 
+        self._preload: PreloadProgress | None = None  # 読み込み待ちのアセット
+        self._full_redraw = True  # 次回 draw で画面全体を更新するか
+        self._prev_frame: tuple | None = None  # 前回描画時の動的要素の状態
+
+    def set_preload(self, progress: PreloadProgress | None) -> None:
+        """アセット一括読み込みの進捗を渡す。完了までスタートボタンを押せなくする。"""
+        self._preload = progress
+        self._sync_start_button()
+
+    def _sync_start_button(self) -> None:
+        """読み込みの進捗をスタートボタンの状態と文言に反映する。"""
+        progress = self._preload
+        if progress is None:
+            return
+        progress.update()  # 読み終わったアセットをこのスレッドで仕上げる
+        if progress.done:
+            self._preload = None
+            self.start_button.enabled = True
+            self.start_button.text = _START_LABEL
+        else:
+            self.start_button.enabled = False
+            self.start_button.text = f"よみこみ中… {int(progress.fraction * 100)}%"
+
     @staticmethod
     def _load_emoji_font(size: int) -> pygame.font.Font:
         """絵文字表示用フォントを読み込む。"""
@@ -92,12 +125,52 @@ class StartScreen:
         if sfx_state is not None:
             self.assets.set_sfx_enabled(sfx_state)
 
+        self._sync_start_button()
         if self.start_button.handle_event(event):
             self.assets.play_sound("button_click")
             return True
         return False
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def idle_wait_ms(self) -> int | None:
+        """イベントを待って眠ってよい最長時間 (ms)。None なら毎フレーム描画する。
+
+        スタート画面はホバー以外に変化しないのでアイドル。
+        アセットの読み込み中は進捗表示のために短い間隔で起床する。
+        """
+        if self._preload is not None:
+            return _PRELOAD_POLL_MS
+        return IDLE_MAX_WAIT_MS
+
+    def invalidate(self) -> None:
+        """次回 draw で画面全体を描き直す。"""
+        self._full_redraw = True
+
+    def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """画面を描画し、前回から変化した領域（dirty rect）を返す。"""
+        self._sync_start_button()
+        frame = (
+            (self.start_button.hovered, self.start_button.enabled, self.start_button.text),
+            self.assets.bgm_enabled,
+            self.assets.sfx_enabled,
+        )
+        if not self._full_redraw and frame == self._prev_frame:
+            return []
+
+        self._draw_all(surface)
+
+        if self._full_redraw or self._prev_frame is None:
+            dirty = [surface.get_rect()]
+        else:
+            widgets = (self.start_button.rect, self._bgm_toggle.rect, self._sfx_toggle.rect)
+            dirty = [
+                rect for rect, was, now in zip(widgets, self._prev_frame, frame)
+                if was != now
+            ]
+        self._full_redraw = False
+        self._prev_frame = frame
+        return dirty
+
+    def _draw_all(self, surface: pygame.Surface) -> None:
         surface.fill(COLOR_BG)
 
         cx = SCREEN_WIDTH // 2
@@ -126,8 +199,8 @@ class StartScreen:
 
     def _draw_title(self, surface: pygame.Surface, cx: int, y: int) -> int:
         title_text = "献立表パズル"
-        title_surf = self._font_title.render(title_text, True, COLOR_ACCENT_ORANGE)
-        emoji_surf = self._font_emoji.render("\U0001f371", True, (10, 10, 10))
+        title_surf = self.assets.render_text(self._font_title, title_text, COLOR_ACCENT_ORANGE)
+        emoji_surf = self.assets.render_text(self._font_emoji, "\U0001f371", (10, 10, 10))
 
         gap = 10
         total_w = emoji_surf.get_width() + gap + title_surf.get_width() + gap + emoji_surf.get_width()
@@ -141,7 +214,7 @@ class StartScreen:
         y += max(title_surf.get_height(), emoji_surf.get_height()) + 4
 
         sub_text = "制限時間内に、ルールを守って献立表を完成させよう！"
-        sub_surf = self._font_medium.render(sub_text, True, COLOR_ACCENT_SUB)
+        sub_surf = self.assets.render_text(self._font_medium, sub_text, COLOR_ACCENT_SUB)
         sub_rect = sub_surf.get_rect(centerx=cx, top=y)
         surface.blit(sub_surf, sub_rect)
 
@@ -155,7 +228,7 @@ class StartScreen:
         pygame.draw.rect(surface, COLOR_WHITE, section_rect, border_radius=12)
         pygame.draw.rect(surface, (230, 230, 230), section_rect, width=1, border_radius=12)
 
-        heading = self._font_medium.render("使えるメニュー（5種類）", True, COLOR_ACCENT_ORANGE)
+        heading = self.assets.render_text(self._font_medium, "使えるメニュー（5種類）", COLOR_ACCENT_ORANGE)
         heading_rect = heading.get_rect(centerx=cx, top=y + 10)
         surface.blit(heading, heading_rect)
 
@@ -176,7 +249,7 @@ class StartScreen:
         total_w = len(menu_ids) * card_w + (len(menu_ids) - 1) * gap
         start_x = cx - total_w // 2
 
-        icon_size = (28, 28)
+        icon_size = (ICON_SIZE_START, ICON_SIZE_START)
         for i, mid in enumerate(menu_ids):
             x = start_x + i * (card_w + gap)
             bg_color = MENU_BG_COLORS[mid]
@@ -187,17 +260,17 @@ class StartScreen:
             name = MENU_NAMES[mid]
             icon_key = MENU_ICON_KEYS.get(mid)
             icon_surf = self.assets.get_icon(icon_key, icon_size) if icon_key else None
-            name_surf = self._font_small.render(name, True, text_color)
+            name_surf = self.assets.render_text(self._font_small, name, text_color)
 
             # アイコンが読み込めない場合は絵文字にフォールバック
             if icon_surf is None:
                 emoji = MENU_EMOJI[mid]
-                icon_surf = self._font_emoji_small.render(emoji, True, (10, 10, 10))
+                icon_surf = self.assets.render_text(self._font_emoji_small, emoji, (10, 10, 10))
 
             content_w = icon_surf.get_width() + 4 + name_surf.get_width()
             badge_surf = None
             if mid in FRIED_FOODS:
-                badge_surf = self._font_small.render("揚げ物", True, COLOR_WHITE)
+                badge_surf = self.assets.render_text(self._font_small, "揚げ物", COLOR_WHITE)
                 content_w += 4 + badge_surf.get_width() + 10
 
             content_x = x + (card_w - content_w) // 2
@@ -226,7 +299,7 @@ class StartScreen:
         pygame.draw.rect(surface, COLOR_WHITE, section_rect, border_radius=12)
         pygame.draw.rect(surface, (230, 230, 230), section_rect, width=1, border_radius=12)
 
-        heading = self._font_medium.render("ルール（4つの約束）", True, (230, 0, 118))
+        heading = self.assets.render_text(self._font_medium, "ルール（4つの約束）", (230, 0, 118))
         heading_rect = heading.get_rect(centerx=cx, top=y + 10)
         surface.blit(heading, heading_rect)
 
@@ -246,20 +319,20 @@ class StartScreen:
         badge_size = 24
         badge_rect = pygame.Rect(x + 10, y + (h - badge_size) // 2, badge_size, badge_size)
         pygame.draw.rect(surface, rule["color"], badge_rect, border_radius=12)
-        num_surf = self._font_small.render(str(rule["number"]), True, COLOR_WHITE)
+        num_surf = self.assets.render_text(self._font_small, str(rule["number"]), COLOR_WHITE)
         num_rect = num_surf.get_rect(center=badge_rect.center)
         surface.blit(num_surf, num_rect)
 
-        title_surf = self._font_small.render(rule["title"], True, rule["color"])
+        title_surf = self.assets.render_text(self._font_small, rule["title"], rule["color"])
         surface.blit(title_surf, (x + 44, y + 8))
 
         desc_font = self.assets.get_font(14)
-        desc_surf = desc_font.render(rule["desc"], True, COLOR_TEXT_SUB)
+        desc_surf = self.assets.render_text(desc_font, rule["desc"], COLOR_TEXT_SUB)
         surface.blit(desc_surf, (x + 44, y + 30))
 
     def _draw_footer_info(self, surface: pygame.Surface, cx: int) -> None:
         y = self.start_button.rect.top - 28
         info_text = "制限時間 3:00  |  早く完成すると ボーナス点"
-        info_surf = self._font_small.render(info_text, True, COLOR_TEXT_SUB)
+        info_surf = self.assets.render_text(self._font_small, info_text, COLOR_TEXT_SUB)
         info_rect = info_surf.get_rect(centerx=cx, top=y)
         surface.blit(info_surf, info_rect)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import pygame
 
 from src.asset_manager import AssetManager
@@ -54,6 +56,14 @@ class Timer:
             return True
         return False
 
+    def ms_until_change(self) -> int | None:
+        """表示（秒）が次に変わるまでのミリ秒。停止中なら None。"""
+        if not self._running or self._expired:
+            return None
+        fraction = self._remaining - int(self._remaining)
+        # 小数部がちょうど 0 のときは、わずかでも進めば表示が変わる
+        return math.ceil(fraction * 1000) if fraction > 0 else 1
+
     def format_time(self) -> str:
         secs = self.remaining_int
         m, s = divmod(secs, 60)
@@ -62,6 +72,6 @@ class Timer:
     def draw(self, surface: pygame.Surface, cx: int, y: int) -> None:
         time_str = self.format_time()
         color = (220, 38, 38) if self.remaining_int <= 30 else COLOR_TIMER_TEXT
-        text = self._font.render(time_str, True, color)
+        text = self.assets.render_text(self._font, time_str, color)
         rect = text.get_rect(centerx=cx, centery=y)
         surface.blit(text, rect)
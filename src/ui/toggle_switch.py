@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pygame
 
+if TYPE_CHECKING:
+    from src.asset_manager import AssetManager
+
 
 class ToggleSwitch:
     """ラベル付きトグルスイッチ。"""
@@ -22,13 +27,15 @@ class ToggleSwitch:
         label: str,
         font: pygame.font.Font,
         initial: bool = True,
+        assets: AssetManager | None = None,
     ) -> None:
         self._enabled = initial
         self._label = label
         self._font = font
+        self._assets = assets
 
         # ラベルをスイッチの左に配置
-        label_surf = font.render(label, True, (60, 60, 60))
+        label_surf = self._render_label()
         self._label_w = label_surf.get_width()
         self._label_x = x
         self._label_y = y + (self._H - label_surf.get_height()) // 2
@@ -36,6 +43,13 @@ class ToggleSwitch:
         self._switch_x = x + self._label_w + 6
         self._switch_y = y
         self._rect = pygame.Rect(self._switch_x, self._switch_y, self._W, self._H)
+        label_rect = pygame.Rect(self._label_x, self._label_y, self._label_w, label_surf.get_height())
+        self._bounds = self._rect.union(label_rect)
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """ラベルを含む描画範囲。"""
+        return self._bounds
 
     @property
     def enabled(self) -> bool:
@@ -53,9 +67,14 @@ class ToggleSwitch:
                 return self._enabled
         return None
 
+    def _render_label(self) -> pygame.Surface:
+        if self._assets is not None:
+            return self._assets.render_text(self._font, self._label, (60, 60, 60))
+        return self._font.render(self._label, True, (60, 60, 60))
+
     def draw(self, surface: pygame.Surface) -> None:
         # ラベル
-        label_surf = self._font.render(self._label, True, (60, 60, 60))
+        label_surf = self._render_label()
         surface.blit(label_surf, (self._label_x, self._label_y))
 
         # スイッチ背景（角丸）
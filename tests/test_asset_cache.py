@@ -0,0 +1,103 @@
+"""asset_cache.py の単体テスト"""
+
+import os
+import threading
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.asset_cache import AssetCache, ASSET_CACHE_ENV, default_cache_dir  # noqa: E402
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "icon.src"
+    path.write_bytes(b"original")
+    return str(path)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AssetCache(str(tmp_path / "cache"))
+
+
+class TestAssetCache:
+    def test_roundtrip(self, cache, source):
+        assert cache.get("k", [source]) is None
+        cache.put("k", [source], {"n": 1}, b"payload")
+        assert cache.get("k", [source]) == ({"n": 1}, b"payload")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_names_are_separate(self, cache, source):
+        cache.put("a", [source], {}, b"A")
+        assert cache.get("b", [source]) is None
+
+    def test_content_change_invalidates(self, cache, source):
+        cache.put("k", [source], {}, b"payload")
+        with open(source, "wb") as f:
+            f.write(b"modified!")
+        assert cache.get("k", [source]) is None
+
+    def test_touch_without_change_stays_valid(self, cache, source):
+        cache.put("k", [source], {}, b"payload")
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+        assert cache.get("k", [source]) == ({}, b"payload")
+        # 更新時刻は記録し直され、次回はハッシュ計算なしで一致する
+        assert cache._read("k")["sources"][0]["mtime_ns"] == st.st_mtime_ns + 5_000_000_000
+
+    def test_missing_source_invalidates(self, cache, source):
+        cache.put("k", [source], {}, b"payload")
+        os.remove(source)
+        assert cache.get("k", [source]) is None
+
+    def test_corrupt_entry_is_a_miss(self, cache, source):
+        cache.put("k", [source], {}, b"payload")
+        with open(cache._entry_path("k"), "wb") as f:
+            f.write(b"garbage")
+        assert cache.get("k", [source]) is None
+
+    def test_surface_roundtrip(self, cache, source):
+        surf = pygame.Surface((3, 2), pygame.SRCALPHA)
+        surf.fill((10, 20, 30, 128))
+        surf.set_at((2, 1), (200, 100, 50, 255))
+        cache.store_surface("img", [source], surf, {"keys": ["a"]})
+        loaded, meta = cache.load_surface("img", [source])
+        assert meta["keys"] == ["a"]
+        assert loaded.get_size() == (3, 2)
+        assert pygame.image.tobytes(loaded, "RGBA") == pygame.image.tobytes(surf, "RGBA")
+
+    def test_concurrent_writes_of_same_entry(self, cache, source):
+        payloads = [bytes([i]) * 1_000_000 for i in range(8)]
+        barrier = threading.Barrier(len(payloads))
+        results = []
+
+        def store(payload):
+            barrier.wait()
+            for _ in range(20):
+                cache.put("k", [source], {"n": payload[0]}, payload)
+                entry = cache.get("k", [source])
+                if entry is not None:
+                    results.append(entry)
+
+        threads = [threading.Thread(target=store, args=(p,)) for p in payloads]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        results.append(cache.get("k", [source]))
+        # 読めたエントリは常にどれか1スレッドの書き込みそのもの
+        for meta, payload in results:
+            assert payload == payloads[meta["n"]]
+        assert [n for n in os.listdir(cache.directory) if n.endswith(".tmp")] == []
+
+
+class TestDefaultCacheDir:
+    def test_env_override(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(ASSET_CACHE_ENV, str(tmp_path))
+        assert default_cache_dir() == str(tmp_path)
+
+    def test_env_off(self, monkeypatch):
+        monkeypatch.setenv(ASSET_CACHE_ENV, "off")
+        assert default_cache_dir() is None
@@ -0,0 +1,158 @@
+"""asset_manager.py の単体テスト"""
+
+import os
+from concurrent.futures import wait as futures_wait
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.asset_manager import AssetManager, BgmCache, IconAtlas, TextCache  # noqa: E402
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 16)
+
+
+class TestTextCache:
+    def test_hit_returns_same_surface(self, font):
+        cache = TextCache()
+        first = cache.render(font, "abc", (10, 10, 10))
+        second = cache.render(font, "abc", (10, 10, 10))
+        assert first is second
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_key_includes_color_and_antialias(self, font):
+        cache = TextCache()
+        cache.render(font, "abc", (10, 10, 10))
+        cache.render(font, "abc", (200, 0, 0))
+        cache.render(font, "abc", (10, 10, 10), antialias=False)
+        assert cache.misses == 3
+        assert len(cache) == 3
+
+    def test_lru_eviction(self, font):
+        cache = TextCache(max_entries=2)
+        a = cache.render(font, "a", (0, 0, 0))
+        cache.render(font, "b", (0, 0, 0))
+        cache.render(font, "a", (0, 0, 0))  # "a" を最新に
+        cache.render(font, "c", (0, 0, 0))  # 最古の "b" を追い出す
+        assert len(cache) == 2
+        assert cache.render(font, "a", (0, 0, 0)) is a
+        misses = cache.misses
+        cache.render(font, "b", (0, 0, 0))
+        assert cache.misses == misses + 1
+
+    def test_clear(self, font):
+        cache = TextCache()
+        cache.render(font, "abc", (0, 0, 0))
+        cache.render(font, "abc", (0, 0, 0))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def _gradient_icon(size, color):
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    for y in range(size):
+        surf.fill((*color, y * 255 // (size - 1)), pygame.Rect(0, y, size, 1))
+    return surf
+
+
+class TestIconAtlas:
+    def test_every_size_is_a_subsurface_of_one_texture(self):
+        sources = {"a": _gradient_icon(64, (200, 10, 10)), "b": _gradient_icon(64, (10, 200, 10))}
+        atlas = IconAtlas.build(sources, [56, 44, 32])
+        for key in sources:
+            for size in (56, 44, 32):
+                icon = atlas.get(key, size)
+                assert icon.get_size() == (size, size)
+                assert icon.get_parent() is atlas.surface
+        assert atlas.get("a", 20) is None
+        assert ("b", 44) in atlas
+
+    def test_pixels_match_smoothscale(self):
+        source = _gradient_icon(64, (30, 60, 200))
+        atlas = IconAtlas.build({"a": source, "b": source}, [44, 28])
+        for size in (44, 28):
+            expected = pygame.transform.smoothscale(source, (size, size))
+            actual = atlas.get("b", size)
+            assert pygame.image.tobytes(actual.copy(), "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+
+class TestPreload:
+    def test_loads_every_entry_and_reports_progress(self, font):
+        assets = AssetManager(base_path=_REPO_ROOT)
+        config = assets._config
+        progress = assets.preload(font_sizes=(12, 14))
+        assert progress.wait(timeout=30)
+        assert progress.done
+        assert progress.fraction == 1.0
+        # フォントはファイルを1回読むだけなので、サイズ数によらず1タスク
+        expected = len(config["icons"]) + len(config["sounds"]) + len(config["bgm"]) + 1
+        assert progress.total == progress.completed == expected
+        assert set(config["icons"]) <= set(assets._images)
+        assert set(config["sounds"]) <= set(assets._sounds)
+        assert assets.get_font(12) is assets.get_font(12)
+
+    def test_workers_do_not_publish(self, font):
+        assets = AssetManager(base_path=_REPO_ROOT)
+        progress = assets.preload(font_sizes=(12,))
+        futures_wait([future for future, _ in progress._pending], timeout=30)
+        # Surface の変換や Sound・Font の生成は update() を呼んだスレッドで行う
+        assert assets._images == {} and assets._sounds == {} and assets._font_cache == {}
+        assert progress.completed == 0 and not progress.done
+        progress.update()
+        assert progress.done
+        assert set(assets._config["icons"]) <= set(assets._images)
+        assert (assets._font_path(), 12) in assets._font_cache
+
+    def test_nothing_to_load_is_done(self, tmp_path):
+        assets = AssetManager(base_path=str(tmp_path))
+        progress = assets.preload()
+        assert progress.done
+        assert progress.fraction == 1.0
+
+
+class TestBgmCache:
+    def test_evicts_least_recent_over_budget(self):
+        cache = BgmCache(budget=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")  # "a" を最新に
+        cache.put("c", b"1234")  # 合計 12 > 10 なので最古の "b" を捨てる
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.size_bytes == 8
+
+    def test_rejects_track_larger_than_budget(self):
+        cache = BgmCache(budget=3)
+        assert not cache.put("a", b"1234")
+        assert cache.get("a") is None
+        assert cache.size_bytes == 0
+
+
+class TestBgmPath:
+    def _assets(self, tmp_path, files):
+        (tmp_path / "assets" / "bgm").mkdir(parents=True)
+        (tmp_path / "assets" / "config.json").write_text(
+            '{"bgm": {"opening": "assets/bgm/Opening.wav"}}', encoding="utf-8"
+        )
+        for name in files:
+            (tmp_path / "assets" / "bgm" / name).write_bytes(b"data")
+        return AssetManager(base_path=str(tmp_path))
+
+    def test_prefers_ogg_with_same_key(self, tmp_path):
+        assets = self._assets(tmp_path, ["Opening.wav", "Opening.ogg"])
+        assert assets._bgm_path("opening").endswith("Opening.ogg")
+
+    def test_falls_back_to_configured_file(self, tmp_path):
+        assets = self._assets(tmp_path, ["Opening.wav"])
+        assert assets._bgm_path("opening").endswith("Opening.wav")
+
+    def test_missing(self, tmp_path):
+        assets = self._assets(tmp_path, [])
+        assert assets._bgm_path("opening") is None
+        assert assets._bgm_path("unknown") is None
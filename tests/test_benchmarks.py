@@ -0,0 +1,32 @@
+"""benchmarks/harness.py の単体テスト"""
+
+from benchmarks.harness import Case, compare, measure
+
+
+class TestMeasure:
+    def test_warm_case_calibrates_number(self):
+        calls = []
+        stats = measure(Case("noop", lambda: calls.append(1), repeat=3), min_sample_seconds=0.001)
+        assert stats["repeat"] == 3
+        assert stats["number"] >= 1
+        assert not stats["cold"]
+        assert stats["min"] <= stats["median"]
+
+    def test_cold_case_runs_setup_before_each_sample(self):
+        order = []
+        case = Case("cold", lambda: order.append("run"), setup=lambda: order.append("setup"), repeat=2)
+        stats = measure(case)
+        assert order == ["setup", "run", "setup", "run"]
+        assert stats["number"] == 1
+        assert stats["cold"]
+
+
+class TestCompare:
+    def test_flags_regressions_above_threshold(self):
+        baseline = {"a": {"median": 1.0}, "b": {"median": 1.0}, "gone": {"median": 1.0}}
+        results = {"a": {"median": 1.2}, "b": {"median": 1.3}, "new": {"median": 5.0}}
+        rows = {row["name"]: row for row in compare(results, baseline, threshold=0.25)}
+        assert set(rows) == {"a", "b"}
+        assert not rows["a"]["regression"]
+        assert rows["b"]["regression"]
+        assert rows["b"]["ratio"] == 1.3
@@ -2,7 +2,15 @@
 
 import pytest
 from src.model.board import Board
-from src.constants import GRID_ROWS, GRID_COLS, MENU_KARAAGE, MENU_CHIRASHI
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_KARAAGE,
+    MENU_EBI_FRY,
+    MENU_CHIRASHI,
+    MENU_CURRY_UDON,
+    MENU_CURRY_RICE,
+)
 
 
 class TestBoard:
@@ -77,3 +85,134 @@ class TestBoard:
             board.place(5, 0, MENU_KARAAGE)
         with pytest.raises(IndexError):
             board.remove(0, 5)
+
+    def test_invalid_menu_id(self):
+        board = Board()
+        with pytest.raises(ValueError):
+            board.place(0, 0, 5)
+        with pytest.raises(ValueError):
+            board.place(0, 0, -1)
+
+    def test_move_out_of_bounds(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        with pytest.raises(IndexError):
+            board.move(0, 0, 5, 5)
+        assert board.get(0, 0) == MENU_KARAAGE
+
+    def test_grid_matches_get(self):
+        board = Board()
+        board.place(1, 3, MENU_EBI_FRY)
+        board.place(4, 0, MENU_CHIRASHI)
+        grid = board.grid
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                assert grid[r][c] == board.get(r, c)
+
+
+class TestBoardCounts:
+    def test_counts_follow_place_and_remove(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(0, 1, MENU_KARAAGE)
+        board.place(1, 0, MENU_CHIRASHI)
+        assert board.row_count(0, MENU_KARAAGE) == 2
+        assert board.col_count(0, MENU_KARAAGE) == 1
+        assert board.col_count(0, MENU_CHIRASHI) == 1
+        board.remove(0, 1)
+        assert board.row_count(0, MENU_KARAAGE) == 1
+        assert board.empty_count() == 23
+
+    def test_overwrite_updates_counts(self):
+        board = Board()
+        board.place(2, 2, MENU_KARAAGE)
+        board.place(2, 2, MENU_EBI_FRY)
+        assert board.row_count(2, MENU_KARAAGE) == 0
+        assert board.row_count(2, MENU_EBI_FRY) == 1
+        assert board.empty_count() == 24
+
+    def test_move_updates_counts(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.move(0, 0, 3, 4)
+        assert board.row_count(0, MENU_KARAAGE) == 0
+        assert board.col_count(0, MENU_KARAAGE) == 0
+        assert board.row_count(3, MENU_KARAAGE) == 1
+        assert board.col_count(4, MENU_KARAAGE) == 1
+        assert board.empty_count() == 24
+
+    def test_masks(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(0, 3, MENU_CHIRASHI)
+        board.place(2, 0, MENU_EBI_FRY)
+        assert board.row_mask(0) == (1 << MENU_KARAAGE) | (1 << MENU_CHIRASHI)
+        assert board.col_mask(0) == (1 << MENU_KARAAGE) | (1 << MENU_EBI_FRY)
+        assert board.row_mask(1) == 0
+
+    def test_reset_clears_counts(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.reset()
+        assert board.row_mask(0) == 0
+        assert board.col_mask(0) == 0
+        assert board.empty_count() == 25
+
+    def test_copy_keeps_counts_independent(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        copied = board.copy()
+        copied.remove(0, 0)
+        assert board.row_count(0, MENU_KARAAGE) == 1
+        assert board.empty_count() == 24
+        assert copied.row_count(0, MENU_KARAAGE) == 0
+        assert copied.empty_count() == 25
+
+    def test_bytes_round_trip(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(4, 4, MENU_CHIRASHI)
+        data = board.to_bytes()
+        assert len(data) == GRID_ROWS * GRID_COLS
+        restored = Board.from_bytes(data)
+        assert restored.grid == board.grid
+        assert restored.empty_count() == board.empty_count()
+
+
+class TestZobristHash:
+    def test_empty_board_is_zero(self):
+        assert Board().zobrist_hash == 0
+
+    def test_move_away_and_back_restores_hash(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(2, 3, MENU_CHIRASHI)
+        before = board.zobrist_hash
+        board.move(0, 0, 4, 4)
+        assert board.zobrist_hash != before
+        board.move(4, 4, 0, 0)
+        assert board.zobrist_hash == before
+
+    def test_independent_of_placement_order(self):
+        a, b = Board(), Board()
+        a.place(0, 0, MENU_KARAAGE)
+        a.place(1, 1, MENU_EBI_FRY)
+        b.place(1, 1, MENU_CURRY_RICE)
+        b.place(0, 0, MENU_KARAAGE)
+        b.place(1, 1, MENU_EBI_FRY)
+        assert a.zobrist_hash == b.zobrist_hash
+
+    def test_copy_reset_and_from_bytes(self):
+        board = Board()
+        board.place(3, 2, MENU_CURRY_UDON)
+        assert board.copy().zobrist_hash == board.zobrist_hash
+        assert Board.from_bytes(board.to_bytes()).zobrist_hash == board.zobrist_hash
+        board.reset()
+        assert board.zobrist_hash == 0
+
+    def test_reset_with_listener(self):
+        board = Board()
+        board.add_listener(lambda r, c: None)
+        board.place(1, 4, MENU_CHIRASHI)
+        board.reset()
+        assert board.zobrist_hash == 0
@@ -0,0 +1,94 @@
+"""enumerator.py の単体テスト"""
+
+import itertools
+import random
+
+import pytest
+from src.model.enumerator import (
+    board_from_columns,
+    count_solutions,
+    iter_solutions,
+    random_solution,
+    solution_at,
+)
+from src.model.rules import check_all
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_COUNT,
+    MENU_CHIRASHI,
+    FRIED_FOODS,
+    MENU_CURRY_UDON,
+    MENU_CURRY_RICE,
+    CHIRASHI_PER_ROW_MAX,
+    FRIED_PER_ROW_MAX,
+)
+
+
+def _naive_count() -> int:
+    """シグネチャ集約なしで列パターンを1つずつ積み上げる素朴な数え上げ。"""
+    curry_pair = {MENU_CURRY_UDON, MENU_CURRY_RICE}
+    patterns = [
+        p for p in itertools.permutations(range(MENU_COUNT), GRID_ROWS)
+        if all({p[r], p[r + 1]} != curry_pair for r in range(GRID_ROWS - 1))
+    ]
+    states = {((0, 0),) * GRID_ROWS: 1}
+    for _ in range(GRID_COLS):
+        nxt: dict = {}
+        for state, ways in states.items():
+            for p in patterns:
+                rows = []
+                for (chirashi, fried), m in zip(state, p):
+                    chirashi += m == MENU_CHIRASHI
+                    fried += m in FRIED_FOODS
+                    if chirashi > CHIRASHI_PER_ROW_MAX or fried > FRIED_PER_ROW_MAX:
+                        break
+                    rows.append((chirashi, fried))
+                else:
+                    key = tuple(rows)
+                    nxt[key] = nxt.get(key, 0) + ways
+        states = nxt
+    return sum(states.values())
+
+
+class TestCountSolutions:
+    def test_matches_naive_count(self):
+        assert count_solutions() == _naive_count()
+
+    def test_known_total(self):
+        assert count_solutions() == 49_274_880
+
+
+class TestIterSolutions:
+    def test_prefix_is_valid_distinct_and_ordered(self):
+        seen = set()
+        for i, columns in enumerate(itertools.islice(iter_solutions(), 3000)):
+            assert len(columns) == GRID_COLS
+            board = board_from_columns(columns)
+            assert board.is_full()
+            assert check_all(board).total_count == 0
+            key = board.to_bytes()
+            assert key not in seen
+            seen.add(key)
+            assert solution_at(i).grid == board.grid
+
+
+class TestSolutionAt:
+    def test_last_index(self):
+        board = solution_at(count_solutions() - 1)
+        assert check_all(board).total_count == 0
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            solution_at(count_solutions())
+        with pytest.raises(IndexError):
+            solution_at(-1)
+
+
+class TestRandomSolution:
+    def test_random_solutions_are_valid(self):
+        rng = random.Random(42)
+        for _ in range(200):
+            board = random_solution(rng)
+            assert board.is_full()
+            assert check_all(board).total_count == 0
@@ -0,0 +1,89 @@
+"""grid_hit_test / Palette.hit_test の単体テスト
+
+算術による判定が、矩形を一つずつ調べる従来の判定と
+画面上のすべての画素で一致することを確かめる。
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.constants import GRID_ROWS, GRID_COLS, SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+from src.model.board import Board  # noqa: E402
+from src.ui.drag_drop import DragDrop  # noqa: E402
+from src.ui.grid import cell_rect, grid_hit_test  # noqa: E402
+from src.ui.palette import Palette, MENU_ORDER  # noqa: E402
+
+
+class _StubAssets:
+    def get_font(self, size):
+        return None
+
+    def play_sound(self, key):
+        pass
+
+
+@pytest.fixture(scope="module")
+def palette():
+    pygame.font.init()
+    return Palette(_StubAssets())
+
+
+def _reference_lookup(rects):
+    """各画素が rects の何番目に含まれるか（-1 はどれにも含まれない）。"""
+    index = {}
+    for i, rect in enumerate(rects):
+        for x in range(rect.left, rect.right):
+            for y in range(rect.top, rect.bottom):
+                assert (x, y) not in index
+                index[(x, y)] = i
+    return index
+
+
+def _all_pixels():
+    margin = 3  # 画面外の座標（ウィンドウ外へのドラッグ）も含める
+    for x in range(-margin, SCREEN_WIDTH + margin):
+        for y in range(-margin, SCREEN_HEIGHT + margin):
+            yield x, y
+
+
+class TestGridHitTest:
+    def test_matches_rect_scan_on_every_pixel(self):
+        cells = [(r, c) for r in range(GRID_ROWS) for c in range(GRID_COLS)]
+        index = _reference_lookup([cell_rect(r, c) for r, c in cells])
+        for pos in _all_pixels():
+            i = index.get(pos)
+            expected = cells[i] if i is not None else None
+            assert grid_hit_test(pos) == expected, pos
+
+    def test_cell_rect_returns_copy(self):
+        rect = cell_rect(0, 0)
+        rect.move_ip(5, 5)
+        assert cell_rect(0, 0) != rect
+
+
+class TestPaletteHitTest:
+    def test_matches_rect_scan_on_every_pixel(self, palette):
+        index = _reference_lookup([palette.get_item_rect(mid) for mid in MENU_ORDER])
+        for pos in _all_pixels():
+            i = index.get(pos)
+            expected = MENU_ORDER[i] if i is not None else None
+            assert palette.hit_test(pos) == expected, pos
+
+
+class TestDropTarget:
+    def test_hover_cell_follows_drag(self, palette):
+        drag = DragDrop(_StubAssets(), Board(), palette)
+        assert drag.hover_cell is None
+
+        start = palette.get_item_rect(MENU_ORDER[0]).center
+        drag.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=start))
+        assert drag.is_dragging and drag.hover_cell is None
+
+        target = cell_rect(2, 3).center
+        drag.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=target))
+        assert drag.hover_cell == (2, 3)
+
+        drag.handle_event(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=target))
+        assert drag.hover_cell is None
+        assert drag.board.get(2, 3) == MENU_ORDER[0]
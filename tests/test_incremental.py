@@ -0,0 +1,73 @@
+"""incremental.py の単体テスト"""
+
+import random
+
+from src.model.board import Board
+from src.model.incremental import IncrementalChecker
+from src.model.rules import check_all
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_COUNT,
+    MENU_KARAAGE,
+    MENU_CURRY_UDON,
+    MENU_CURRY_RICE,
+)
+
+
+class TestIncrementalChecker:
+    def test_empty_board(self):
+        checker = IncrementalChecker(Board())
+        assert checker.result.total_count == 0
+
+    def test_initial_state_from_existing_board(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(1, 0, MENU_KARAAGE)
+        checker = IncrementalChecker(board)
+        assert checker.result == check_all(board)
+        assert checker.result.count_by_kind("duplicate") == 1
+
+    def test_follows_place_and_remove(self):
+        board = Board()
+        checker = IncrementalChecker(board)
+        board.place(0, 0, MENU_CURRY_UDON)
+        board.place(1, 0, MENU_CURRY_RICE)
+        assert checker.result.count_by_kind("curry") == 1
+        board.remove(1, 0)
+        assert checker.result.total_count == 0
+
+    def test_follows_move_and_reset(self):
+        board = Board()
+        checker = IncrementalChecker(board)
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(0, 1, MENU_KARAAGE)
+        board.move(0, 1, 1, 0)
+        assert checker.result == check_all(board)
+        board.reset()
+        assert checker.result.total_count == 0
+
+    def test_detach(self):
+        board = Board()
+        checker = IncrementalChecker(board)
+        checker.detach()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(1, 0, MENU_KARAAGE)
+        assert checker.result.total_count == 0
+
+    def test_matches_check_all_on_random_edits(self):
+        rng = random.Random(20240601)
+        board = Board()
+        checker = IncrementalChecker(board)
+        for _ in range(3000):
+            op = rng.random()
+            r, c = rng.randrange(GRID_ROWS), rng.randrange(GRID_COLS)
+            if op < 0.6:
+                board.place(r, c, rng.randrange(MENU_COUNT))
+            elif op < 0.8:
+                board.remove(r, c)
+            elif op < 0.98:
+                board.move(r, c, rng.randrange(GRID_ROWS), rng.randrange(GRID_COLS))
+            else:
+                board.reset()
+            assert checker.result == check_all(board)
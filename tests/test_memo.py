@@ -0,0 +1,74 @@
+"""memo.py と check_all / calculate_score のメモの単体テスト"""
+
+from src.model.board import Board
+from src.model.memo import BoardMemo
+from src.model.rules import check_all, check_all_memo_stats, clear_check_all_memo
+from src.model.scoring import calculate_score, clear_score_memo, score_memo_stats
+from src.constants import MENU_KARAAGE, MENU_CHIRASHI
+
+
+class TestBoardMemo:
+    def test_hit_after_move_back(self):
+        memo = BoardMemo(4)
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        calls = []
+        assert memo.get_or_compute(board, lambda: calls.append(1) or "a") == "a"
+        board.move(0, 0, 1, 1)
+        memo.get_or_compute(board, lambda: calls.append(1) or "b")
+        board.move(1, 1, 0, 0)
+        assert memo.get_or_compute(board, lambda: calls.append(1) or "c") == "a"
+        assert len(calls) == 2
+        assert memo.stats() == {"hits": 1, "misses": 2, "size": 2, "hit_rate": 1 / 3}
+
+    def test_extra_key(self):
+        memo = BoardMemo(4)
+        board = Board()
+        assert memo.get_or_compute(board, lambda: 1, 30) == 1
+        assert memo.get_or_compute(board, lambda: 2, 60) == 2
+        assert memo.get_or_compute(board, lambda: 3, 30) == 1
+
+    def test_lru_eviction(self):
+        memo = BoardMemo(2)
+        boards = [Board() for _ in range(3)]
+        for i, board in enumerate(boards):
+            board.place(0, 0, i)
+        memo.get_or_compute(boards[0], lambda: 0)
+        memo.get_or_compute(boards[1], lambda: 1)
+        memo.get_or_compute(boards[0], lambda: -1)  # boards[0] を最新に
+        memo.get_or_compute(boards[2], lambda: 2)   # boards[1] が追い出される
+        assert len(memo) == 2
+        assert memo.get_or_compute(boards[0], lambda: -1) == 0
+        assert memo.get_or_compute(boards[1], lambda: -1) == -1
+
+    def test_hash_collision_is_a_miss(self, monkeypatch):
+        memo = BoardMemo(4)
+        a, b = Board(), Board()
+        b.place(0, 0, MENU_KARAAGE)
+        monkeypatch.setattr(Board, "zobrist_hash", property(lambda self: 42))
+        assert memo.get_or_compute(a, lambda: "a") == "a"
+        assert memo.get_or_compute(b, lambda: "b") == "b"
+
+    def test_empty_hit_rate(self):
+        assert BoardMemo(1).hit_rate == 0.0
+
+
+class TestModuleMemos:
+    def test_check_all_counts_hits(self):
+        clear_check_all_memo()
+        board = Board()
+        board.place(0, 0, MENU_CHIRASHI)
+        board.place(0, 1, MENU_CHIRASHI)
+        first = check_all(board)
+        assert check_all(board) is first
+        stats = check_all_memo_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_score_keyed_on_time_and_completion(self):
+        clear_score_memo()
+        board = Board()
+        a = calculate_score(board, 130, True)
+        b = calculate_score(board, 130, False)
+        assert a.bonus != b.bonus
+        assert calculate_score(board, 130, True) is a
+        assert score_memo_stats()["hits"] == 1
@@ -0,0 +1,97 @@
+"""profiler.py の単体テスト"""
+
+import csv
+import json
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from src.profiler import FrameProfiler, FRAME_SECTION, percentile  # noqa: E402
+
+
+class _Target:
+    def __init__(self):
+        self.calls = 0
+
+    def step(self, value):
+        self.calls += 1
+        return value * 2
+
+
+def _run_frames(profiler, count):
+    for _ in range(count):
+        profiler.begin_frame()
+        with profiler.section("update"):
+            pass
+        profiler.end_frame()
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+
+    def test_empty(self):
+        assert percentile([], 50) == 0.0
+
+
+class TestFrameProfiler:
+    def test_disabled_records_nothing(self):
+        profiler = FrameProfiler(enabled=False)
+        _run_frames(profiler, 3)
+        assert profiler.frame_count == 0
+        assert profiler.summary() == {}
+
+    def test_sections_and_frame_total(self):
+        profiler = FrameProfiler(enabled=True)
+        _run_frames(profiler, 5)
+        summary = profiler.summary()
+        assert profiler.frame_count == 5
+        assert set(summary) == {"update", FRAME_SECTION}
+        assert set(summary["update"]) == {"p50", "p95", "p99"}
+
+    def test_instrument_wraps_method(self):
+        profiler = FrameProfiler(enabled=True)
+        target = _Target()
+        profiler.instrument(target, ["step"], "target")
+        profiler.begin_frame()
+        assert target.step(3) == 6
+        target.step(1)
+        profiler.end_frame()
+        assert target.calls == 2
+        assert "target.step" in profiler.summary()
+
+    def test_toggle_mid_frame_discards_frame(self):
+        profiler = FrameProfiler(enabled=True)
+        profiler.begin_frame()
+        profiler.toggle()
+        profiler.end_frame()
+        assert profiler.frame_count == 0
+
+    def test_window_bounds_summary(self):
+        profiler = FrameProfiler(enabled=True, window=2, trace_max=3)
+        _run_frames(profiler, 5)
+        assert profiler.frame_count == 3
+
+    def test_dump_csv(self, tmp_path):
+        profiler = FrameProfiler(enabled=True)
+        _run_frames(profiler, 4)
+        path = tmp_path / "trace.csv"
+        profiler.dump(str(path))
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 4
+        assert set(rows[0]) == {"index", "update", FRAME_SECTION}
+
+    def test_dump_json(self, tmp_path):
+        profiler = FrameProfiler(enabled=True)
+        _run_frames(profiler, 4)
+        path = tmp_path / "trace.json"
+        profiler.dump(str(path))
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["sections"] == ["update", FRAME_SECTION]
+        assert len(data["frames"]) == 4
+        assert "p99" in data["summary"][FRAME_SECTION]
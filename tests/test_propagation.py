@@ -0,0 +1,190 @@
+"""propagation.py の単体テスト"""
+
+import itertools
+import random
+
+from src.model.board import Board
+from src.model.enumerator import COLUMN_PATTERNS, random_solution
+from src.model.propagation import CandidateTracker, _propagate_uncached, nearest_completion, propagate
+from src.model.rules import check_all
+from src.constants import (
+    GRID_ROWS,
+    GRID_COLS,
+    MENU_COUNT,
+    MENU_KARAAGE,
+    MENU_EBI_FRY,
+    MENU_CURRY_UDON,
+    MENU_CURRY_RICE,
+    MENU_CHIRASHI,
+    FRIED_FOODS,
+)
+
+
+def _board(cells):
+    board = Board()
+    for (r, c), menu_id in cells.items():
+        board.place(r, c, menu_id)
+    return board
+
+
+def _brute_force_completable(board):
+    """列ごとに並びを総当たりして、違反なしで完成できるかを調べる（小さな入力用）。"""
+    empties = [(r, c) for r in range(GRID_ROWS) for c in range(GRID_COLS) if board.get(r, c) is None]
+    for values in itertools.product(range(MENU_COUNT), repeat=len(empties)):
+        trial = board.copy()
+        for (r, c), m in zip(empties, values):
+            trial.place(r, c, m)
+        if check_all(trial).total_count == 0:
+            return True
+    return False
+
+
+def _reference_min_changes(board):
+    """行ごとの (ちらし寿司の数, 揚げ物の数) を状態に、列ごとに並びを選ぶ素朴な DP。"""
+    best = {(0,) * (GRID_ROWS * 2): 0}
+    for c in range(GRID_COLS):
+        nxt = {}
+        for state, cost in best.items():
+            for pattern in COLUMN_PATTERNS:
+                counts = list(state)
+                for r, m in enumerate(pattern):
+                    counts[2 * r] += m == MENU_CHIRASHI
+                    counts[2 * r + 1] += m in FRIED_FOODS
+                if any(counts[2 * r] > 1 or counts[2 * r + 1] > 3 for r in range(GRID_ROWS)):
+                    continue
+                placed = [board.get(r, c) for r in range(GRID_ROWS)]
+                extra = sum(1 for v, m in zip(placed, pattern) if v is not None and v != m)
+                key = tuple(counts)
+                if cost + extra < nxt.get(key, 1 << 30):
+                    nxt[key] = cost + extra
+        best = nxt
+    return min(best.values())
+
+
+class TestPropagate:
+    def test_empty_board_allows_everything(self):
+        result = propagate(Board())
+        assert result.feasible
+        assert all(mask == (1 << MENU_COUNT) - 1 for mask in result.domains)
+
+    def test_fixed_cells_keep_their_menu(self):
+        board = _board({(0, 0): MENU_CHIRASHI, (3, 2): MENU_CURRY_UDON})
+        result = propagate(board)
+        assert result.candidates(0, 0) == [MENU_CHIRASHI]
+        assert result.candidates(3, 2) == [MENU_CURRY_UDON]
+        # 同じ列に重複なし、同じ行にちらし寿司は1つ、カレーは連続しない
+        assert MENU_CHIRASHI not in result.candidates(1, 0)
+        assert MENU_CHIRASHI not in result.candidates(0, 4)
+        assert MENU_CURRY_RICE not in result.candidates(2, 2)
+        assert MENU_CURRY_RICE not in result.candidates(4, 2)
+
+    def test_existing_violation_is_infeasible(self):
+        board = _board({(0, 0): MENU_KARAAGE, (4, 0): MENU_KARAAGE})
+        result = propagate(board)
+        assert not result.feasible
+        assert not any(result.domains)
+
+    def test_hidden_infeasibility(self):
+        # 違反はまだないが、3列のちらし寿司が行 0・1 の2行にしか置けない
+        cells = {}
+        for c in range(3):
+            for r in range(2, GRID_ROWS):
+                cells[(r, c)] = [MENU_KARAAGE, MENU_EBI_FRY, MENU_CURRY_UDON][r - 2]
+        board = _board(cells)
+        assert check_all(board).total_count == 0
+        assert not propagate(board).feasible
+
+    def test_candidates_match_brute_force_on_nearly_full_boards(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            board = random_solution(rng)
+            cells = rng.sample([(r, c) for r in range(GRID_ROWS) for c in range(GRID_COLS)], 4)
+            for r, c in cells:
+                board.remove(r, c)
+            # 半分は1マス書き換えて、完成できないかもしれない盤面にする
+            if rng.random() < 0.5:
+                r, c = rng.randrange(GRID_ROWS), rng.randrange(GRID_COLS)
+                board.place(r, c, rng.randrange(MENU_COUNT))
+            result = _propagate_uncached(board)
+            assert result.feasible == _brute_force_completable(board)
+            if not result.feasible:
+                continue
+            for r, c in cells:
+                if board.get(r, c) is not None:
+                    continue
+                for m in range(MENU_COUNT):
+                    trial = board.copy()
+                    trial.place(r, c, m)
+                    expected = _brute_force_completable(trial)
+                    assert (m in result.candidates(r, c)) == expected, (r, c, m)
+
+    def test_subsets_of_solutions_stay_feasible(self):
+        rng = random.Random(9)
+        for _ in range(200):
+            solution = random_solution(rng)
+            board = Board()
+            for r in range(GRID_ROWS):
+                for c in range(GRID_COLS):
+                    if rng.random() < 0.4:
+                        board.place(r, c, solution.get(r, c))
+            result = _propagate_uncached(board)
+            assert result.feasible
+            for r in range(GRID_ROWS):
+                for c in range(GRID_COLS):
+                    assert solution.get(r, c) in result.candidates(r, c)
+
+
+class TestNearestCompletion:
+    def test_matches_reference_min_changes(self):
+        rng = random.Random(13)
+        for _ in range(12):
+            board = Board()
+            for r in range(GRID_ROWS):
+                for c in range(GRID_COLS):
+                    if rng.random() < 0.7:
+                        board.place(r, c, rng.randrange(MENU_COUNT))
+            target, changes = nearest_completion(board)
+            assert target.is_full()
+            assert check_all(target).total_count == 0
+            rewritten = sum(
+                1
+                for r in range(GRID_ROWS)
+                for c in range(GRID_COLS)
+                if board.get(r, c) is not None and board.get(r, c) != target.get(r, c)
+            )
+            assert rewritten == changes
+            assert changes == _reference_min_changes(board)
+
+    def test_completable_board_needs_no_changes(self):
+        rng = random.Random(21)
+        for _ in range(50):
+            board = random_solution(rng)
+            for r, c in rng.sample([(r, c) for r in range(GRID_ROWS) for c in range(GRID_COLS)], 15):
+                board.remove(r, c)
+            target, changes = nearest_completion(board)
+            assert changes == 0
+            assert all(
+                target.get(r, c) == board.get(r, c)
+                for r in range(GRID_ROWS)
+                for c in range(GRID_COLS)
+                if board.get(r, c) is not None
+            )
+
+    def test_expired_deadline_returns_none(self):
+        board = _board({(0, 0): MENU_KARAAGE, (1, 0): MENU_KARAAGE})
+        assert nearest_completion(board, deadline=0.0) is None
+
+
+class TestCandidateTracker:
+    def test_follows_board_changes(self):
+        board = Board()
+        tracker = CandidateTracker(board)
+        assert tracker.result.feasible
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(1, 0, MENU_KARAAGE)
+        assert not tracker.result.feasible
+        board.remove(1, 0)
+        assert tracker.result.feasible
+        tracker.detach()
+        board.place(1, 0, MENU_KARAAGE)
+        assert tracker.result.feasible  # 購読解除後は更新されない
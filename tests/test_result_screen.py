@@ -0,0 +1,41 @@
+"""result_screen.py の単体テスト"""
+
+import os
+from concurrent.futures import Future
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.asset_manager import AssetManager  # noqa: E402
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+from src.model.board import Board  # noqa: E402
+from src.model.rules import check_all  # noqa: E402
+from src.model.scoring import calculate_score  # noqa: E402
+from src.ui.result_screen import ResultScreen, _ANSWER_POLL_MS  # noqa: E402
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def screen():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return ResultScreen(AssetManager(base_path=_REPO_ROOT))
+
+
+class TestAnswerFuture:
+    def test_failed_generation_falls_back_to_exact_answer(self, screen):
+        future: Future[Board] = Future()
+        future.set_exception(RuntimeError("solver failed"))
+        player = Board()
+        screen.set_result(player, None, calculate_score(player, 0, False), answer_future=future)
+
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        assert screen.draw(surface)  # 例外を投げずに描画できる
+        answer = screen._answer_board
+        assert answer is not None and answer.is_full()
+        assert check_all(answer).total_count == 0
+        assert screen.idle_wait_ms() != _ANSWER_POLL_MS  # 生成待ちのポーリングも終わる
@@ -1,5 +1,7 @@
 """rules.py の単体テスト"""
 
+import random
+
 import pytest
 from src.model.board import Board
 from src.model.rules import (
@@ -153,3 +155,120 @@ class TestCheckAll:
         result = check_all(board)
         # 完全に正しい配置かはチェック次第だが、重複なしは確実
         assert result.count_by_kind("duplicate") == 0
+
+
+def _scan_all(board):
+    """表を使わない、各制約チェックの連結。"""
+    return (check_block_duplicates(board) + check_chirashi_limit(board)
+            + check_fried_limit(board) + check_curry_consecutive(board))
+
+
+class TestLineTables:
+    def test_every_line_matches_scan(self):
+        # 全 7776 通りの並びを 1 行・1 列に置き、違反が一致するか（セルの帰属も含む）
+        import itertools
+
+        values = (None, 0, 1, 2, 3, 4)
+        for line in itertools.product(values, repeat=5):
+            for place in (lambda b, i, v: b.place(2, i, v), lambda b, i, v: b.place(i, 3, v)):
+                board = Board()
+                for i, v in enumerate(line):
+                    if v is not None:
+                        place(board, i, v)
+                assert check_all(board).violations == _scan_all(board), line
+
+    def test_random_boards_match_scan(self):
+        rng = random.Random(11)
+        for _ in range(300):
+            board = Board()
+            for r in range(5):
+                for c in range(5):
+                    if rng.random() < 0.8:
+                        board.place(r, c, rng.randrange(5))
+            assert check_all(board).violations == _scan_all(board)
+
+    def test_fried_excess_attributed_to_rightmost(self):
+        board = Board()
+        for c in range(5):
+            board.place(0, c, MENU_KARAAGE if c % 2 else MENU_EBI_FRY)
+        fried = check_all(board).by_kind("fried")
+        assert len(fried) == 1
+        assert fried[0].count == 2
+        assert fried[0].cells == [(0, 3), (0, 4)]
+
+
+class TestCheckAllBatch:
+    def test_matches_check_all_on_random_boards(self):
+        np = pytest.importorskip("numpy")
+        from src.model.rules import VIOLATION_KINDS, boards_to_array, check_all_batch
+
+        rng = random.Random(7)
+        boards = []
+        for _ in range(500):
+            board = Board()
+            for r in range(5):
+                for c in range(5):
+                    if rng.random() < 0.8:
+                        board.place(r, c, rng.randrange(5))
+            boards.append(board)
+        counts = check_all_batch(boards_to_array(boards))
+        for i, board in enumerate(boards):
+            expected = check_all(board)
+            for kind in VIOLATION_KINDS:
+                assert counts[kind][i] == expected.count_by_kind(kind)
+
+    def test_empty_sentinel(self):
+        np = pytest.importorskip("numpy")
+        from src.model.rules import BATCH_EMPTY, boards_to_array, check_all_batch
+
+        arr = boards_to_array([Board()])
+        assert arr.shape == (1, 5, 5)
+        assert (arr == BATCH_EMPTY).all()
+        counts = check_all_batch(arr)
+        assert all(v[0] == 0 for v in counts.values())
+
+    def test_rejects_bad_shape(self):
+        np = pytest.importorskip("numpy")
+        from src.model.rules import check_all_batch
+
+        with pytest.raises(ValueError):
+            check_all_batch(np.zeros((2, 4, 5), dtype=np.int8))
+
+
+class TestViolationTypes:
+    def test_mask_roundtrip(self):
+        from src.model.rules import cells_to_mask, mask_to_cells
+
+        cells = [(0, 0), (1, 4), (2, 2), (4, 4)]
+        mask = cells_to_mask(cells)
+        assert mask.bit_length() <= 25
+        assert mask_to_cells(mask) == cells
+
+    def test_cells_view(self):
+        from src.model.rules import Violation, cell_bit
+
+        v = Violation("curry", cell_bit(1, 2) | cell_bit(2, 2))
+        assert v.cells == [(1, 2), (2, 2)]
+        assert not hasattr(v, "__dict__")
+
+    def test_result_counts_and_cells(self):
+        board = Board()
+        board.place(0, 0, MENU_CHIRASHI)
+        board.place(0, 1, MENU_CHIRASHI)
+        board.place(1, 0, MENU_CHIRASHI)
+        board.place(2, 1, MENU_CURRY_UDON)
+        board.place(3, 1, MENU_CURRY_RICE)
+        result = check_all(board)
+        assert result.kind_counts == [1, 1, 0, 1]
+        assert result.total_count == 3
+        assert result.all_violation_cells() == {(0, 0), (1, 0), (0, 1), (2, 1), (3, 1)}
+
+    def test_counts_filled_from_violations(self):
+        from src.model.rules import ViolationResult
+
+        board = Board()
+        board.place(0, 2, MENU_KARAAGE)
+        board.place(4, 2, MENU_KARAAGE)
+        rebuilt = ViolationResult(violations=list(check_all(board).violations))
+        assert rebuilt == check_all(board)
+        assert rebuilt.count_by_kind("duplicate") == 1
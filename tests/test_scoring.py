@@ -1,5 +1,7 @@
 """scoring.py の単体テスト"""
 
+import random
+
 import pytest
 from src.model.board import Board
 from src.model.scoring import calculate_score
@@ -116,3 +118,42 @@ class TestScoring:
         board = Board()
         result = calculate_score(board, remaining_seconds=0, completed_by_button=False)
         assert len(result.comment) > 0
+
+
+class TestScoringBatch:
+    def test_matches_calculate_score(self):
+        np = pytest.importorskip("numpy")
+        from src.model.rules import boards_to_array
+        from src.model.scoring import calculate_score_batch
+
+        rng = random.Random(11)
+        boards = []
+        remaining = []
+        completed = []
+        for _ in range(500):
+            board = Board()
+            fill = rng.random()
+            for r in range(5):
+                for c in range(5):
+                    if rng.random() < fill:
+                        board.place(r, c, rng.randrange(5))
+            boards.append(board)
+            remaining.append(rng.randrange(181))
+            completed.append(rng.random() < 0.5)
+        scores = calculate_score_batch(
+            boards_to_array(boards),
+            remaining_seconds=np.array(remaining),
+            completed_by_button=np.array(completed),
+        )
+        for i, board in enumerate(boards):
+            expected = calculate_score(board, remaining[i], completed[i])
+            assert scores[i] == expected.score
+
+    def test_scalar_bonus_arguments(self):
+        np = pytest.importorskip("numpy")
+        from src.model.rules import boards_to_array
+        from src.model.scoring import calculate_score_batch
+
+        board = Board()
+        scores = calculate_score_batch(boards_to_array([board]), 150, True)
+        assert scores[0] == calculate_score(board, 150, True).score
@@ -0,0 +1,75 @@
+"""solution_pool.py の単体テスト"""
+
+import random
+
+import pytest
+from src.model.board import Board
+from src.model.rules import check_all
+from src.model.solver import _fallback_board, _get_solution_pool
+from src.model.solution_pool import (
+    SolutionPool,
+    build_pool,
+    decode_board,
+    encode_board,
+    sample_solutions,
+)
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        board = _fallback_board()
+        code = encode_board(board)
+        assert code < 2 ** 64
+        assert decode_board(code).grid == board.grid
+
+    def test_empty_cell_rejected(self):
+        with pytest.raises(ValueError):
+            encode_board(Board())
+
+
+class TestSampleSolutions:
+    def test_samples_are_valid_and_distinct(self):
+        codes = sample_solutions(200, random.Random(3))
+        assert len(set(codes)) == 200
+        for code in codes:
+            board = decode_board(code)
+            assert board.is_full()
+            assert check_all(board).total_count == 0
+
+
+class TestSolutionPool:
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "pool.bin")
+        built = build_pool(50, path, random.Random(5))
+        loaded = SolutionPool.load(path)
+        assert len(loaded) == 50
+        for i in range(50):
+            assert loaded.code_at(i) == built.code_at(i)
+
+    def test_sample_returns_pool_entry(self, tmp_path):
+        path = str(tmp_path / "pool.bin")
+        build_pool(20, path, random.Random(9))
+        pool = SolutionPool.load(path)
+        codes = {pool.code_at(i) for i in range(len(pool))}
+        rng = random.Random(1)
+        for _ in range(50):
+            assert encode_board(pool.sample(rng)) in codes
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "broken.bin"
+        path.write_bytes(b"not a pool")
+        with pytest.raises(ValueError):
+            SolutionPool.load(str(path))
+
+    def test_empty_pool_sample(self):
+        with pytest.raises(ValueError):
+            SolutionPool().sample()
+
+    def test_bundled_pool_is_valid(self):
+        pool = _get_solution_pool()
+        if pool is None:
+            pytest.skip("solution pool not bundled")
+        for i in range(0, len(pool), max(1, len(pool) // 100)):
+            board = pool.board_at(i)
+            assert board.is_full()
+            assert check_all(board).total_count == 0
@@ -2,8 +2,18 @@
 
 import pytest
 from src.model.board import Board
-from src.model.solver import generate_solution, _fallback_board, _solve_with_cpsat
-from src.model.rules import check_all
+from src.model.solver import (
+    generate_solution,
+    generate_solution_async,
+    _fallback_board,
+    _solve_with_cpsat,
+    _get_cpsat_model,
+    suggest_hint,
+    _violation_cells,
+)
+from src.model.propagation import propagate
+from src.model.enumerator import random_solution
+from src.model.rules import check_all, line_tables
 from src.constants import (
     GRID_ROWS,
     GRID_COLS,
@@ -14,6 +24,7 @@ from src.constants import (
     MENU_CURRY_RICE,
     CHIRASHI_PER_ROW_MAX,
     FRIED_PER_ROW_MAX,
+    MENU_KARAAGE,
 )
 
 
@@ -93,6 +104,19 @@ class TestCPSATSolver:
             col_vals = {board.get(r, c) for r in range(GRID_ROWS)}
             assert len(col_vals) == GRID_ROWS
 
+    def test_cpsat_model_is_reused(self):
+        model = _get_cpsat_model()
+        if model is None:
+            pytest.skip("ortools not available")
+        assert _get_cpsat_model() is model
+
+    def test_cpsat_repeated_solves_are_valid(self):
+        for _ in range(3):
+            board = _solve_with_cpsat(timeout_seconds=10.0)
+            if board is None:
+                pytest.skip("ortools not available")
+            _validate_board(board)
+
 
 class TestGenerateSolution:
     def test_returns_valid_board(self):
@@ -107,3 +131,102 @@ class TestGenerateSolution:
         board = generate_solution(timeout_seconds=10.0)
         result = check_all(board)
         assert result.total_count == 0
+
+
+class TestGenerateSolutionAsync:
+    def test_future_resolves_to_valid_board(self):
+        future = generate_solution_async(timeout_seconds=10.0)
+        board = future.result(timeout=30.0)
+        _validate_board(board)
+
+    def test_multiple_requests(self):
+        futures = [generate_solution_async(timeout_seconds=10.0) for _ in range(3)]
+        for future in futures:
+            _validate_board(future.result(timeout=30.0))
+
+
+class TestGenerateSolutionMethods:
+    @pytest.mark.parametrize("method", ["auto", "pool", "exact"])
+    def test_ortools_free_methods(self, method):
+        _validate_board(generate_solution(method=method))
+
+    def test_cpsat_method(self):
+        _validate_board(generate_solution(timeout_seconds=10.0, method="cpsat"))
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            generate_solution(method="unknown")
+
+
+class TestSuggestHint:
+    def test_solved_board_has_no_hint(self):
+        assert suggest_hint(_fallback_board()) is None
+
+    def test_hint_keeps_board_completable(self):
+        import random
+
+        rng = random.Random(4)
+        for _ in range(30):
+            board = random_solution(rng)
+            for r, c in rng.sample([(r, c) for r in range(GRID_ROWS) for c in range(GRID_COLS)], 12):
+                board.remove(r, c)
+            hint = suggest_hint(board, budget_ms=float("inf"))
+            assert hint.exact and not hint.replaces and hint.changes == 0
+            assert board.get(hint.row, hint.col) is None
+            board.place(hint.row, hint.col, hint.menu_id)
+            assert propagate(board).feasible
+
+    def test_rewrites_violating_cell_first(self):
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(1, 0, MENU_KARAAGE)
+        hint = suggest_hint(board, budget_ms=float("inf"))
+        assert hint.replaces and hint.changes == 1
+        assert (hint.row, hint.col) in ((0, 0), (1, 0))
+        assert hint.menu_id != MENU_KARAAGE
+
+    def test_following_hints_completes_board(self):
+        board = Board()
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                board.place(r, c, MENU_KARAAGE)
+        for _ in range(GRID_ROWS * GRID_COLS):
+            hint = suggest_hint(board, budget_ms=float("inf"))
+            if hint is None:
+                break
+            board.place(hint.row, hint.col, hint.menu_id)
+        _validate_board(board)
+
+    def test_expired_budget_falls_back_to_closest_answer(self):
+        answer = _fallback_board()
+        board = answer.copy()
+        board.remove(2, 2)
+        board.place(0, 0, answer.get(1, 0))  # 違反を1つ入れる
+        hint = suggest_hint(board, budget_ms=0, fallback=answer)
+        assert not hint.exact
+        assert hint.changes == 1 and hint.replaces
+        assert (hint.row, hint.col, hint.menu_id) == (0, 0, answer.get(0, 0))
+
+    def test_does_not_build_line_tables(self):
+        # 違反表の初回構築（数十 ms）はヒントの時間予算に含めない
+        board = Board()
+        board.place(0, 0, MENU_KARAAGE)
+        board.place(1, 0, MENU_KARAAGE)
+        line_tables.cache_clear()
+        try:
+            assert suggest_hint(board).replaces
+            assert line_tables.cache_info().currsize == 0
+        finally:
+            line_tables()
+
+    def test_violation_cells_match_check_all(self):
+        import random
+
+        rng = random.Random(8)
+        for _ in range(100):
+            board = Board()
+            for r in range(GRID_ROWS):
+                for c in range(GRID_COLS):
+                    if rng.random() < 0.7:
+                        board.place(r, c, rng.randrange(MENU_COUNT))
+            assert _violation_cells(board) == check_all(board).cell_mask
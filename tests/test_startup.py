@@ -0,0 +1,80 @@
+"""起動時インポートの予算テスト
+
+python -X importtime で main を読み込み、重い依存が起動経路に
+入っていないことを確認する。
+
+インポート時間の予算チェックは実行環境の負荷で揺れるため、環境変数
+MENU_CALENDAR_IMPORT_BUDGET_MS に予算（ミリ秒）を指定したときだけ行う。
+時間は pygame 本体の読み込みを除いた分で測る（この環境で約 20ms、
+numpy が起動経路に戻ると約 90ms 増える）。例:
+
+    MENU_CALENDAR_IMPORT_BUDGET_MS=50 python -m pytest tests/test_startup.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main の累積インポート時間（pygame を除く）の上限（ミリ秒）。未指定なら予算チェックは行わない
+_IMPORT_BUDGET_ENV = "MENU_CALENDAR_IMPORT_BUDGET_MS"
+
+# 起動経路で読み込んではならないモジュール
+_DEFERRED_MODULES = ("ortools", "numpy", "src.model.solver", "src.ui.play_screen")
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """code を -X importtime 付きで実行し、モジュール名→累積時間(µs) を返す。"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[1])
+    return times
+
+
+@pytest.fixture(scope="module")
+def main_import_times():
+    pytest.importorskip("pygame")
+    return _import_times("import main")
+
+
+class TestStartupImports:
+    @pytest.mark.parametrize("module", _DEFERRED_MODULES)
+    def test_heavy_modules_deferred(self, main_import_times, module):
+        loaded = [
+            name for name in main_import_times
+            if name == module or name.startswith(module + ".")
+        ]
+        assert loaded == []
+
+    @pytest.mark.skipif(
+        _IMPORT_BUDGET_ENV not in os.environ, reason=f"set {_IMPORT_BUDGET_ENV} to check the budget"
+    )
+    def test_import_budget(self, main_import_times):
+        budget_ms = float(os.environ[_IMPORT_BUDGET_ENV])
+        elapsed_ms = (main_import_times["main"] - main_import_times["pygame"]) / 1000
+        assert elapsed_ms <= budget_ms, (
+            f"import main took {elapsed_ms:.1f} ms (budget {budget_ms:.0f} ms)"
+        )
+
+    def test_default_solution_does_not_load_ortools(self):
+        times = _import_times(
+            "from src.model.solver import generate_solution; generate_solution()"
+        )
+        assert not any(name.startswith("ortools") for name in times)
@@ -0,0 +1,38 @@
+"""timer.py の単体テスト"""
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from src.ui.timer import Timer  # noqa: E402
+from src.constants import TIMER_SECONDS  # noqa: E402
+
+
+class _FontOnlyAssets:
+    def get_font(self, size):
+        return None
+
+
+class TestMsUntilChange:
+    def test_stopped_timer_never_changes(self):
+        timer = Timer(_FontOnlyAssets())
+        assert timer.ms_until_change() is None
+
+    def test_just_started_changes_immediately(self):
+        timer = Timer(_FontOnlyAssets())
+        timer.start()
+        assert timer.ms_until_change() == 1
+
+    def test_waits_until_next_second(self):
+        timer = Timer(_FontOnlyAssets())
+        timer.start()
+        timer.update(250)
+        assert timer.ms_until_change() == 750
+        timer.update(750)
+        assert timer.remaining_int == TIMER_SECONDS - 1
+
+    def test_expired_timer_never_changes(self):
+        timer = Timer(_FontOnlyAssets())
+        timer.start()
+        timer.update(TIMER_SECONDS * 1000)
+        assert timer.ms_until_change() is None